@@ -0,0 +1,72 @@
+"""Add normalized genres and movie_genres tables
+
+Revision ID: 3b8e1f2a9c4d
+Revises:
+Create Date: 2026-10-16 09:12:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b8e1f2a9c4d'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _backfill_movie_genres(bind) -> None:
+    """Split the pipe-separated movies.genres column into the new tables"""
+    rows = bind.execute(sa.text("SELECT movieId, genres FROM movies")).fetchall()
+
+    genre_ids = {}
+    links = []
+    for movie_id, genres in rows:
+        names = [g.strip() for g in (genres or "").split('|') if g.strip()]
+        for position, name in enumerate(names):
+            key = name.lower()
+            if key not in genre_ids:
+                result = bind.execute(
+                    sa.text("INSERT INTO genres (name, normalized_name) VALUES (:name, :key)"),
+                    {"name": name, "key": key}
+                )
+                genre_ids[key] = result.lastrowid
+            links.append({"movie_id": int(movie_id), "genre_id": genre_ids[key], "position": position})
+
+    if links:
+        bind.execute(
+            sa.text(
+                "INSERT OR IGNORE INTO movie_genres (movie_id, genre_id, position) "
+                "VALUES (:movie_id, :genre_id, :position)"
+            ),
+            links
+        )
+
+
+def upgrade() -> None:
+    op.create_table('genres',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('normalized_name', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_genres_normalized_name'), 'genres', ['normalized_name'], unique=True)
+    op.create_table('movie_genres',
+    sa.Column('movie_id', sa.Integer(), nullable=False),
+    sa.Column('genre_id', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['genre_id'], ['genres.id'], ),
+    sa.ForeignKeyConstraint(['movie_id'], ['movies.movieId'], ),
+    sa.PrimaryKeyConstraint('movie_id', 'genre_id')
+    )
+    op.create_index('ix_movie_genres_genre_movie', 'movie_genres', ['genre_id', 'movie_id'], unique=False)
+
+    _backfill_movie_genres(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movie_genres_genre_movie', table_name='movie_genres')
+    op.drop_table('movie_genres')
+    op.drop_index(op.f('ix_genres_normalized_name'), table_name='genres')
+    op.drop_table('genres')
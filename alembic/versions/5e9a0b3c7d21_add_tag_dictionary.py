@@ -0,0 +1,75 @@
+"""Add case-folded tag_dictionary and movie_tag_counts tables
+
+Revision ID: 5e9a0b3c7d21
+Revises: c41f7a9e2b63
+Create Date: 2026-10-16 16:22:50.774019
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e9a0b3c7d21'
+down_revision = 'c41f7a9e2b63'
+branch_labels = None
+depends_on = None
+
+
+def _backfill_movie_tags(bind) -> None:
+    """Count tag applications from the pipe-separated movies.tags column"""
+    rows = bind.execute(sa.text("SELECT movieId, tags FROM movies")).fetchall()
+
+    tag_ids = {}
+    counts = {}
+    for movie_id, tags in rows:
+        for name in [t.strip() for t in (tags or "").split('|') if t.strip()]:
+            key = name.casefold()
+            if key not in tag_ids:
+                result = bind.execute(
+                    sa.text("INSERT INTO tag_dictionary (name, normalized_name) VALUES (:name, :key)"),
+                    {"name": name, "key": key}
+                )
+                tag_ids[key] = result.lastrowid
+            link = (int(movie_id), tag_ids[key])
+            counts[link] = counts.get(link, 0) + 1
+
+    if counts:
+        bind.execute(
+            sa.text(
+                "INSERT INTO movie_tag_counts (movie_id, tag_id, tag_count) "
+                "VALUES (:movie_id, :tag_id, :tag_count)"
+            ),
+            [
+                {"movie_id": movie_id, "tag_id": tag_id, "tag_count": count}
+                for (movie_id, tag_id), count in counts.items()
+            ]
+        )
+
+
+def upgrade() -> None:
+    op.create_table('tag_dictionary',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('normalized_name', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_tag_dictionary_normalized_name'), 'tag_dictionary', ['normalized_name'], unique=True)
+    op.create_table('movie_tag_counts',
+    sa.Column('movie_id', sa.Integer(), nullable=False),
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.Column('tag_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['movie_id'], ['movies.movieId'], ),
+    sa.ForeignKeyConstraint(['tag_id'], ['tag_dictionary.id'], ),
+    sa.PrimaryKeyConstraint('movie_id', 'tag_id')
+    )
+    op.create_index('ix_movie_tag_counts_tag_count_movie', 'movie_tag_counts', ['tag_id', 'tag_count', 'movie_id'], unique=False)
+
+    _backfill_movie_tags(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movie_tag_counts_tag_count_movie', table_name='movie_tag_counts')
+    op.drop_table('movie_tag_counts')
+    op.drop_index(op.f('ix_tag_dictionary_normalized_name'), table_name='tag_dictionary')
+    op.drop_table('tag_dictionary')
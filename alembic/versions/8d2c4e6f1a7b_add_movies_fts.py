@@ -0,0 +1,52 @@
+"""Add movies_fts full-text index over title and tags
+
+Revision ID: 8d2c4e6f1a7b
+Revises: 3b8e1f2a9c4d
+Create Date: 2026-10-16 11:40:02.551930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2c4e6f1a7b'
+down_revision = '3b8e1f2a9c4d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE VIRTUAL TABLE movies_fts USING fts5(
+            title, tags, tokenize = 'unicode61 remove_diacritics 2'
+        )
+    """)
+    op.execute("INSERT INTO movies_fts(movies_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)')")
+    op.execute("""
+        CREATE TRIGGER movies_fts_ai AFTER INSERT ON movies BEGIN
+            INSERT INTO movies_fts(rowid, title, tags) VALUES (CAST(new.movieId AS INTEGER), new.title, new.tags);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER movies_fts_ad AFTER DELETE ON movies BEGIN
+            DELETE FROM movies_fts WHERE rowid = CAST(old.movieId AS INTEGER);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER movies_fts_au AFTER UPDATE OF movieId, title, tags ON movies BEGIN
+            DELETE FROM movies_fts WHERE rowid = CAST(old.movieId AS INTEGER);
+            INSERT INTO movies_fts(rowid, title, tags) VALUES (CAST(new.movieId AS INTEGER), new.title, new.tags);
+        END
+    """)
+    op.execute("""
+        INSERT INTO movies_fts(rowid, title, tags)
+        SELECT CAST(movieId AS INTEGER), title, tags FROM movies
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS movies_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS movies_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS movies_fts_ai")
+    op.execute("DROP TABLE IF EXISTS movies_fts")
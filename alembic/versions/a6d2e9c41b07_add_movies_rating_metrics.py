@@ -0,0 +1,55 @@
+"""Add stored rating percentage columns to movies
+
+Revision ID: a6d2e9c41b07
+Revises: f3c8a2d6b914
+Create Date: 2026-10-16 22:18:09.534170
+
+"""
+import os
+import sys
+
+from alembic import op
+import sqlalchemy as sa
+
+# Percentage rules live with the other catalog build steps
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'database'))
+from catalog_indexes import RATING_HISTOGRAM_QUERY, RATING_PERCENTAGE_COLUMNS, compute_rating_percentages
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6d2e9c41b07'
+down_revision = 'f3c8a2d6b914'
+branch_labels = None
+depends_on = None
+
+
+def _backfill_rating_percentages(bind) -> None:
+    """Compute the stored percentages of every movie from its rating histogram"""
+    rows = bind.execute(sa.text(RATING_HISTOGRAM_QUERY)).fetchall()
+    if rows:
+        bind.execute(
+            sa.text(
+                f"UPDATE movies SET {', '.join(f'{name} = :{name}' for name in RATING_PERCENTAGE_COLUMNS)} "
+                "WHERE movieId = :movie_id"
+            ),
+            [
+                {"movie_id": row[0], **dict(zip(RATING_PERCENTAGE_COLUMNS, compute_rating_percentages(row[1], row[2:])))}
+                for row in rows
+            ]
+        )
+
+
+def upgrade() -> None:
+    for name in RATING_PERCENTAGE_COLUMNS:
+        op.add_column('movies', sa.Column(name, sa.Float(), nullable=True))
+    op.create_index(
+        op.f('ix_movies_positive_rating_percentage'), 'movies', ['positive_rating_percentage'], unique=False
+    )
+
+    _backfill_rating_percentages(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_movies_positive_rating_percentage'), table_name='movies')
+    for name in reversed(RATING_PERCENTAGE_COLUMNS):
+        op.drop_column('movies', name)
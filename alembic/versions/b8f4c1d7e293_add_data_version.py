@@ -0,0 +1,29 @@
+"""Add data_version counter table
+
+Revision ID: b8f4c1d7e293
+Revises: a6d2e9c41b07
+Create Date: 2026-10-17 09:12:44.206318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8f4c1d7e293'
+down_revision = 'a6d2e9c41b07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('data_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO data_version (id, version) VALUES (1, 0)")
+
+
+def downgrade() -> None:
+    op.drop_table('data_version')
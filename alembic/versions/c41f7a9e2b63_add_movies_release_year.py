@@ -0,0 +1,42 @@
+"""Add indexed movies.release_year parsed from the title
+
+Revision ID: c41f7a9e2b63
+Revises: 8d2c4e6f1a7b
+Create Date: 2026-10-16 14:05:27.902113
+
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41f7a9e2b63'
+down_revision = '8d2c4e6f1a7b'
+branch_labels = None
+depends_on = None
+
+RELEASE_YEAR_PATTERN = re.compile(r'\((\d{4})\)\s*$')
+
+
+def upgrade() -> None:
+    op.add_column('movies', sa.Column('release_year', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_movies_release_year'), 'movies', ['release_year'], unique=False)
+
+    bind = op.get_bind()
+    updates = []
+    for movie_id, title in bind.execute(sa.text("SELECT movieId, title FROM movies")).fetchall():
+        match = RELEASE_YEAR_PATTERN.search(title or "")
+        if match:
+            updates.append({"movie_id": movie_id, "release_year": int(match.group(1))})
+    if updates:
+        bind.execute(
+            sa.text("UPDATE movies SET release_year = :release_year WHERE movieId = :movie_id"),
+            updates
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_movies_release_year'), table_name='movies')
+    op.drop_column('movies', 'release_year')
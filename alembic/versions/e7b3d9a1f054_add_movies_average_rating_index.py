@@ -0,0 +1,24 @@
+"""Index movies.average_rating for keyset pagination
+
+Revision ID: e7b3d9a1f054
+Revises: 5e9a0b3c7d21
+Create Date: 2026-10-16 19:48:13.406281
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7b3d9a1f054'
+down_revision = '5e9a0b3c7d21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_movies_average_rating'), 'movies', ['average_rating'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_movies_average_rating'), table_name='movies')
@@ -0,0 +1,62 @@
+"""Add precomputed related_movies table
+
+Revision ID: f3c8a2d6b914
+Revises: e7b3d9a1f054
+Create Date: 2026-10-16 20:41:37.118204
+
+"""
+import os
+import sys
+
+from alembic import op
+import sqlalchemy as sa
+
+# Scoring lives with the other catalog build steps
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'database'))
+from catalog_indexes import compute_related_movies
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c8a2d6b914'
+down_revision = 'e7b3d9a1f054'
+branch_labels = None
+depends_on = None
+
+
+def _backfill_related_movies(bind) -> None:
+    """Score related movies from the genre and tag tables"""
+    rows = compute_related_movies(
+        bind.execute(sa.text("SELECT movieId, ratings_count, average_rating FROM movies")).fetchall(),
+        bind.execute(sa.text("SELECT movie_id, genre_id FROM movie_genres")).fetchall(),
+        bind.execute(sa.text("SELECT movie_id, tag_id, tag_count FROM movie_tag_counts")).fetchall()
+    )
+    if rows:
+        bind.execute(
+            sa.text(
+                "INSERT INTO related_movies (movie_id, rank, related_movie_id, score) "
+                "VALUES (:movie_id, :rank, :related_movie_id, :score)"
+            ),
+            [
+                {"movie_id": movie_id, "rank": rank, "related_movie_id": related_id, "score": score}
+                for movie_id, rank, related_id, score in rows
+            ]
+        )
+
+
+def upgrade() -> None:
+    op.create_table('related_movies',
+    sa.Column('movie_id', sa.Integer(), nullable=False),
+    sa.Column('rank', sa.Integer(), nullable=False),
+    sa.Column('related_movie_id', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['movie_id'], ['movies.movieId'], ),
+    sa.ForeignKeyConstraint(['related_movie_id'], ['movies.movieId'], ),
+    sa.PrimaryKeyConstraint('movie_id', 'rank'),
+    sqlite_with_rowid=False
+    )
+
+    _backfill_related_movies(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_table('related_movies')
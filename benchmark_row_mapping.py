@@ -0,0 +1,149 @@
+"""
+Benchmark Row Mapping
+Per-row CPU cost of reading movies into the list / detail DTOs, against the
+SQLite catalog the API serves (see setup_database.py):
+
+    python benchmark_row_mapping.py [--db movielens.db] [--rows 1000] [--rounds 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from application.mappers.movie_mapper import MovieMapper
+from infrastructure.database.models import MovieModel
+from infrastructure.repositories.sqlite_movie_repository import MOVIE_COLUMNS, SqliteMovieRepository
+
+SPARSE_FIELDS = "title,average_rating"
+
+
+# The previous read path: row -> 17-key dict -> validated Movie -> validated DTO
+
+def legacy_movie_data(row) -> dict:
+    return {
+        'movieId': str(row.movieId),
+        'title': row.title or "",
+        'genres': row.genres or "",
+        'imdb_id': row.imdb_id or "",
+        'tmdb_id': row.tmdb_id or "",
+        'ratings_count': row.ratings_count or 0,
+        'zero_to_one_ratings_count': row.zero_to_one_ratings_count or 0,
+        'one_to_two_ratings_count': row.one_to_two_ratings_count or 0,
+        'two_to_three_ratings_count': row.two_to_three_ratings_count or 0,
+        'three_to_four_ratings_count': row.three_to_four_ratings_count or 0,
+        'four_to_five_ratings_count': row.four_to_five_ratings_count or 0,
+        'average_rating': row.average_rating or 0.0,
+        'tags': row.tags or "",
+        'earliest_rating': row.earliest_rating or "",
+        'latest_rating': row.latest_rating or "",
+        'earliest_tag': row.earliest_tag or "",
+        'latest_tag': row.latest_tag or "",
+        'release_year': row.release_year
+    }
+
+
+def legacy_movie(row):
+    return MovieMapper.from_database_data(legacy_movie_data(row))
+
+
+# The current read path: MOVIE_COLUMNS row -> trusted Movie -> DTO
+movie_from_row = SqliteMovieRepository._movie_from_row
+
+
+def measure(name: str, run, rows: int, rounds: int) -> float:
+    """CPU microseconds per row of run()"""
+    run()  # warm up
+    start = time.process_time()
+    for _ in range(rounds):
+        run()
+    per_row = (time.process_time() - start) / (rounds * rows) * 1e6
+    print(f"  {name:<44} {per_row:7.2f} µs/row")
+    return per_row
+
+
+def compare(title: str, before, after, rows: int, rounds: int,
+            labels=("before: dict -> validated Movie", "after:  row -> trusted Movie")) -> None:
+    print(title)
+    old = measure(labels[0], before, rows, rounds)
+    new = measure(labels[1], after, rows, rounds)
+    print(f"  ⚡ {old - new:.2f} µs saved per row ({old / new:.1f}x)\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--db', default='movielens.db')
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        sys.exit(f"❌ {args.db} not found - run setup_database.py first")
+    engine = create_engine(f"sqlite:///{args.db}")
+
+    with Session(engine) as session:
+        def fetch_models():
+            session.expunge_all()
+            return session.execute(
+                select(MovieModel).order_by(MovieModel.movieId).limit(args.rows)
+            ).scalars().all()
+
+        def fetch_rows(columns=MOVIE_COLUMNS):
+            return session.execute(
+                select(*columns).order_by(MovieModel.movieId).limit(args.rows)
+            ).all()
+
+        def summaries(fields=None):
+            """What a list endpoint does per page: projected query, mapping, JSON"""
+            attributes = MovieMapper.summary_attributes(fields)
+            columns = SqliteMovieRepository._movie_columns(attributes)
+            return [MovieMapper.to_summary_dto(movie_from_row(r)).model_dump_json(include=fields)
+                    for r in fetch_rows(columns)]
+
+        models, rows = fetch_models(), fetch_rows()
+        n = len(rows)
+
+        # Both paths must produce the same payloads
+        for model, row in zip(models, rows):
+            for to_dto in (MovieMapper.to_summary_dto, MovieMapper.to_dto):
+                assert to_dto(movie_from_row(row)) == to_dto(legacy_movie(model))
+
+        print(f"📦 {n} rows, {args.rounds} rounds\n")
+        compare(
+            "Row -> Movie (mapping only)",
+            lambda: [legacy_movie(m) for m in models],
+            lambda: [movie_from_row(r) for r in rows],
+            n, args.rounds
+        )
+        compare(
+            "Row -> MovieSummaryDto (list payloads)",
+            lambda: [MovieMapper.to_summary_dto(legacy_movie(m)) for m in models],
+            lambda: [MovieMapper.to_summary_dto(movie_from_row(r)) for r in rows],
+            n, args.rounds
+        )
+        compare(
+            "Query + MovieSummaryDto (end to end)",
+            lambda: [MovieMapper.to_summary_dto(legacy_movie(m)) for m in fetch_models()],
+            lambda: [MovieMapper.to_summary_dto(movie_from_row(r)) for r in fetch_rows()],
+            n, args.rounds
+        )
+
+        # Sparse fieldsets (fields=): projected columns, smaller payloads
+        sparse = MovieMapper.parse_summary_fields(SPARSE_FIELDS)
+        summary_bytes, sparse_bytes = (sum(len(j) for j in summaries(f)) for f in (None, sparse))
+        compare(
+            f"Query + MovieSummaryDto JSON: every field vs fields={SPARSE_FIELDS}",
+            lambda: summaries(),
+            lambda: summaries(sparse),
+            n, args.rounds,
+            labels=(f"every field ({summary_bytes / n:.0f} B/movie)", f"fields={SPARSE_FIELDS} ({sparse_bytes / n:.0f} B/movie)")
+        )
+
+
+if __name__ == "__main__":
+    main()
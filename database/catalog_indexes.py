@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Catalog Indexes
+Builds the normalized lookup tables the API queries against from the
+denormalized `movies` table. Called by import_data.py and
+update_movies_schema.py after every import, or run standalone:
+
+    python database/catalog_indexes.py [path/to/database.db]
+"""
+import math
+import re
+import sqlite3
+import sys
+
+import numpy as np
+
+# Release year as MovieLens encodes it: "Toy Story (1995)"
+RELEASE_YEAR_PATTERN = r'\((\d{4})\)\s*$'
+
+GENRE_TABLES_DDL = """
+CREATE TABLE IF NOT EXISTS genres (
+    id INTEGER NOT NULL PRIMARY KEY,
+    name VARCHAR NOT NULL,
+    normalized_name VARCHAR NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_genres_normalized_name ON genres (normalized_name);
+CREATE TABLE IF NOT EXISTS movie_genres (
+    movie_id INTEGER NOT NULL,
+    genre_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (movie_id, genre_id)
+);
+CREATE INDEX IF NOT EXISTS ix_movie_genres_genre_movie ON movie_genres (genre_id, movie_id);
+"""
+
+TAG_TABLES_DDL = """
+CREATE TABLE IF NOT EXISTS tag_dictionary (
+    id INTEGER NOT NULL PRIMARY KEY,
+    name VARCHAR NOT NULL,
+    normalized_name VARCHAR NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_tag_dictionary_normalized_name ON tag_dictionary (normalized_name);
+CREATE TABLE IF NOT EXISTS movie_tag_counts (
+    movie_id INTEGER NOT NULL,
+    tag_id INTEGER NOT NULL,
+    tag_count INTEGER NOT NULL,
+    PRIMARY KEY (movie_id, tag_id)
+);
+CREATE INDEX IF NOT EXISTS ix_movie_tag_counts_tag_count_movie ON movie_tag_counts (tag_id, tag_count, movie_id);
+"""
+
+# Rating percentages stored on movies, derived from the *_ratings_count histogram
+RATING_PERCENTAGE_COLUMNS = [
+    'positive_rating_percentage',
+    'negative_rating_percentage',
+    'zero_to_one_ratings_percentage',
+    'one_to_two_ratings_percentage',
+    'two_to_three_ratings_percentage',
+    'three_to_four_ratings_percentage',
+    'four_to_five_ratings_percentage',
+]
+RATING_HISTOGRAM_QUERY = """
+SELECT movieId, ratings_count,
+       zero_to_one_ratings_count, one_to_two_ratings_count, two_to_three_ratings_count,
+       three_to_four_ratings_count, four_to_five_ratings_count
+FROM movies
+"""
+
+# Single-row counter the API polls to notice catalog changes made by other
+# processes (imports, other workers); every catalog build bumps it
+DATA_VERSION_DDL = """
+CREATE TABLE IF NOT EXISTS data_version (
+    id INTEGER NOT NULL PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0);
+"""
+
+RELATED_MOVIES_DDL = """
+CREATE TABLE IF NOT EXISTS related_movies (
+    movie_id INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    related_movie_id INTEGER NOT NULL,
+    score FLOAT NOT NULL,
+    PRIMARY KEY (movie_id, rank)
+) WITHOUT ROWID;
+"""
+
+# Related movies kept per title, and how they are scored
+RELATED_TOP_K = 10
+RELATED_TAG_WEIGHT = 0.5         # a tag applied once weighs half a genre
+RELATED_POPULARITY_BLEND = 0.2   # share of the score from ratings count/average
+RELATED_MAX_TAG_SHARE = 0.05     # tags on more movies (e.g. "no tag") say nothing
+RELATED_BLOCK_ROWS = 512         # movies scored per matrix block
+
+MOVIES_FTS_DDL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS movies_fts USING fts5(
+    title, tags, tokenize = 'unicode61 remove_diacritics 2'
+);
+INSERT INTO movies_fts(movies_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)');
+CREATE TRIGGER IF NOT EXISTS movies_fts_ai AFTER INSERT ON movies BEGIN
+    INSERT INTO movies_fts(rowid, title, tags) VALUES (CAST(new.movieId AS INTEGER), new.title, new.tags);
+END;
+CREATE TRIGGER IF NOT EXISTS movies_fts_ad AFTER DELETE ON movies BEGIN
+    DELETE FROM movies_fts WHERE rowid = CAST(old.movieId AS INTEGER);
+END;
+CREATE TRIGGER IF NOT EXISTS movies_fts_au AFTER UPDATE OF movieId, title, tags ON movies BEGIN
+    DELETE FROM movies_fts WHERE rowid = CAST(old.movieId AS INTEGER);
+    INSERT INTO movies_fts(rowid, title, tags) VALUES (CAST(new.movieId AS INTEGER), new.title, new.tags);
+END;
+"""
+
+
+def split_pipe_list(value):
+    """Split a pipe-separated column value into stripped, non-empty items"""
+    if value is None:
+        return []
+    return [item.strip() for item in str(value).split('|') if item.strip()]
+
+
+def extract_release_year(title):
+    """Extract the release year from a title ending in (YYYY)"""
+    match = re.search(RELEASE_YEAR_PATTERN, str(title or ""))
+    return int(match.group(1)) if match else None
+
+
+def build_release_years(conn):
+    """Fill movies.release_year where missing and make sure it is indexed"""
+    cursor = conn.cursor()
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(movies)")}
+    if 'release_year' not in columns:
+        cursor.execute("ALTER TABLE movies ADD COLUMN release_year INTEGER")
+
+    conn.create_function("extract_release_year", 1, extract_release_year, deterministic=True)
+    cursor.execute("UPDATE movies SET release_year = extract_release_year(title) WHERE release_year IS NULL")
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_movies_release_year ON movies (release_year)")
+    conn.commit()
+    dated = cursor.execute("SELECT COUNT(*) FROM movies WHERE release_year IS NOT NULL").fetchone()[0]
+    print(f"📅 {dated} movies have a release year")
+
+
+def compute_rating_percentages(ratings_count, buckets):
+    """
+    RATING_PERCENTAGE_COLUMNS values for one movie, rounded like the domain
+    Movie: buckets are the five *_ratings_count columns from 0-1 to 4-5 stars
+    """
+    ratings_count = ratings_count or 0
+    buckets = [count or 0 for count in buckets]
+
+    def percentage(count):
+        return round((count / ratings_count) * 100, 2) if ratings_count else 0.0
+
+    return (
+        percentage(buckets[3] + buckets[4]),
+        percentage(buckets[0] + buckets[1]),
+        *(percentage(count) for count in buckets),
+    )
+
+
+def build_rating_percentages(conn):
+    """Recompute the stored rating percentages of every movie and index positive_rating_percentage"""
+    cursor = conn.cursor()
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(movies)")}
+    for name in RATING_PERCENTAGE_COLUMNS:
+        if name not in columns:
+            cursor.execute(f"ALTER TABLE movies ADD COLUMN {name} FLOAT")
+
+    rows = cursor.execute(RATING_HISTOGRAM_QUERY).fetchall()
+    assignments = ", ".join(f"{name} = ?" for name in RATING_PERCENTAGE_COLUMNS)
+    cursor.executemany(
+        f"UPDATE movies SET {assignments} WHERE movieId = ?",
+        [(*compute_rating_percentages(row[1], row[2:]), row[0]) for row in rows]
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS ix_movies_positive_rating_percentage ON movies (positive_rating_percentage)"
+    )
+    conn.commit()
+    print(f"📊 Stored rating percentages for {len(rows)} movies")
+
+
+def build_sort_indexes(conn):
+    """Index the movies columns list endpoints sort and seek on"""
+    cursor = conn.cursor()
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_movies_average_rating ON movies (average_rating)")
+    conn.commit()
+    print("↕️  Sort indexes ready")
+
+
+def build_genre_tables(conn):
+    """Rebuild genres/movie_genres from movies.genres"""
+    cursor = conn.cursor()
+    cursor.executescript(GENRE_TABLES_DDL)
+    cursor.execute("DELETE FROM movie_genres")
+    cursor.execute("DELETE FROM genres")
+
+    genre_ids = {}
+    links = []
+    for movie_id, genres in cursor.execute("SELECT movieId, genres FROM movies").fetchall():
+        for position, name in enumerate(split_pipe_list(genres)):
+            key = name.lower()
+            if key not in genre_ids:
+                cursor.execute(
+                    "INSERT INTO genres (name, normalized_name) VALUES (?, ?)",
+                    (name, key)
+                )
+                genre_ids[key] = cursor.lastrowid
+            links.append((int(movie_id), genre_ids[key], position))
+
+    cursor.executemany(
+        "INSERT OR IGNORE INTO movie_genres (movie_id, genre_id, position) VALUES (?, ?, ?)",
+        links
+    )
+    conn.commit()
+    print(f"🎭 Indexed {len(genre_ids)} genres across {len(links)} movie/genre links")
+
+
+def build_tag_tables(conn, tag_rows=None):
+    """
+    Rebuild tag_dictionary/movie_tag_counts.
+    tag_rows is an iterable of (movieId, tag) pairs, one per application of the
+    tag (e.g. straight from tags.csv); defaults to the pipe-separated movies.tags.
+    """
+    cursor = conn.cursor()
+    cursor.executescript(TAG_TABLES_DDL)
+    cursor.execute("DELETE FROM movie_tag_counts")
+    cursor.execute("DELETE FROM tag_dictionary")
+
+    if tag_rows is None:
+        tag_rows = (
+            (movie_id, tag)
+            for movie_id, tags in cursor.execute("SELECT movieId, tags FROM movies").fetchall()
+            for tag in split_pipe_list(tags)
+        )
+
+    tag_ids = {}
+    counts = {}
+    for movie_id, tag in tag_rows:
+        name = str(tag).strip()
+        if not name:
+            continue
+        key = name.casefold()
+        if key not in tag_ids:
+            cursor.execute(
+                "INSERT INTO tag_dictionary (name, normalized_name) VALUES (?, ?)",
+                (name, key)
+            )
+            tag_ids[key] = cursor.lastrowid
+        link = (int(movie_id), tag_ids[key])
+        counts[link] = counts.get(link, 0) + 1
+
+    cursor.executemany(
+        "INSERT INTO movie_tag_counts (movie_id, tag_id, tag_count) VALUES (?, ?, ?)",
+        [(movie_id, tag_id, count) for (movie_id, tag_id), count in counts.items()]
+    )
+    conn.commit()
+    print(f"🏷️  Indexed {len(tag_ids)} tags across {len(counts)} movie/tag links")
+
+
+def compute_related_movies(movies, genre_links, tag_links, top_k=RELATED_TOP_K):
+    """
+    Top-K related movies per movie.
+    movies: (movieId, ratings_count, average_rating) rows
+    genre_links: (movie_id, genre_id) rows
+    tag_links: (movie_id, tag_id, tag_count) rows
+    Similarity is the weighted Jaccard over genres (weight 1) and tags
+    (RELATED_TAG_WEIGHT * (1 + ln count)), blended with popularity. Tags on
+    more than RELATED_MAX_TAG_SHARE of all movies are ignored.
+    Returns (movie_id, rank, related_movie_id, score) rows, rank from 1.
+    """
+    movie_ids = [int(row[0]) for row in movies]
+    n = len(movie_ids)
+    if n < 2:
+        return []
+    index = {movie_id: i for i, movie_id in enumerate(movie_ids)}
+
+    # Genres are few and unweighted: shared weight is a matrix product
+    genre_index = {}
+    genre_pairs = []
+    for movie_id, genre_id in genre_links:
+        if int(movie_id) in index:
+            genre_pairs.append((index[int(movie_id)], genre_index.setdefault(genre_id, len(genre_index))))
+    genres = np.zeros((n, max(1, len(genre_index))), dtype=np.float32)
+    for i, g in genre_pairs:
+        genres[i, g] = 1.0
+    weights = genres.sum(axis=1)
+
+    # Tags are sparse: add min(weight) for each pair sharing a tag
+    tag_members = {}
+    for movie_id, tag_id, tag_count in tag_links:
+        i = index.get(int(movie_id))
+        if i is None:
+            continue
+        weight = RELATED_TAG_WEIGHT * (1 + math.log(max(1, tag_count)))
+        tag_members.setdefault(tag_id, []).append((i, weight))
+    shared_tags = {}
+    for members in tag_members.values():
+        if len(members) > RELATED_MAX_TAG_SHARE * n:
+            continue
+        for i, weight in members:
+            weights[i] += weight
+        for a, (i, wi) in enumerate(members):
+            for j, wj in members[a + 1:]:
+                shared = min(wi, wj)
+                shared_tags.setdefault(i, {})[j] = shared_tags.get(i, {}).get(j, 0.0) + shared
+                shared_tags.setdefault(j, {})[i] = shared_tags.get(j, {}).get(i, 0.0) + shared
+
+    ratings_count = np.array([float(row[1] or 0) for row in movies], dtype=np.float32)
+    average_rating = np.array([float(row[2] or 0) for row in movies], dtype=np.float32)
+    popularity = 0.5 * np.log1p(ratings_count) / max(1.0, float(np.log1p(ratings_count.max())))
+    popularity += 0.5 * average_rating / 5.0
+
+    top_k = min(top_k, n - 1)
+    rows = []
+    for start in range(0, n, RELATED_BLOCK_ROWS):
+        end = min(n, start + RELATED_BLOCK_ROWS)
+        shared = genres[start:end] @ genres.T
+        for i in range(start, end):
+            for j, value in shared_tags.get(i, {}).items():
+                shared[i - start, j] += value
+
+        union = weights[start:end, None] + weights[None, :] - shared
+        similarity = np.divide(shared, union, out=np.zeros_like(shared), where=union > 0)
+        scores = np.where(
+            similarity > 0,
+            (1 - RELATED_POPULARITY_BLEND) * similarity + RELATED_POPULARITY_BLEND * popularity[None, :],
+            0.0
+        )
+        scores[np.arange(end - start), np.arange(start, end)] = 0.0
+
+        candidates = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+        for offset, row_candidates in enumerate(candidates):
+            ranked = sorted(row_candidates, key=lambda j: (-scores[offset, j], movie_ids[j]))
+            rank = 0
+            for j in ranked:
+                if scores[offset, j] <= 0:
+                    break
+                rank += 1
+                rows.append((movie_ids[start + offset], rank, movie_ids[j], round(float(scores[offset, j]), 6)))
+    return rows
+
+
+def build_related_movies(conn, top_k=RELATED_TOP_K):
+    """Rebuild related_movies from the genre and tag tables"""
+    cursor = conn.cursor()
+    cursor.executescript(RELATED_MOVIES_DDL)
+    cursor.execute("DELETE FROM related_movies")
+
+    rows = compute_related_movies(
+        cursor.execute("SELECT movieId, ratings_count, average_rating FROM movies").fetchall(),
+        cursor.execute("SELECT movie_id, genre_id FROM movie_genres").fetchall(),
+        cursor.execute("SELECT movie_id, tag_id, tag_count FROM movie_tag_counts").fetchall(),
+        top_k
+    )
+    cursor.executemany(
+        "INSERT INTO related_movies (movie_id, rank, related_movie_id, score) VALUES (?, ?, ?, ?)",
+        rows
+    )
+    conn.commit()
+    print(f"🔗 Stored {len(rows)} related-movie links (top {top_k} per movie)")
+
+
+def build_fts_index(conn):
+    """Rebuild the movies_fts full-text index and its sync triggers"""
+    cursor = conn.cursor()
+    cursor.executescript(MOVIES_FTS_DDL)
+    cursor.execute("DELETE FROM movies_fts")
+    cursor.execute("""
+        INSERT INTO movies_fts(rowid, title, tags)
+        SELECT CAST(movieId AS INTEGER), title, tags FROM movies
+    """)
+    cursor.execute("INSERT INTO movies_fts(movies_fts) VALUES ('optimize')")
+    conn.commit()
+    print(f"🔎 Indexed {cursor.execute('SELECT COUNT(*) FROM movies_fts').fetchone()[0]} titles for full-text search")
+
+
+def bump_data_version(conn):
+    """Tell running API processes the catalog changed"""
+    cursor = conn.cursor()
+    cursor.executescript(DATA_VERSION_DDL)
+    cursor.execute("UPDATE data_version SET version = version + 1 WHERE id = 1")
+    conn.commit()
+    version = cursor.execute("SELECT version FROM data_version WHERE id = 1").fetchone()[0]
+    print(f"🔁 Catalog data version is now {version}")
+
+
+def build_catalog_indexes(conn, tag_rows=None):
+    """Rebuild every derived catalog table"""
+    build_release_years(conn)
+    build_rating_percentages(conn)
+    build_sort_indexes(conn)
+    build_genre_tables(conn)
+    build_tag_tables(conn, tag_rows)
+    build_related_movies(conn)
+    build_fts_index(conn)
+    bump_data_version(conn)
+
+
+def main():
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "./database/movielens.db"
+    conn = sqlite3.connect(db_path)
+    try:
+        build_catalog_indexes(conn)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
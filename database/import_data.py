@@ -3,6 +3,7 @@ import sqlite3
 import os
 from datetime import datetime
 from config import DATABASE_URL, CSV_FILES, WEBSTREAMING_DATA_PATH
+from catalog_indexes import build_catalog_indexes, RELEASE_YEAR_PATTERN
 
 def convert_timestamp(timestamp):
     """Chuyển đổi timestamp thành datetime"""
@@ -105,9 +106,18 @@ def import_movies():
     # Chuyển đổi movieId thành string
     processed_movies['movieId'] = processed_movies['movieId'].astype(str)
     
+    # Tách năm phát hành từ tiêu đề một lần duy nhất, "Toy Story (1995)" -> 1995
+    processed_movies['release_year'] = pd.to_numeric(
+        processed_movies['title'].str.extract(RELEASE_YEAR_PATTERN, expand=False)
+    ).astype('Int64')
+    
     # Import vào database
     processed_movies.to_sql('movies', conn, if_exists='replace', index=False)
     
+    # Xây dựng lại các bảng tra cứu chuẩn hóa (genres, movie_genres, ...)
+    # Tag được đếm từ tags.csv gốc để giữ số lần mỗi tag được gắn cho phim
+    build_catalog_indexes(conn, tag_rows=tags_df[['movieId', 'tag']].itertuples(index=False, name=None))
+    
     conn.close()
     print(f"Imported {len(processed_movies)} processed movies")
 
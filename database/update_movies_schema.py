@@ -9,6 +9,8 @@ import pandas as pd
 import os
 from pathlib import Path
 
+from catalog_indexes import build_catalog_indexes, extract_release_year
+
 def update_movies_schema():
     """Update movies table schema to match movies.csv"""
     db_path = Path("./database/movielens.db")
@@ -57,7 +59,8 @@ def update_movies_schema():
             'earliest_rating': 'TEXT',
             'latest_rating': 'TEXT',
             'earliest_tag': 'TEXT',
-            'latest_tag': 'TEXT'
+            'latest_tag': 'TEXT',
+            'release_year': 'INTEGER'
         }
         
         # Add missing columns
@@ -93,14 +96,15 @@ def update_movies_schema():
                         movieId, title, genres, imdb_id, tmdb_id,
                         ratings_count, zero_to_one_ratings_count, one_to_two_ratings_count,
                         two_to_three_ratings_count, three_to_four_ratings_count, four_to_five_ratings_count,
-                        average_rating, tags, earliest_rating, latest_rating, earliest_tag, latest_tag
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        average_rating, tags, earliest_rating, latest_rating, earliest_tag, latest_tag,
+                        release_year
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     row['movieId'], row['title'], row['genres'], row['imdb_id'], row['tmdb_id'],
                     row['ratings_count'], row['zero_to_one_ratings_count'], row['one_to_two_ratings_count'],
                     row['two_to_three_ratings_count'], row['three_to_four_ratings_count'], row['four_to_five_ratings_count'],
                     row['average_rating'], row['tags'], row['earliest_rating'], row['latest_rating'],
-                    row['earliest_tag'], row['latest_tag']
+                    row['earliest_tag'], row['latest_tag'], extract_release_year(row['title'])
                 ))
             except Exception as e:
                 print(f"❌ Error inserting row {index}: {e}")
@@ -109,6 +113,10 @@ def update_movies_schema():
         # Commit changes
         conn.commit()
         
+        # Rebuild normalized lookup tables (genres, movie_genres, ...)
+        print("🔄 Rebuilding catalog indexes...")
+        build_catalog_indexes(conn)
+        
         # Verify the update
         cursor.execute("SELECT COUNT(*) FROM movies")
         count = cursor.fetchone()[0]
@@ -128,68 +136,6 @@ def update_movies_schema():
         print(f"❌ Error updating schema: {e}")
         return False
 
-def update_sqlalchemy_models():
-    """Update SQLAlchemy models to match the new schema"""
-    print("\n🔄 Updating SQLAlchemy models...")
-    
-    model_content = '''"""
-Database Models - Infrastructure Layer
-SQLAlchemy ORM models for database tables
-"""
-from sqlalchemy import Column, String, Boolean, DateTime, Integer, Float, Text
-from sqlalchemy.sql import func
-from datetime import datetime
-from .database import Base
-
-
-class UserModel(Base):
-    """User database model"""
-    __tablename__ = "users"
-    
-    id = Column(String, primary_key=True, index=True)
-    email = Column(String, unique=True, index=True, nullable=False)
-    username = Column(String, unique=True, index=True, nullable=False)
-    hashed_password = Column(String, nullable=False)
-    full_name = Column(String, nullable=False)
-    is_active = Column(Boolean, default=True)
-    is_superuser = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
-    last_login = Column(DateTime, nullable=True)
-
-
-class MovieModel(Base):
-    """Movie database model"""
-    __tablename__ = "movies"
-    
-    movieId = Column(Integer, primary_key=True, index=True)
-    title = Column(String, nullable=True)
-    genres = Column(Text, nullable=True)  # Pipe-separated genres
-    imdb_id = Column(String, nullable=True)
-    tmdb_id = Column(String, nullable=True)
-    ratings_count = Column(Integer, nullable=True)
-    zero_to_one_ratings_count = Column(Integer, nullable=True)
-    one_to_two_ratings_count = Column(Integer, nullable=True)
-    two_to_three_ratings_count = Column(Integer, nullable=True)
-    three_to_four_ratings_count = Column(Integer, nullable=True)
-    four_to_five_ratings_count = Column(Integer, nullable=True)
-    average_rating = Column(Float, nullable=True)
-    tags = Column(Text, nullable=True)  # Pipe-separated tags
-    earliest_rating = Column(String, nullable=True)
-    latest_rating = Column(String, nullable=True)
-    earliest_tag = Column(String, nullable=True)
-    latest_tag = Column(String, nullable=True)
-'''
-    
-    try:
-        with open("src/infrastructure/database/models.py", "w", encoding="utf-8") as f:
-            f.write(model_content)
-        print("✅ Updated SQLAlchemy models")
-        return True
-    except Exception as e:
-        print(f"❌ Error updating models: {e}")
-        return False
-
 def main():
     """Main function"""
     print("🚀 Starting movies schema update...")
@@ -202,13 +148,6 @@ def main():
         print("\n❌ Failed to update database schema!")
         return
     
-    # Update SQLAlchemy models
-    if update_sqlalchemy_models():
-        print("✅ SQLAlchemy models updated successfully!")
-    else:
-        print("❌ Failed to update SQLAlchemy models!")
-        return
-    
     print("\n🎉 All updates completed successfully!")
     print("📝 Next steps:")
     print("   1. Restart the FastAPI server")
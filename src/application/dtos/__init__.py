@@ -15,6 +15,9 @@ __all__ = [
     "PaginatedResponseDto",
     "SearchRequestDto",
     "MovieDetailResponseDto",
+    "MovieBatchRequestDto",
+    "MovieBatchMissingDto",
+    "MovieBatchResponseDto",
     "GenreListResponseDto",
     "ErrorResponseDto",
     "SuccessResponseDto",
@@ -29,6 +29,7 @@ class MovieDto(BaseModel):
     latest_rating: str = Field(default="")
     earliest_tag: str = Field(default="")
     latest_tag: str = Field(default="")
+    release_year: Optional[int] = Field(default=None)
     is_highly_rated: bool = Field(default=False)
     is_popular: bool = Field(default=False)
     primary_genre: str = Field(default="")
@@ -52,6 +53,7 @@ class MovieSummaryDto(BaseModel):
     ratings_count: int = Field(default=0)
     tags: List[str] = Field(default_factory=list)
     latest_rating: str = Field(default="")
+    release_year: Optional[int] = Field(default=None)
     is_highly_rated: bool = Field(default=False)
     is_popular: bool = Field(default=False)
     primary_genre: str = Field(default="")
@@ -72,12 +74,13 @@ class PaginationMetaDto(BaseModel):
     """
     Pagination metadata DTO
     """
-    page: int = Field(ge=1)
+    page: Optional[int] = Field(None, ge=1, description="Page number; null when the page was fetched by cursor")
     limit: int = Field(ge=1, le=100)
     total: int = Field(ge=0)
     total_pages: int = Field(ge=0)
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next page")
 
 
 class PaginatedResponseDto(BaseModel):
@@ -108,6 +111,7 @@ class MovieCreateDto(BaseModel):
     latest_rating: str
     earliest_tag: str
     latest_tag: str
+    release_year: Optional[int] = Field(None, ge=1888, le=2030, description="Derived from the title when omitted")
     
 class SearchRequestDto(BaseModel):
     """
@@ -117,10 +121,15 @@ class SearchRequestDto(BaseModel):
     genre: Optional[str] = Field(None, min_length=1, max_length=50)
     tag: Optional[str] = Field(None, min_length=1, max_length=50)
     year: Optional[int] = Field(None, ge=1888, le=2030)
+    year_from: Optional[int] = Field(None, ge=1888, le=2030)
+    year_to: Optional[int] = Field(None, ge=1888, le=2030)
+    decade: Optional[int] = Field(None, ge=1880, le=2030)
     min_rating: Optional[float] = Field(None, ge=0, le=10)
     max_rating: Optional[float] = Field(None, ge=0, le=10)
+    min_positive: Optional[float] = Field(None, ge=0, le=100)
     page: int = Field(1, ge=1)
     limit: int = Field(10, ge=1, le=100)
+    cursor: Optional[str] = Field(None, max_length=200)
 
 
 class MovieDetailResponseDto(BaseModel):
@@ -131,6 +140,38 @@ class MovieDetailResponseDto(BaseModel):
     related_movies: List[MovieSummaryDto]
 
 
+# Most IDs one batch lookup may ask for, across all ID kinds
+MAX_BATCH_IDS = 100
+
+
+class MovieBatchRequestDto(BaseModel):
+    """
+    Movie Batch Request DTO - movies to fetch in one request
+    """
+    movie_ids: List[str] = Field(default_factory=list, max_length=MAX_BATCH_IDS)
+    imdb_ids: List[str] = Field(default_factory=list, max_length=MAX_BATCH_IDS)
+    tmdb_ids: List[str] = Field(default_factory=list, max_length=MAX_BATCH_IDS)
+    include_related: bool = Field(True, description="Also return the related movies of each movie")
+
+
+class MovieBatchMissingDto(BaseModel):
+    """
+    Movie Batch Missing DTO - requested IDs that matched no movie
+    """
+    movie_ids: List[str] = Field(default_factory=list)
+    imdb_ids: List[str] = Field(default_factory=list)
+    tmdb_ids: List[str] = Field(default_factory=list)
+
+
+class MovieBatchResponseDto(BaseModel):
+    """
+    Movie Batch Response DTO - found movies in request order
+    (movie_ids, then imdb_ids, then tmdb_ids)
+    """
+    movies: List[MovieDetailResponseDto]
+    missing: MovieBatchMissingDto
+
+
 class GenreListResponseDto(BaseModel):
     """
     Genre List Response DTO
@@ -2,7 +2,7 @@
 Movie Mapper - Application Layer
 Converts between domain entities and DTOs
 """
-from typing import List
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
 
 from domain.entities.movie import Movie
 from domain.entities.genre import Genre
@@ -19,6 +19,34 @@ from application.dtos.movie_schemas import (
     TagDto
 )
 
+# Movie attributes each MovieSummaryDto field is built from
+SUMMARY_FIELD_ATTRIBUTES = {
+    "movieId": ("movieId",),
+    "title": ("title",),
+    "genres": ("genres",),
+    "average_rating": ("average_rating",),
+    "ratings_count": ("ratings_count",),
+    "tags": ("tags",),
+    "latest_rating": ("latest_rating",),
+    "release_year": ("release_year",),
+    "is_highly_rated": ("average_rating",),
+    "is_popular": ("ratings_count",),
+    "primary_genre": ("genres",),
+    "positive_rating_percentage": ("positive_rating_percentage",),
+}
+
+# Columns of an exported movie record: the movies.csv columns plus release_year
+EXPORT_FIELDS = (
+    "movieId", "title", "genres", "imdb_id", "tmdb_id", "ratings_count",
+    "zero_to_one_ratings_count", "one_to_two_ratings_count", "two_to_three_ratings_count",
+    "three_to_four_ratings_count", "four_to_five_ratings_count", "average_rating", "tags",
+    "earliest_rating", "latest_rating", "earliest_tag", "latest_tag", "release_year",
+)
+EXPORT_COUNT_FIELDS = (
+    "ratings_count", "zero_to_one_ratings_count", "one_to_two_ratings_count",
+    "two_to_three_ratings_count", "three_to_four_ratings_count", "four_to_five_ratings_count",
+)
+
 
 class MovieMapper:
     """
@@ -47,6 +75,7 @@ class MovieMapper:
             latest_rating=movie.latest_rating,
             earliest_tag=movie.earliest_tag,
             latest_tag=movie.latest_tag,
+            release_year=movie.release_year,
             
             # Computed fields
             is_highly_rated=movie.is_highly_rated(),
@@ -68,12 +97,56 @@ class MovieMapper:
             ratings_count=movie.ratings_count,
             tags=movie.tags,
             latest_rating=movie.latest_rating,
+            release_year=movie.release_year,
             is_highly_rated=movie.is_highly_rated(),
             is_popular=movie.is_popular(),
             primary_genre=movie.get_primary_genre(),
             positive_rating_percentage=movie.get_positive_rating_percentage()
         )
 
+    @staticmethod
+    def parse_summary_fields(fields: Optional[str]) -> Optional[FrozenSet[str]]:
+        """
+        Parse a comma-separated `fields=` value into MovieSummaryDto field
+        names (movieId is always included). None or blank selects every field.
+        """
+        if fields is None:
+            return None
+        names = {name.strip() for name in fields.split(",") if name.strip()}
+        if not names:
+            return None
+        unknown = names - SUMMARY_FIELD_ATTRIBUTES.keys()
+        if unknown:
+            raise ValueError(
+                f"Unknown field(s): {', '.join(sorted(unknown))}. "
+                f"Allowed: {', '.join(SUMMARY_FIELD_ATTRIBUTES)}"
+            )
+        return frozenset(names | {"movieId"})
+
+    @staticmethod
+    def summary_attributes(fields: Optional[Iterable[str]] = None) -> FrozenSet[str]:
+        """Movie attributes needed to build the given MovieSummaryDto fields (all of them when None)"""
+        names = SUMMARY_FIELD_ATTRIBUTES if fields is None else fields
+        return frozenset(attribute for name in names for attribute in SUMMARY_FIELD_ATTRIBUTES[name])
+
+    @staticmethod
+    def to_export_record(movie: Movie) -> Dict[str, Any]:
+        """
+        Convert Movie entity to an export record (EXPORT_FIELDS, stored values
+        only) with MovieDto's types, whatever the backend stored: string IDs,
+        int counts, float rating
+        """
+        record = {field: getattr(movie, field) for field in EXPORT_FIELDS}
+        record["movieId"] = str(movie.movieId)
+        record["imdb_id"] = Movie.normalize_external_id(movie.imdb_id)
+        record["tmdb_id"] = Movie.normalize_external_id(movie.tmdb_id)
+        for field in EXPORT_COUNT_FIELDS:
+            record[field] = int(record[field] or 0)
+        record["average_rating"] = float(movie.average_rating or 0.0)
+        if movie.release_year is not None:
+            record["release_year"] = int(movie.release_year)
+        return record
+
     @staticmethod
     def to_dto_list(movies: List[Movie]) -> List[MovieDto]:
         """Convert list of Movie entities to MovieDto list"""
@@ -88,12 +161,14 @@ class MovieMapper:
     def to_paginated_response(result: PaginatedResult[Movie]) -> PaginatedResponseDto:
         """Convert PaginatedResult<Movie> to PaginatedResponseDto"""
         pagination_meta = PaginationMetaDto(
-            page=result.page,
+            # A cursor page has no page number; echoing the default 1 would be wrong
+            page=result.page if result.cursor is None else None,
             limit=result.limit,
             total=result.total,
             total_pages=result.total_pages,
             has_next=result.has_next,
-            has_previous=result.has_previous
+            has_previous=result.has_previous,
+            next_cursor=result.next_cursor
         )
 
         return PaginatedResponseDto(
@@ -188,7 +263,8 @@ class MovieMapper:
             earliest_rating=movie_dto.earliest_rating,
             latest_rating=movie_dto.latest_rating,
             earliest_tag=movie_dto.earliest_tag,
-            latest_tag=movie_dto.latest_tag
+            latest_tag=movie_dto.latest_tag,
+            release_year=movie_dto.release_year or Movie.parse_release_year(movie_dto.title)
         )
 
     @staticmethod
@@ -211,7 +287,8 @@ class MovieMapper:
             earliest_rating=movie_data.get('earliest_rating', ''),
             latest_rating=movie_data.get('latest_rating', ''),
             earliest_tag=movie_data.get('earliest_tag', ''),
-            latest_tag=movie_data.get('latest_tag', '')
+            latest_tag=movie_data.get('latest_tag', ''),
+            release_year=movie_data.get('release_year')
         )
 
 
@@ -4,5 +4,7 @@ Contains all services for the movie streaming API
 """
 
 from .auth_service import AuthService
+from .single_flight import SingleFlight
+from .json_fragment_cache import JsonFragmentCache
 
-__all__ = ["AuthService"] 
\ No newline at end of file
+__all__ = ["AuthService", "SingleFlight", "JsonFragmentCache"] 
\ No newline at end of file
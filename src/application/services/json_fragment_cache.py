@@ -0,0 +1,111 @@
+"""
+JSON Fragment Cache - Application Layer
+Pre-serialized JSON bytes per movie, assembled into response payloads
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from application.dtos.movie_schemas import (
+    MovieDto,
+    MovieSummaryDto,
+    MovieDetailResponseDto,
+    MovieBatchResponseDto,
+    PaginatedResponseDto
+)
+
+
+class JsonFragmentCache:
+    """
+    JSON Fragment Cache - Application Layer
+    Keeps the serialized JSON of every movie in each shape it is sent in
+    (full MovieDto, list MovieSummaryDto, and list summaries limited to a
+    `fields=` selection). Detail and list payloads are concatenations of
+    these fragments, so a movie is serialized once per shape until
+    invalidate() drops it or ttl seconds have passed.
+    """
+
+    def __init__(self, max_size: int = 20000, ttl: float = 1800):
+        self.max_size = max_size
+        self.ttl = ttl
+        # key -> (fragment, expires_at)
+        self._fragments: "OrderedDict[Tuple[str, str, Optional[FrozenSet[str]]], Tuple[bytes, float]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def fragment(
+        self,
+        dto: Union[MovieDto, MovieSummaryDto],
+        fields: Optional[FrozenSet[str]] = None,
+        now: Optional[float] = None
+    ) -> bytes:
+        """JSON bytes of one movie DTO, limited to fields when given"""
+        if now is None:
+            now = time.monotonic()
+        key = (dto.movieId, type(dto).__name__, fields)
+        entry = self._fragments.get(key)
+        if entry is not None and entry[1] > now:
+            self._fragments.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+        self._misses += 1
+        fragment = dto.model_dump_json(include=fields).encode("utf-8")
+        self._fragments[key] = (fragment, now + self.ttl)
+        self._fragments.move_to_end(key)
+        while len(self._fragments) > self.max_size:
+            self._fragments.popitem(last=False)
+        return fragment
+
+    def _array(self, dtos, fields: Optional[FrozenSet[str]], now: float) -> bytes:
+        return b"[" + b",".join(self.fragment(dto, fields, now) for dto in dtos) + b"]"
+
+    def render(self, dto: BaseModel, fields: Optional[FrozenSet[str]] = None, now: Optional[float] = None) -> bytes:
+        """
+        JSON bytes of a response DTO, reusing the movie fragments it contains.
+        fields limits the movies of a paginated list to those MovieSummaryDto fields.
+        """
+        if now is None:
+            now = time.monotonic()
+        if isinstance(dto, PaginatedResponseDto):
+            return (
+                b'{"data":' + self._array(dto.data, fields, now)
+                + b',"pagination":' + dto.pagination.model_dump_json().encode("utf-8") + b"}"
+            )
+        if isinstance(dto, MovieDetailResponseDto):
+            return (
+                b'{"movie":' + self.fragment(dto.movie, now=now)
+                + b',"related_movies":' + self._array(dto.related_movies, None, now) + b"}"
+            )
+        if isinstance(dto, MovieBatchResponseDto):
+            return (
+                b'{"movies":[' + b",".join(self.render(detail, now=now) for detail in dto.movies)
+                + b'],"missing":' + dto.missing.model_dump_json().encode("utf-8") + b"}"
+            )
+        if isinstance(dto, (MovieDto, MovieSummaryDto)):
+            return self.fragment(dto, now=now)
+        return dto.model_dump_json().encode("utf-8")
+
+    def invalidate(self, movie_id: str) -> None:
+        """Drop every fragment of one movie"""
+        for key in [key for key in self._fragments if key[0] == movie_id]:
+            del self._fragments[key]
+
+    def clear(self) -> None:
+        """Drop every fragment"""
+        self._fragments.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get fragment cache statistics"""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._fragments),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "bytes": sum(len(fragment) for fragment, _ in self._fragments.values()),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0
+        }
@@ -0,0 +1,55 @@
+"""
+Single Flight - Application Layer
+Coalesces identical concurrent loads into one execution
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """
+    Single Flight - Application Layer
+    The first caller for a key starts the load as a task; callers arriving
+    while it runs await the same task instead of repeating the queries.
+    The task is shielded, so a caller that disconnects does not cancel the
+    load for the others. Nothing is kept once the task finishes - caching
+    results is the cache's job.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, "asyncio.Task[Any]"] = {}
+        self._executed = 0
+        self._coalesced = 0
+        self._coalesced_by_namespace: Dict[str, int] = {}
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Run loader() for key, or join the run already in flight"""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self._executed += 1
+        else:
+            self._coalesced += 1
+            namespace = key.split(":", 1)[0]
+            self._coalesced_by_namespace[namespace] = self._coalesced_by_namespace.get(namespace, 0) + 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: "asyncio.Task[Any]") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Every caller may have gone away; don't log the error as unretrieved
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics"""
+        calls = self._executed + self._coalesced
+        return {
+            "executed": self._executed,
+            "coalesced": self._coalesced,
+            "coalesce_rate": round(self._coalesced / calls, 4) if calls else 0.0,
+            "in_flight": len(self._in_flight),
+            "coalesced_by_namespace": dict(self._coalesced_by_namespace)
+        }
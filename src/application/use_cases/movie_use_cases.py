@@ -2,7 +2,14 @@
 Movie Use Cases - Application Layer
 Orchestrates business logic for movie operations
 """
-from typing import List, Optional
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple, TYPE_CHECKING
+
+from pydantic import BaseModel
 
 from domain.entities.movie import Movie
 from domain.entities.genre import Genre
@@ -16,9 +23,30 @@ from application.dtos.movie_schemas import (
     GenreListResponseDto,
     SearchRequestDto,
     MovieDto,
-    MovieCreateDto
+    MovieCreateDto,
+    MovieBatchRequestDto,
+    MovieBatchMissingDto,
+    MovieBatchResponseDto,
+    MAX_BATCH_IDS
 )
 from application.mappers.movie_mapper import MovieMapper, GenreMapper
+from application.services.single_flight import SingleFlight
+from application.services.json_fragment_cache import JsonFragmentCache
+
+if TYPE_CHECKING:
+    from infrastructure.cache.cache_manager import CacheManager
+
+logger = logging.getLogger(__name__)
+
+# Default age (seconds) after which statistics are rebuilt in the background
+STATISTICS_SOFT_TTL = 300
+
+# Default seconds between re-reads of the repository's data version
+DATA_VERSION_CHECK_INTERVAL = 1.0
+
+
+class BatchSizeError(ValueError):
+    """A batch lookup asked for no IDs or for more than MAX_BATCH_IDS"""
 
 
 class MovieUseCase:
@@ -27,16 +55,231 @@ class MovieUseCase:
     Orchestrates movie-related business operations
     """
 
-    def __init__(self, movie_repository: IMovieRepository):
+    def __init__(
+        self,
+        movie_repository: IMovieRepository,
+        cache: Optional["CacheManager"] = None,
+        single_flight: Optional[SingleFlight] = None,
+        statistics_soft_ttl: float = STATISTICS_SOFT_TTL,
+        json_fragments: Optional[JsonFragmentCache] = None,
+        data_version_check_interval: float = DATA_VERSION_CHECK_INTERVAL
+    ):
         self._movie_repository = movie_repository
+        self._cache = cache
+        self._single_flight = single_flight or SingleFlight()
+        self.statistics_soft_ttl = statistics_soft_ttl
+        self._json_fragments = json_fragments or JsonFragmentCache()
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self.data_version_check_interval = data_version_check_interval
+        self._data_version: Optional[int] = None
+        self._data_version_checked_at = 0.0
+        self._catalog_version: Optional[str] = None
+
+    @property
+    def catalog_version(self) -> Optional[str]:
+        """Fingerprint of the catalog data, None while it is unknown or being rebuilt"""
+        return self._catalog_version
+
+    def _observe_data_version(self, version: int) -> bool:
+        """
+        Switch to a data version read from the repository. Cached responses
+        are keyed by it, so entries built from older data are no longer read;
+        the JSON fragments of those movies are dropped.
+        Returns True when the version changed.
+        """
+        if version == self._data_version:
+            return False
+        if self._data_version is not None:
+            self._json_fragments.clear()
+        self._data_version = version
+        self._catalog_version = None
+        return True
 
-    async def get_movies(self, page: int = 1, limit: int = 10) -> PaginatedResponseDto:
+    async def load_catalog_version(self) -> str:
+        """
+        (Re)compute the catalog fingerprint: the repository's data version
+        plus a digest of the statistics overview. The data version is shared
+        state (a row in the SQLite database), so every process serving the
+        same data reaches the same fingerprint within
+        data_version_check_interval of a change.
+        """
+        self._data_version_checked_at = time.monotonic()
+        version = await self._movie_repository.get_data_version()
+        self._observe_data_version(version)
+        statistics = await self.get_movie_statistics()
+        payload = json.dumps(
+            [version, statistics],
+            sort_keys=True,
+            default=lambda dto: dto.model_dump(mode="json")
+        )
+        fingerprint = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+        # A newer version seen meanwhile gets its own fingerprint
+        if self._data_version == version:
+            self._catalog_version = fingerprint
+        return fingerprint
+
+    async def check_catalog_version(self) -> Optional[str]:
+        """
+        Current catalog fingerprint, re-reading the data version at most
+        every data_version_check_interval seconds. After a change made by
+        another process the fingerprint is rebuilt in the background and
+        None is returned until it is ready.
+        """
+        now = time.monotonic()
+        if now - self._data_version_checked_at >= self.data_version_check_interval:
+            self._data_version_checked_at = now
+            try:
+                self._observe_data_version(await self._movie_repository.get_data_version())
+            except Exception as e:
+                logger.warning(f"Reading the catalog data version failed: {e}")
+                self._catalog_version = None
+            if self._catalog_version is None and "catalog_version" not in self._refreshing:
+                self._refreshing["catalog_version"] = asyncio.create_task(self._reload_catalog_version())
+        return self._catalog_version
+
+    async def _reload_catalog_version(self) -> None:
+        """Rebuild the catalog fingerprint in the background"""
+        try:
+            await self.load_catalog_version()
+        except Exception as e:
+            logger.warning(f"Rebuilding the catalog version failed: {e}")
+        finally:
+            self._refreshing.pop("catalog_version", None)
+
+    def to_json(self, dto: BaseModel, fields: Optional[FrozenSet[str]] = None) -> bytes:
+        """Serialize a response DTO from the per-movie JSON fragments, list movies limited to fields"""
+        return self._json_fragments.render(dto, fields)
+
+    @staticmethod
+    def _fields_key(fields: Optional[FrozenSet[str]]) -> str:
+        """Cache key suffix of a sparse fieldset (empty for every field)"""
+        return f":fields={','.join(sorted(fields))}" if fields else ""
+
+    async def _cache_key(self, key: str) -> str:
+        """Key bound to the current data version ("movie_detail:42:v7")"""
+        await self.check_catalog_version()
+        return f"{key}:v{self._data_version}"
+
+    async def _cached(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached response DTO for key, or build it with loader.
+        The key namespace ("movie_detail:42") selects the TTL. Concurrent
+        misses for the same key share a single loader run.
+        """
+        return await self._cached_as(await self._cache_key(key), loader)
+
+    async def _cached_as(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """_cached for a key already bound to the data version"""
+        async def load_once():
+            return await self._single_flight.do(key, loader)
+
+        if self._cache is None:
+            return await load_once()
+        return await self._cache.get_or_set(key, load_once)
+
+    async def _cached_stale_while_revalidate(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        soft_ttl: float
+    ) -> Tuple[Any, float]:
+        """
+        Like _cached, but returns (value, age in seconds). Once the value is
+        older than soft_ttl it is still served while a single background
+        task rebuilds it; only a cold cache makes the caller wait.
+        """
+        async def load_entry():
+            return await loader(), time.time()
+
+        key = await self._cache_key(key)
+        value, computed_at = await self._cached_as(key, load_entry)
+        age = max(0.0, time.time() - computed_at)
+        if age >= soft_ttl and self._cache is not None and key not in self._refreshing:
+            self._refreshing[key] = asyncio.create_task(self._refresh(key, load_entry))
+        return value, age
+
+    async def _refresh(self, key: str, load_entry: Callable[[], Awaitable[Any]]) -> None:
+        """Rebuild one cached entry in the background"""
+        try:
+            entry = await self._single_flight.do(key, load_entry)
+            await self._cache.set(key, entry)
+        except Exception as e:
+            logger.warning(f"Background refresh of {key} failed: {e}")
+        finally:
+            self._refreshing.pop(key, None)
+
+    async def warm_up(self, top_movies: int = 50, page_limit: int = 10, concurrency: int = 4) -> Dict[str, int]:
+        """
+        Precompute the hot responses into the cache: genres, statistics,
+        page 1 of the main listings and the detail pages of the top_movies
+        most popular movies. A response that fails is skipped; failures are
+        logged as one summary line (details at DEBUG).
+        Returns how many responses were built and how many failed.
+        """
+        failures: Dict[str, str] = {}
+
+        async def warm(name: str, loader: Callable[[], Awaitable[Any]]) -> bool:
+            try:
+                await loader()
+                return True
+            except Exception as e:
+                failures[name] = type(e).__name__
+                logger.debug(f"Warm-up of {name} failed", exc_info=True)
+                return False
+
+        results = list(await asyncio.gather(
+            warm("genres", self.get_all_genres),
+            warm("statistics", self.get_movie_statistics),
+            warm("movies page 1", lambda: self.get_movies(page=1, limit=page_limit)),
+            warm("popular page 1", lambda: self.get_popular_movies(page=1, limit=page_limit)),
+            warm("highly rated page 1", lambda: self.get_highly_rated_movies(page=1, limit=page_limit))
+        ))
+
+        movie_ids: List[str] = []
+        page = 1
+        while len(movie_ids) < top_movies:
+            try:
+                popular = await self.get_popular_movies(page=page, limit=min(100, top_movies))
+            except Exception as e:
+                failures[f"popular movies page {page}"] = type(e).__name__
+                logger.debug(f"Warm-up could not list popular movies (page {page})", exc_info=True)
+                results.append(False)
+                break
+            movie_ids.extend(movie.movieId for movie in popular.data)
+            if not popular.pagination.has_next:
+                break
+            page += 1
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def warm_detail(movie_id: str) -> bool:
+            async with semaphore:
+                return await warm(f"movie {movie_id}", lambda: self.get_movie_by_id(movie_id))
+
+        results += await asyncio.gather(*(warm_detail(movie_id) for movie_id in movie_ids[:top_movies]))
+        warmed = sum(results)
+        if failures:
+            examples = ", ".join(f"{name} ({error})" for name, error in list(failures.items())[:5])
+            more = f" and {len(failures) - 5} more" if len(failures) > 5 else ""
+            logger.warning(f"Warm-up: {len(failures)} of {len(results)} responses failed: {examples}{more}")
+        return {"responses": warmed, "failed": len(results) - warmed}
+
+    async def get_movies(
+        self, 
+        page: int = 1, 
+        limit: int = 10, 
+        cursor: Optional[str] = None,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResponseDto:
         """
         Get all movies with pagination
         """
-        pagination = PaginationParams(page=page, limit=limit)
-        result = await self._movie_repository.find_all(pagination)
-        return MovieMapper.to_paginated_response(result)
+        async def load():
+            pagination = PaginationParams(page=page, limit=limit, cursor=cursor)
+            result = await self._movie_repository.find_all(pagination, MovieMapper.summary_attributes(fields))
+            return MovieMapper.to_paginated_response(result)
+
+        return await self._cached(f"movies_data:all:{page}:{limit}:{cursor}{self._fields_key(fields)}", load)
     
     async def create_movie(self, movie_dto: MovieCreateDto) -> MovieDto:
         """
@@ -46,6 +289,11 @@ class MovieUseCase:
         movie_entity = MovieMapper.from_create_dto(movie_dto)
         # Create movie in repository
         created_movie = await self._movie_repository.create(movie_entity)
+        # Every cached list, count and statistic may now be stale
+        if self._cache is not None:
+            await self._cache.clear()
+        self._json_fragments.invalidate(created_movie.movieId)
+        await self.load_catalog_version()
         # Convert back to DTO for response
         return MovieMapper.to_dto(created_movie)
 
@@ -53,76 +301,180 @@ class MovieUseCase:
         """
         Get movie by ID with related movies
         """
-        movie = await self._movie_repository.find_by_id(movie_id)
-        if not movie:
-            return None
+        async def load():
+            movie = await self._movie_repository.find_by_id(movie_id)
+            if not movie:
+                return None
 
-        # Get related movies (same genres)
-        related_movies = await self._movie_repository.find_related_movies(movie, limit=5)
+            # Get related movies (same genres)
+            related_movies = await self._movie_repository.find_related_movies(movie, limit=5)
         
-        return MovieMapper.to_detail_response(movie, related_movies)
+            return MovieMapper.to_detail_response(movie, related_movies)
+
+        return await self._cached(f"movie_detail:{movie_id}", load)
 
-    async def search_movies(self, search_request: SearchRequestDto) -> PaginatedResponseDto:
+    async def get_movies_batch(self, batch_request: MovieBatchRequestDto) -> MovieBatchResponseDto:
         """
-        Search movies with criteria and pagination
+        Get many movies by movieId / IMDB ID / TMDB ID: one lookup per ID kind
+        and one related-movies read for all of them (raises BatchSizeError
+        when the batch is empty or too large)
         """
-        # Create search criteria from request
-        criteria = SearchCriteria(
+        requested = [
+            (kind, name, ids) for kind, name, ids in (
+                ("id", "movie_ids", batch_request.movie_ids),
+                ("imdb", "imdb_ids", batch_request.imdb_ids),
+                ("tmdb", "tmdb_ids", batch_request.tmdb_ids),
+            ) if ids
+        ]
+        total = sum(len(ids) for _, _, ids in requested)
+        if not 0 < total <= MAX_BATCH_IDS:
+            raise BatchSizeError(f"A batch must ask for 1 to {MAX_BATCH_IDS} IDs, got {total}")
+
+        # Not cached itself, but its fragments must follow the data version
+        await self.check_catalog_version()
+        found = await asyncio.gather(*(
+            self._movie_repository.find_by_ids(ids, kind) for kind, _, ids in requested
+        ))
+
+        movies: List[Movie] = []
+        missing = MovieBatchMissingDto()
+        for (_, name, ids), by_id in zip(requested, found):
+            for value in dict.fromkeys(ids):
+                if value in by_id:
+                    movies.append(by_id[value])
+                else:
+                    getattr(missing, name).append(value)
+
+        related = {}
+        if batch_request.include_related and movies:
+            related = await self._movie_repository.find_related_movies_for(movies, limit=5)
+
+        return MovieBatchResponseDto(
+            movies=[MovieMapper.to_detail_response(movie, related.get(movie.movieId, [])) for movie in movies],
+            missing=missing
+        )
+
+    @staticmethod
+    def _search_criteria(search_request: SearchRequestDto) -> SearchCriteria:
+        """Create search criteria from request (raises ValueError when invalid)"""
+        return SearchCriteria(
             title=search_request.title,
             genre=search_request.genre,
             year=search_request.year,
+            year_from=search_request.year_from,
+            year_to=search_request.year_to,
+            decade=search_request.decade,
             min_rating=search_request.min_rating,
-            max_rating=search_request.max_rating
+            max_rating=search_request.max_rating,
+            min_positive=search_request.min_positive
         )
 
+    async def search_movies(
+        self,
+        search_request: SearchRequestDto,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResponseDto:
+        """
+        Search movies with criteria and pagination
+        """
+        criteria = self._search_criteria(search_request)
+
         pagination = PaginationParams(
             page=search_request.page,
-            limit=search_request.limit
+            limit=search_request.limit,
+            cursor=search_request.cursor
         )
 
-        result = await self._movie_repository.search(criteria, pagination)
-        return MovieMapper.to_paginated_response(result)
+        async def load():
+            result = await self._movie_repository.search(criteria, pagination, MovieMapper.summary_attributes(fields))
+            return MovieMapper.to_paginated_response(result)
+
+        return await self._cached(f"search_results:{search_request.model_dump_json()}{self._fields_key(fields)}", load)
+
+    def export_movies(
+        self,
+        search_request: SearchRequestDto,
+        after_id: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Export records of the movies matching the search filters, in movieId
+        order, starting after after_id. Pagination fields are ignored and
+        nothing is cached. Invalid filters raise here, before streaming starts.
+        """
+        criteria = self._search_criteria(search_request)
+
+        async def records():
+            async for movie in self._movie_repository.iter_movies(criteria, after_id):
+                yield MovieMapper.to_export_record(movie)
+
+        return records()
 
     async def get_movies_by_genre(
         self, 
         genre: str, 
         page: int = 1, 
-        limit: int = 10
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[FrozenSet[str]] = None
     ) -> PaginatedResponseDto:
         """
         Get movies by genre with pagination
         """
-        pagination = PaginationParams(page=page, limit=limit)
-        result = await self._movie_repository.find_by_genre(genre, pagination)
-        return MovieMapper.to_paginated_response(result)
+        async def load():
+            pagination = PaginationParams(page=page, limit=limit, cursor=cursor)
+            result = await self._movie_repository.find_by_genre(genre, pagination, MovieMapper.summary_attributes(fields))
+            return MovieMapper.to_paginated_response(result)
 
-    async def get_popular_movies(self, page: int = 1, limit: int = 10) -> PaginatedResponseDto:
+        return await self._cached(f"movies_data:genre:{genre.lower().strip()}:{page}:{limit}:{cursor}{self._fields_key(fields)}", load)
+
+    async def get_popular_movies(
+        self,
+        page: int = 1,
+        limit: int = 10,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResponseDto:
         """
         Get popular movies (by ratings count) with pagination
         """
-        pagination = PaginationParams(page=page, limit=limit)
-        result = await self._movie_repository.find_popular(pagination)
-        return MovieMapper.to_paginated_response(result)
+        async def load():
+            pagination = PaginationParams(page=page, limit=limit)
+            result = await self._movie_repository.find_popular(pagination, MovieMapper.summary_attributes(fields))
+            return MovieMapper.to_paginated_response(result)
+
+        return await self._cached(f"movies_data:popular:{page}:{limit}{self._fields_key(fields)}", load)
 
     async def get_highly_rated_movies(
         self, 
         page: int = 1, 
-        limit: int = 10
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[FrozenSet[str]] = None
     ) -> PaginatedResponseDto:
         """
         Get highly rated movies with pagination
         """
-        pagination = PaginationParams(page=page, limit=limit)
-        result = await self._movie_repository.find_highly_rated(pagination)
-        return MovieMapper.to_paginated_response(result)
+        async def load():
+            pagination = PaginationParams(page=page, limit=limit, cursor=cursor)
+            result = await self._movie_repository.find_highly_rated(pagination, MovieMapper.summary_attributes(fields))
+            return MovieMapper.to_paginated_response(result)
+
+        return await self._cached(f"movies_data:highly_rated:{page}:{limit}:{cursor}{self._fields_key(fields)}", load)
 
-    async def get_recent_movies(self, page: int = 1, limit: int = 10) -> PaginatedResponseDto:
+    async def get_recent_movies(
+        self,
+        page: int = 1,
+        limit: int = 10,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResponseDto:
         """
         Get recent movies with pagination
         """
-        pagination = PaginationParams(page=page, limit=limit)
-        result = await self._movie_repository.find_recent(pagination)
-        return MovieMapper.to_paginated_response(result)
+        async def load():
+            pagination = PaginationParams(page=page, limit=limit)
+            result = await self._movie_repository.find_recent(pagination, MovieMapper.summary_attributes(fields))
+            return MovieMapper.to_paginated_response(result)
+
+        return await self._cached(f"movies_data:recent:{page}:{limit}{self._fields_key(fields)}", load)
 
     async def increment_movie_views(self, movie_id: str) -> Optional[Movie]:
         """
@@ -134,73 +486,98 @@ class MovieUseCase:
         """
         Get all available genres
         """
-        genres = await self._movie_repository.find_all_genres()
-        genre_dtos = GenreMapper.to_dto_list(genres)
+        async def load():
+            genres = await self._movie_repository.find_all_genres()
+            genre_dtos = GenreMapper.to_dto_list(genres)
         
-        return GenreListResponseDto(
-            genres=genre_dtos,
-            total=len(genre_dtos)
-        )
+            return GenreListResponseDto(
+                genres=genre_dtos,
+                total=len(genre_dtos)
+            )
+
+        return await self._cached("genres_list:all", load)
 
     async def get_movie_statistics(self) -> dict:
         """
         Get movie statistics
         """
-        total_movies = await self._movie_repository.get_total_count()
-        genres = await self._movie_repository.find_all_genres()
+        statistics, _ = await self.get_movie_statistics_with_age()
+        return statistics
+
+    async def get_movie_statistics_with_age(self) -> Tuple[dict, float]:
+        """
+        Get movie statistics and their age in seconds. Statistics older than
+        statistics_soft_ttl are served while they are rebuilt in the background.
+        """
+        async def load():
+            total_movies = await self._movie_repository.get_total_count()
+            genres = await self._movie_repository.find_all_genres()
         
-        # Get some popular movies for stats
-        popular_result = await self._movie_repository.find_popular(
-            PaginationParams(page=1, limit=5)
-        )
+            # Get some popular movies for stats
+            popular_result = await self._movie_repository.find_popular(
+                PaginationParams(page=1, limit=5), MovieMapper.summary_attributes()
+            )
         
-        # Get highly rated movies for stats
-        rated_result = await self._movie_repository.find_highly_rated(
-            PaginationParams(page=1, limit=5)
-        )
+            # Get highly rated movies for stats
+            rated_result = await self._movie_repository.find_highly_rated(
+                PaginationParams(page=1, limit=5), MovieMapper.summary_attributes()
+            )
+
+            return {
+                "total_movies": total_movies,
+                "total_genres": len(genres),
+                "most_popular": MovieMapper.to_summary_dto_list(popular_result.data),
+                "highest_rated": MovieMapper.to_summary_dto_list(rated_result.data)
+            }
 
-        return {
-            "total_movies": total_movies,
-            "total_genres": len(genres),
-            "most_popular": MovieMapper.to_summary_dto_list(popular_result.data),
-            "highest_rated": MovieMapper.to_summary_dto_list(rated_result.data)
-        }
+        return await self._cached_stale_while_revalidate("statistics:overview", load, self.statistics_soft_ttl)
 
     async def get_movies_by_tag(
         self, 
         tag: str, 
         page: int = 1, 
-        limit: int = 10
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        fields: Optional[FrozenSet[str]] = None
     ) -> PaginatedResponseDto:
         """
         Get movies by tag with pagination
         """
-        pagination = PaginationParams(page=page, limit=limit)
-        result = await self._movie_repository.find_by_tag(tag, pagination)
-        return MovieMapper.to_paginated_response(result)
+        async def load():
+            pagination = PaginationParams(page=page, limit=limit, cursor=cursor)
+            result = await self._movie_repository.find_by_tag(tag, pagination, MovieMapper.summary_attributes(fields))
+            return MovieMapper.to_paginated_response(result)
+
+        return await self._cached(f"movies_data:tag:{tag.strip().casefold()}:{page}:{limit}:{cursor}{self._fields_key(fields)}", load)
 
     async def get_movie_by_imdb_id(self, imdb_id: str) -> Optional[MovieDetailResponseDto]:
         """
         Get movie by IMDB ID with related movies
         """
-        movie = await self._movie_repository.find_by_imdb_id(imdb_id)
-        if not movie:
-            return None
+        async def load():
+            movie = await self._movie_repository.find_by_imdb_id(imdb_id)
+            if not movie:
+                return None
 
-        # Get related movies (same genres)
-        related_movies = await self._movie_repository.find_related_movies(movie, limit=5)
+            # Get related movies (same genres)
+            related_movies = await self._movie_repository.find_related_movies(movie, limit=5)
         
-        return MovieMapper.to_detail_response(movie, related_movies)
+            return MovieMapper.to_detail_response(movie, related_movies)
+
+        return await self._cached(f"movie_detail:imdb:{imdb_id}", load)
 
     async def get_movie_by_tmdb_id(self, tmdb_id: str) -> Optional[MovieDetailResponseDto]:
         """
         Get movie by TMDB ID with related movies
         """
-        movie = await self._movie_repository.find_by_tmdb_id(tmdb_id)
-        if not movie:
-            return None
+        async def load():
+            movie = await self._movie_repository.find_by_tmdb_id(tmdb_id)
+            if not movie:
+                return None
 
-        # Get related movies (same genres)
-        related_movies = await self._movie_repository.find_related_movies(movie, limit=5)
+            # Get related movies (same genres)
+            related_movies = await self._movie_repository.find_related_movies(movie, limit=5)
         
-        return MovieMapper.to_detail_response(movie, related_movies) 
\ No newline at end of file
+            return MovieMapper.to_detail_response(movie, related_movies)
+
+        return await self._cached(f"movie_detail:tmdb:{tmdb_id}", load) 
\ No newline at end of file
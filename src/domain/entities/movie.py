@@ -3,8 +3,12 @@ Movie Entity - Domain Model
 Represents the core movie business entity with all its properties and behaviors
 """
 from datetime import datetime
-from typing import List
-from dataclasses import dataclass
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+import re
+
+# Release year as MovieLens encodes it: "Toy Story (1995)"
+RELEASE_YEAR_PATTERN = re.compile(r'\((\d{4})\)\s*$')
 
 
 @dataclass(frozen=True)
@@ -30,11 +34,28 @@ class Movie:
     latest_rating: str
     earliest_tag: str
     latest_tag: str
+    release_year: Optional[int] = None
+    # Percentages precomputed from the histogram at import; None means
+    # "not stored / not loaded" and the get_* methods compute them instead
+    positive_rating_percentage: Optional[float] = field(default=None, compare=False, repr=False)
+    negative_rating_percentage: Optional[float] = field(default=None, compare=False, repr=False)
+    rating_distribution: Optional[Dict[str, float]] = field(default=None, compare=False, repr=False)
 
     def __post_init__(self):
         """Domain validation rules"""
         self._validate()
 
+    @classmethod
+    def from_trusted(cls, **fields) -> "Movie":
+        """
+        Build a Movie from data that already passed validation when it was
+        stored (repository reads). Skips __post_init__; every field without a
+        default must be given.
+        """
+        movie = object.__new__(cls)
+        movie.__dict__.update(fields)
+        return movie
+
     def _validate(self) -> None:
         """Validate domain rules"""
         if not self.movieId or not self.movieId.strip():
@@ -68,6 +89,29 @@ class Movie:
         if total_ratings != self.ratings_count:
             raise ValueError("Rating breakdown does not match total ratings count")
 
+    @staticmethod
+    def normalize_external_id(value) -> str:
+        """
+        Business logic: String form of an IMDB/TMDB ID, whatever type it was
+        stored as ("" when missing; 862, 862.0 and "862" all become "862")
+        """
+        if value is None:
+            return ""
+        text = str(value).strip()
+        try:
+            number = float(text)
+        except ValueError:
+            return text
+        if number != number:  # NaN, a missing value read through pandas
+            return ""
+        return str(int(number)) if number.is_integer() else text
+
+    @staticmethod
+    def parse_release_year(title: str) -> Optional[int]:
+        """Business logic: Extract the release year from a title ending in (YYYY)"""
+        match = RELEASE_YEAR_PATTERN.search(title or "")
+        return int(match.group(1)) if match else None
+
     def is_highly_rated(self) -> bool:
         """Business logic: Check if movie is highly rated"""
         return self.average_rating >= 4.0
@@ -82,6 +126,8 @@ class Movie:
 
     def get_positive_rating_percentage(self) -> float:
         """Business logic: Calculate percentage of positive ratings (3-5 stars)"""
+        if self.positive_rating_percentage is not None:
+            return self.positive_rating_percentage
         if self.ratings_count == 0:
             return 0.0
         
@@ -93,6 +139,8 @@ class Movie:
 
     def get_negative_rating_percentage(self) -> float:
         """Business logic: Calculate percentage of negative ratings (1-2 stars)"""
+        if self.negative_rating_percentage is not None:
+            return self.negative_rating_percentage
         if self.ratings_count == 0:
             return 0.0
         
@@ -104,6 +152,8 @@ class Movie:
 
     def get_rating_distribution(self) -> dict:
         """Business logic: Get rating distribution as percentages"""
+        if self.rating_distribution is not None:
+            return dict(self.rating_distribution)
         if self.ratings_count == 0:
             return {
                 "0-1": 0.0,
@@ -3,7 +3,7 @@ Movie Repository Interface - Domain Layer
 Defines the contract for movie data access without implementation details
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, Dict, FrozenSet, List, Optional, Sequence
 
 from ..entities.movie import Movie
 from ..entities.genre import Genre
@@ -15,10 +15,18 @@ class IMovieRepository(ABC):
     """
     Movie Repository Interface - Domain Layer
     Defines the contract for movie data access without implementation details
+
+    List methods take optional `fields`: the Movie attributes the caller
+    needs. Implementations may load only those (and movieId); the others
+    keep empty defaults. None loads every attribute.
     """
 
     @abstractmethod
-    async def find_all(self, pagination: PaginationParams) -> PaginatedResult[Movie]:
+    async def find_all(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
         """Get all movies with pagination"""
         pass
 
@@ -27,20 +35,40 @@ class IMovieRepository(ABC):
         """Find movie by ID"""
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, ids: Sequence[str], kind: str = "id") -> Dict[str, Movie]:
+        """
+        Find many movies by one kind of ID ("id" = movieId, "imdb" or "tmdb").
+        Returns the found movies keyed by the requested ID; misses are left out.
+        """
+        pass
+
     @abstractmethod
     async def search(
         self, 
         criteria: SearchCriteria, 
-        pagination: PaginationParams
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
     ) -> PaginatedResult[Movie]:
         """Search movies with criteria and pagination"""
         pass
 
+    @abstractmethod
+    def iter_movies(
+        self,
+        criteria: SearchCriteria,
+        after_id: Optional[int] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[Movie]:
+        """Stream movies matching criteria in movieId order, starting after after_id (async generator)"""
+        pass
+
     @abstractmethod
     async def find_by_genre(
         self, 
         genre: str, 
-        pagination: PaginationParams
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
     ) -> PaginatedResult[Movie]:
         """Get movies by genre with pagination"""
         pass
@@ -51,17 +79,29 @@ class IMovieRepository(ABC):
         pass
 
     @abstractmethod
-    async def find_popular(self, pagination: PaginationParams) -> PaginatedResult[Movie]:
+    async def find_popular(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
         """Get popular movies (by views) with pagination"""
         pass
 
     @abstractmethod
-    async def find_highly_rated(self, pagination: PaginationParams) -> PaginatedResult[Movie]:
+    async def find_highly_rated(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
         """Get highly rated movies with pagination"""
         pass
 
     @abstractmethod
-    async def find_recent(self, pagination: PaginationParams) -> PaginatedResult[Movie]:
+    async def find_recent(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
         """Get recent movies with pagination"""
         pass
 
@@ -80,7 +120,19 @@ class IMovieRepository(ABC):
         """Find movies related to the given movie (same genres)"""
         pass 
 
+    async def find_related_movies_for(self, movies: List[Movie], limit: int = 5) -> Dict[str, List[Movie]]:
+        """Related movies of several movies, keyed by movieId"""
+        return {movie.movieId: await self.find_related_movies(movie, limit) for movie in movies}
+
     @abstractmethod
     async def create(self, movie: Movie) -> Movie:
         """Create a new movie"""
-        pass
\ No newline at end of file
+        pass
+
+    async def get_data_version(self) -> int:
+        """
+        Counter that changes whenever the data this repository serves
+        changes, including writes by other processes where the backend can
+        see them. Callers poll it to drop what they derived from older data.
+        """
+        return 0
\ No newline at end of file
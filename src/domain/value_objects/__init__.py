@@ -1,5 +1,5 @@
 """Domain Value Objects Package"""
-from .pagination import PaginationParams, PaginatedResult
+from .pagination import PaginationParams, PaginatedResult, PageCursor
 from .search_criteria import SearchCriteria
 
-__all__ = ["PaginationParams", "PaginatedResult", "SearchCriteria"] 
\ No newline at end of file
+__all__ = ["PaginationParams", "PaginatedResult", "PageCursor", "SearchCriteria"] 
\ No newline at end of file
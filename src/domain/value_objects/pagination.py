@@ -2,8 +2,11 @@
 Pagination Value Objects - Domain Layer
 Contains pagination-related value objects
 """
+import base64
+import binascii
+import json
 from dataclasses import dataclass
-from typing import Generic, TypeVar, List
+from typing import Generic, TypeVar, List, Optional, Tuple, Any
 
 T = TypeVar('T')
 
@@ -12,10 +15,13 @@ T = TypeVar('T')
 class PaginationParams:
     """
     PaginationParams Value Object
-    Represents pagination parameters with validation
+    Represents pagination parameters with validation.
+    When cursor is set the page number is ignored and results continue
+    right after the row the cursor was issued for (keyset pagination).
     """
     page: int
     limit: int
+    cursor: Optional[str] = None
 
     def __post_init__(self):
         """Validation rules for pagination parameters"""
@@ -33,6 +39,11 @@ class PaginationParams:
         """Calculate offset for database queries"""
         return (self.page - 1) * self.limit
 
+    @property
+    def is_keyset(self) -> bool:
+        """Check if results should continue from a cursor instead of an offset"""
+        return self.cursor is not None
+
     def is_first_page(self) -> bool:
         """Check if this is the first page"""
         return self.page == 1
@@ -48,6 +59,35 @@ class PaginationParams:
         return PaginationParams(page=self.page - 1, limit=self.limit)
 
 
+@dataclass(frozen=True)
+class PageCursor:
+    """
+    PageCursor Value Object
+    Sort key values of the last row on a page, tagged with the sort order
+    they belong to. Clients only ever see the opaque encoded token.
+    """
+    sort: str
+    values: Tuple[Any, ...]
+
+    def encode(self) -> str:
+        """Encode as an opaque URL-safe token"""
+        payload = json.dumps([self.sort, list(self.values)], separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, token: str, sort: str) -> 'PageCursor':
+        """Decode a token, rejecting malformed ones and ones issued for another sort order"""
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            cursor_sort, values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (ValueError, TypeError, binascii.Error):
+            raise ValueError("Invalid pagination cursor")
+
+        if cursor_sort != sort or not isinstance(values, list) or not values:
+            raise ValueError("Pagination cursor does not belong to this listing")
+        return cls(sort=sort, values=tuple(values))
+
+
 @dataclass(frozen=True)
 class PaginatedResult(Generic[T]):
     """
@@ -58,6 +98,8 @@ class PaginatedResult(Generic[T]):
     total: int
     page: int
     limit: int
+    cursor: Optional[str] = None
+    next_cursor: Optional[str] = None
 
     @property
     def total_pages(self) -> int:
@@ -67,12 +109,14 @@ class PaginatedResult(Generic[T]):
     @property
     def has_next(self) -> bool:
         """Check if there is a next page"""
+        if self.cursor is not None:
+            return self.next_cursor is not None
         return self.page < self.total_pages
 
     @property
     def has_previous(self) -> bool:
         """Check if there is a previous page"""
-        return self.page > 1
+        return self.cursor is not None or self.page > 1
 
     @property
     def start_index(self) -> int:
@@ -3,7 +3,7 @@ SearchCriteria Value Object - Domain Layer
 Represents search criteria for movies with validation
 """
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime
 
 
@@ -16,8 +16,12 @@ class SearchCriteria:
     title: Optional[str] = None
     genre: Optional[str] = None
     year: Optional[int] = None
+    year_from: Optional[int] = None
+    year_to: Optional[int] = None
+    decade: Optional[int] = None
     min_rating: Optional[float] = None
     max_rating: Optional[float] = None
+    min_positive: Optional[float] = None  # Minimum positive_rating_percentage (0-100)
     country: Optional[str] = None
     language: Optional[str] = None
     status: Optional[str] = None
@@ -32,8 +36,17 @@ class SearchCriteria:
             raise ValueError("Title search term cannot be empty")
 
         current_year = datetime.now().year
-        if self.year is not None and (self.year < 1888 or self.year > current_year + 5):
-            raise ValueError(f"Invalid year for search: {self.year}")
+        for year in (self.year, self.year_from, self.year_to):
+            if year is not None and (year < 1888 or year > current_year + 5):
+                raise ValueError(f"Invalid year for search: {year}")
+
+        if (self.year_from is not None and
+            self.year_to is not None and
+            self.year_from > self.year_to):
+            raise ValueError("Start year cannot be greater than end year")
+
+        if self.decade is not None and (self.decade % 10 != 0 or not (1880 <= self.decade <= current_year)):
+            raise ValueError(f"Invalid decade for search: {self.decade}")
 
         if self.min_rating is not None and not (0 <= self.min_rating <= 5):
             raise ValueError("Minimum rating must be between 0 and 5")
@@ -46,10 +59,14 @@ class SearchCriteria:
             self.min_rating > self.max_rating):
             raise ValueError("Minimum rating cannot be greater than maximum rating")
 
+        if self.min_positive is not None and not (0 <= self.min_positive <= 100):
+            raise ValueError("Minimum positive rating percentage must be between 0 and 100")
+
     def is_empty(self) -> bool:
         """Check if search criteria is empty"""
         return all(value is None for value in [
-            self.title, self.genre, self.year, self.min_rating, self.max_rating,
+            self.title, self.genre, self.year, self.year_from, self.year_to, self.decade,
+            self.min_rating, self.max_rating, self.min_positive,
             self.country, self.language, self.status
         ])
 
@@ -65,6 +82,18 @@ class SearchCriteria:
         """Check if has genre filter"""
         return self.genre is not None and self.genre.strip()
 
+    def has_year_filter(self) -> bool:
+        """Check if has exact year, year range or decade filter"""
+        return any(value is not None for value in [self.year, self.year_from, self.year_to, self.decade])
+
+    def get_year_range(self) -> Tuple[Optional[int], Optional[int]]:
+        """Get the inclusive (start, end) release year bounds implied by all year filters"""
+        lower_bounds = [self.year, self.year_from, self.decade]
+        upper_bounds = [self.year, self.year_to, self.decade + 9 if self.decade is not None else None]
+        start = max((y for y in lower_bounds if y is not None), default=None)
+        end = min((y for y in upper_bounds if y is not None), default=None)
+        return start, end
+
     def has_rating_filter(self) -> bool:
         """Check if has rating range filter"""
         return self.min_rating is not None or self.max_rating is not None
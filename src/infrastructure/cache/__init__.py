@@ -0,0 +1,13 @@
+"""
+Cache Module - Infrastructure Layer
+In-process caching for use case results, optionally shared through Redis
+"""
+from .cache_manager import CacheManager, cache_manager, get_cache_manager
+from .two_tier_cache import TwoTierCache, create_two_tier_cache
+from .bloom_filter import BloomFilter
+
+__all__ = [
+    "CacheManager", "cache_manager", "get_cache_manager",
+    "TwoTierCache", "create_two_tier_cache",
+    "BloomFilter"
+]
@@ -0,0 +1,68 @@
+"""
+Bloom Filter - Infrastructure Layer
+Compact set membership test with no false negatives
+"""
+import hashlib
+import math
+from typing import Any, Dict, Iterable, Iterator
+
+
+class BloomFilter:
+    """
+    Bloom Filter
+    "item in bloom" is False only for items never added, and True for
+    other items with probability about error_rate at the sized capacity.
+    Bit positions use double hashing over one 128-bit BLAKE2b digest.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    @classmethod
+    def from_items(cls, items: Iterable[str], capacity: int, error_rate: float = 0.01) -> "BloomFilter":
+        """Build a filter sized for capacity and add items"""
+        bloom = cls(capacity, error_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> None:
+        """Add an item"""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def is_full(self) -> bool:
+        """More items than it was sized for (false positives above error_rate)"""
+        return self._count > self.capacity
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get filter statistics"""
+        fill = 1 - math.exp(-self.num_hashes * self._count / self.num_bits)
+        return {
+            "items": self._count,
+            "capacity": self.capacity,
+            "bits": self.num_bits,
+            "hashes": self.num_hashes,
+            "estimated_false_positive_rate": round(fill ** self.num_hashes, 6)
+        }
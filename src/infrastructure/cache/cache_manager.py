@@ -0,0 +1,146 @@
+"""
+Cache Manager - Infrastructure Layer
+Bounded in-memory LRU cache with per-namespace TTLs
+"""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from infrastructure.config.performance_config import PerformanceConfig
+
+
+@dataclass
+class CacheEntry:
+    """A cached value and when it stops being valid"""
+    value: Any
+    created_at: float
+    expires_at: float
+
+
+class CacheManager:
+    """
+    Cache Manager
+    Keys are "<namespace>:<identity>", e.g. "movie_detail:42". The namespace
+    selects the TTL from PerformanceConfig.CACHE_TTL; once max_size entries
+    are stored the least recently used one is evicted.
+    """
+
+    def __init__(
+        self,
+        max_size: int = PerformanceConfig.MEMORY_CACHE["max_size"],
+        cleanup_interval: int = PerformanceConfig.MEMORY_CACHE["cleanup_interval"]
+    ):
+        self.max_size = max_size
+        self.cleanup_interval = cleanup_interval
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._last_cleanup = time.monotonic()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def namespace_of(key: str) -> str:
+        """Namespace part of a cache key"""
+        return key.split(":", 1)[0]
+
+    def ttl_for(self, key: str) -> int:
+        """TTL in seconds for a key, from its namespace"""
+        return PerformanceConfig.get_cache_ttl(self.namespace_of(key))
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value, or None when missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.value
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value; ttl defaults to the key namespace's TTL"""
+        now = time.monotonic()
+        if now - self._last_cleanup >= self.cleanup_interval:
+            self._purge_expired(now)
+
+        self._entries[key] = CacheEntry(
+            value=value,
+            created_at=now,
+            expires_at=now + (ttl if ttl is not None else self.ttl_for(key))
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None
+    ) -> Any:
+        """Return the cached value or await loader() and cache its result (None is not cached)"""
+        value = await self.get(key)
+        if value is None:
+            value = await loader()
+            if value is not None:
+                await self.set(key, value, ttl)
+        return value
+
+    async def delete(self, key: str) -> None:
+        """Remove one key"""
+        self._entries.pop(key, None)
+
+    async def clear(self, namespace: Optional[str] = None) -> None:
+        """Remove every key, or only the keys of one namespace"""
+        if namespace is None:
+            self._entries.clear()
+            return
+        prefix = f"{namespace}:"
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
+
+    def _purge_expired(self, now: float) -> None:
+        """Drop expired entries that were never read again"""
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        self._expirations += len(expired)
+        self._last_cleanup = now
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self._hits + self._misses
+        namespaces: Dict[str, int] = {}
+        for key in self._entries:
+            namespace = self.namespace_of(key)
+            namespaces[namespace] = namespaces.get(namespace, 0) + 1
+
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "entries_by_namespace": namespaces
+        }
+
+
+# Global cache manager
+cache_manager = CacheManager()
+
+
+async def get_cache_manager() -> CacheManager:
+    """Get the process-wide cache manager"""
+    return cache_manager
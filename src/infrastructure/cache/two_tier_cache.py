@@ -0,0 +1,223 @@
+"""
+Two-Tier Cache - Infrastructure Layer
+Small in-process L1 in front of a shared Redis-protocol L2, so every API
+instance and worker reuses what any one of them has already computed
+"""
+import logging
+import pickle
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from infrastructure.config.performance_config import PerformanceConfig
+from infrastructure.cache.cache_manager import CacheManager
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis is optional - without it the L1 works alone
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_VERSION = "*"
+
+
+class TwoTierCache:
+    """
+    Two-Tier Cache
+    Same interface as CacheManager. Every key is stored under the current
+    version of its namespace ("<key>@<global>.<namespace version>", with
+    key_prefix in front in L2).
+    clear() only INCRs a version counter in L2: every instance then misses
+    the old keys and they expire on their own. Each instance re-reads the
+    version counters at most every version_check_interval seconds, which
+    bounds how long its L1 can serve an invalidated value.
+
+    Values are pickled, so L2 must be a server only this API writes to.
+    schema_version goes into the key prefix: instances running code with
+    other DTO classes never unpickle each other's values.
+    When L2 fails the cache keeps working from L1 and retries L2 after
+    retry_interval seconds.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        l1: Optional[CacheManager] = None,
+        key_prefix: str = PerformanceConfig.REDIS["key_prefix"],
+        schema_version: Optional[str] = None,
+        l1_ttl: int = PerformanceConfig.REDIS["l1_ttl"],
+        version_check_interval: float = PerformanceConfig.REDIS["version_check_interval"],
+        retry_interval: float = PerformanceConfig.REDIS["retry_interval"]
+    ):
+        self._client = client
+        self.l1 = l1 or CacheManager(max_size=PerformanceConfig.REDIS["l1_max_size"])
+        self.key_prefix = f"{key_prefix}:{schema_version}" if schema_version else key_prefix
+        self.l1_ttl = l1_ttl
+        self.version_check_interval = version_check_interval
+        self.retry_interval = retry_interval
+
+        self._versions: Dict[str, int] = {}
+        self._versions_checked_at = 0.0
+        self._unavailable_until = 0.0
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    def _version_key(self, namespace: str) -> str:
+        """L2 key holding the version counter of a namespace"""
+        return f"{self.key_prefix}:version:{namespace}"
+
+    def _versioned(self, key: str) -> str:
+        """Key bound to the current versions, as stored in L1"""
+        namespace = CacheManager.namespace_of(key)
+        return f"{key}@{self._versions.get(GLOBAL_VERSION, 0)}.{self._versions.get(namespace, 0)}"
+
+    def _l2_key(self, versioned: str) -> str:
+        """Key as stored in L2"""
+        return f"{self.key_prefix}:{versioned}"
+
+    def _l2_available(self) -> bool:
+        return time.monotonic() >= self._unavailable_until
+
+    def _l2_failed(self, operation: str, error: Exception) -> None:
+        """Record an L2 failure and stop using L2 for retry_interval seconds"""
+        self._errors += 1
+        self._unavailable_until = time.monotonic() + self.retry_interval
+        logger.warning(f"L2 cache {operation} failed, using L1 only for {self.retry_interval}s: {error}")
+
+    async def _refresh_versions(self) -> None:
+        """Re-read the version counters when the last check is too old"""
+        now = time.monotonic()
+        if now - self._versions_checked_at < self.version_check_interval or not self._l2_available():
+            return
+        self._versions_checked_at = now
+
+        namespaces = [GLOBAL_VERSION, *PerformanceConfig.CACHE_TTL]
+        try:
+            values = await self._client.mget([self._version_key(ns) for ns in namespaces])
+        except Exception as e:
+            self._l2_failed("version check", e)
+            return
+
+        versions = {ns: int(v) if v is not None else 0 for ns, v in zip(namespaces, values)}
+        if versions != self._versions:
+            # Entries under the old versions can never be hit again
+            if self._versions:
+                await self.l1.clear()
+            self._versions = versions
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value from L1, then L2 (filling L1 on an L2 hit)"""
+        await self._refresh_versions()
+        versioned = self._versioned(key)
+
+        value = await self.l1.get(versioned)
+        if value is not None or not self._l2_available():
+            return value
+
+        try:
+            raw = await self._client.get(self._l2_key(versioned))
+        except Exception as e:
+            self._l2_failed("get", e)
+            return None
+
+        if raw is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        value = pickle.loads(raw)
+        await self.l1.set(versioned, value, ttl=min(self.l1_ttl, self.l1.ttl_for(key)))
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value in both tiers"""
+        await self._refresh_versions()
+        versioned = self._versioned(key)
+        ttl = ttl if ttl is not None else self.l1.ttl_for(key)
+
+        await self.l1.set(versioned, value, ttl=min(self.l1_ttl, ttl))
+        if not self._l2_available():
+            return
+        try:
+            await self._client.set(self._l2_key(versioned), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ex=ttl)
+        except Exception as e:
+            self._l2_failed("set", e)
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None
+    ) -> Any:
+        """Return the cached value or await loader() and cache its result (None is not cached)"""
+        value = await self.get(key)
+        if value is None:
+            value = await loader()
+            if value is not None:
+                await self.set(key, value, ttl)
+        return value
+
+    async def delete(self, key: str) -> None:
+        """Remove one key from both tiers"""
+        versioned = self._versioned(key)
+        await self.l1.delete(versioned)
+        if not self._l2_available():
+            return
+        try:
+            await self._client.delete(self._l2_key(versioned))
+        except Exception as e:
+            self._l2_failed("delete", e)
+
+    async def clear(self, namespace: Optional[str] = None) -> None:
+        """Invalidate every key, or one namespace, on all instances"""
+        scope = namespace or GLOBAL_VERSION
+        await self.l1.clear()
+        if self._l2_available():
+            try:
+                self._versions[scope] = int(await self._client.incr(self._version_key(scope)))
+                return
+            except Exception as e:
+                self._l2_failed("invalidate", e)
+        # L2 unreachable: at least stop this instance from reading the old keys
+        self._versions[scope] = self._versions.get(scope, 0) + 1
+
+    async def close(self) -> None:
+        """Close the L2 connection pool"""
+        try:
+            await self._client.close()
+        except Exception as e:
+            logger.warning(f"Error closing L2 cache client: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics for both tiers"""
+        lookups = self._hits + self._misses
+        return {
+            "l1": self.l1.get_stats(),
+            "l2": {
+                "backend": "redis",
+                "available": self._l2_available(),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "errors": self._errors,
+                "versions": {ns: v for ns, v in self._versions.items() if v}
+            }
+        }
+
+
+def create_two_tier_cache(
+    url: str = PerformanceConfig.REDIS["url"],
+    schema_version: Optional[str] = None
+) -> Optional[TwoTierCache]:
+    """Build a TwoTierCache for a Redis URL, or None when the redis package is missing"""
+    if aioredis is None:
+        logger.warning("redis package not installed - shared L2 cache disabled")
+        return None
+
+    client = aioredis.from_url(
+        url,
+        max_connections=PerformanceConfig.REDIS["max_connections"],
+        socket_timeout=PerformanceConfig.REDIS["socket_timeout"],
+        socket_connect_timeout=PerformanceConfig.REDIS["socket_connect_timeout"]
+    )
+    return TwoTierCache(client, schema_version=schema_version)
@@ -18,6 +18,11 @@ class PerformanceConfig:
         "total_count": 3600     # 1 hour
     }
     
+    # Soft TTLs: older entries are served while rebuilt in the background
+    STALE_WHILE_REVALIDATE = {
+        "statistics": 300  # 5 minutes (hard TTL: CACHE_TTL["statistics"])
+    }
+    
     # Rate limiting settings
     RATE_LIMITS = {
         "default": "100/minute",
@@ -56,6 +61,26 @@ class PerformanceConfig:
         ]
     }
     
+    # HTTP caching (ETag / Cache-Control) for catalog GET endpoints
+    HTTP_CACHE = {
+        "enabled": True,
+        "stale_while_revalidate_ratio": 0.5  # of the namespace TTL
+    }
+    
+    # Shared catalog data version behind ETags and response cache keys
+    CATALOG_VERSION = {
+        "check_interval": float(os.getenv("CATALOG_VERSION_CHECK_INTERVAL", "1"))  # seconds between re-reads
+    }
+    
+    # Startup cache warm-up (/ready answers 503 until it has finished)
+    WARMUP = {
+        "enabled": os.getenv("WARMUP_ENABLED", "true").lower() == "true",
+        "blocking": os.getenv("WARMUP_BLOCKING", "false").lower() == "true",  # finish before serving
+        "top_movies": int(os.getenv("WARMUP_TOP_MOVIES", "50")),  # detail pages to precompute
+        "page_limit": 10,    # page size of the precomputed listing pages
+        "concurrency": 4     # detail pages built at once
+    }
+    
     # Memory cache settings
     MEMORY_CACHE = {
         "max_size": 1000,
@@ -63,12 +88,18 @@ class PerformanceConfig:
         "cleanup_interval": 300
     }
     
-    # Redis settings
+    # Redis settings (shared L2 cache behind the in-process L1)
     REDIS = {
+        "enabled": os.getenv("CACHE_L2_ENABLED", "false").lower() == "true",
         "url": os.getenv("REDIS_URL", "redis://localhost:6379"),
         "max_connections": 10,
         "socket_timeout": 5,
-        "socket_connect_timeout": 2
+        "socket_connect_timeout": 2,
+        "key_prefix": os.getenv("CACHE_KEY_PREFIX", "movieapi:cache"),
+        "l1_max_size": 256,
+        "l1_ttl": 30,                 # seconds an instance may keep an L2 value locally
+        "version_check_interval": 1,  # seconds between invalidation checks
+        "retry_interval": 30          # seconds to skip L2 after a failure
     }
     
     @classmethod
@@ -76,6 +107,13 @@ class PerformanceConfig:
         """Get TTL for cache type"""
         return cls.CACHE_TTL.get(cache_type, 1800)
     
+    @classmethod
+    def get_cache_control(cls, cache_type: str) -> str:
+        """Cache-Control header value for responses of a cache type"""
+        ttl = cls.get_cache_ttl(cache_type)
+        stale = int(ttl * cls.HTTP_CACHE["stale_while_revalidate_ratio"])
+        return f"public, max-age={ttl}, stale-while-revalidate={stale}"
+    
     @classmethod
     def get_rate_limit(cls, endpoint_type: str) -> str:
         """Get rate limit for endpoint type"""
@@ -86,10 +124,14 @@ class PerformanceConfig:
         """Get all performance configuration"""
         return {
             "cache_ttl": cls.CACHE_TTL,
+            "stale_while_revalidate": cls.STALE_WHILE_REVALIDATE,
             "rate_limits": cls.RATE_LIMITS,
             "performance_thresholds": cls.PERFORMANCE_THRESHOLDS,
             "search_optimization": cls.SEARCH_OPTIMIZATION,
             "compression": cls.COMPRESSION,
+            "http_cache": cls.HTTP_CACHE,
+            "catalog_version": cls.CATALOG_VERSION,
+            "warmup": cls.WARMUP,
             "memory_cache": cls.MEMORY_CACHE,
             "redis": cls.REDIS
         } 
\ No newline at end of file
@@ -4,6 +4,9 @@ Contains database configuration and models
 """
 
 from .database import Database
-from .models import Base, UserModel, MovieModel
+from .models import Base, UserModel, MovieModel, GenreModel, MovieGenreModel, TagModel, MovieTagModel
 
-__all__ = ["Database", "Base", "UserModel", "MovieModel"] 
\ No newline at end of file
+__all__ = [
+    "Database", "Base", "UserModel", "MovieModel",
+    "GenreModel", "MovieGenreModel", "TagModel", "MovieTagModel"
+] 
\ No newline at end of file
@@ -2,7 +2,7 @@
 Database Models - Infrastructure Layer
 SQLAlchemy ORM models for database tables
 """
-from sqlalchemy import Column, String, Boolean, DateTime, Integer, Float, Text
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, Float, Text, ForeignKey, Index, DDL, event
 from sqlalchemy.sql import func
 from datetime import datetime
 from .database import Base
@@ -39,9 +39,121 @@ class MovieModel(Base):
     two_to_three_ratings_count = Column(Integer, nullable=True)
     three_to_four_ratings_count = Column(Integer, nullable=True)
     four_to_five_ratings_count = Column(Integer, nullable=True)
-    average_rating = Column(Float, nullable=True)
+    average_rating = Column(Float, nullable=True, index=True)  # Keyset pagination for highly rated
     tags = Column(Text, nullable=True)  # Pipe-separated tags
     earliest_rating = Column(String, nullable=True)
     latest_rating = Column(String, nullable=True)
     earliest_tag = Column(String, nullable=True)
     latest_tag = Column(String, nullable=True)
+    release_year = Column(Integer, nullable=True, index=True)  # Parsed from "Title (YYYY)" at import
+
+    # Rating percentages derived from the histogram at import (see database/catalog_indexes.py)
+    positive_rating_percentage = Column(Float, nullable=True, index=True)  # Filter / sort by share of 3-5 star ratings
+    negative_rating_percentage = Column(Float, nullable=True)
+    zero_to_one_ratings_percentage = Column(Float, nullable=True)
+    one_to_two_ratings_percentage = Column(Float, nullable=True)
+    two_to_three_ratings_percentage = Column(Float, nullable=True)
+    three_to_four_ratings_percentage = Column(Float, nullable=True)
+    four_to_five_ratings_percentage = Column(Float, nullable=True)
+
+
+# Full-text index over title and tags. FTS5 tables and their sync triggers
+# cannot be declared through the ORM, so they are attached to the movies table
+# lifecycle. unicode61 treats '|' as a separator, so the pipe-separated tags
+# column is indexed as-is; remove_diacritics folds "Amélie" to "amelie".
+MOVIES_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS movies_fts USING fts5(
+        title, tags, tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    # Title matches weigh 10x tag matches in bm25 ranking
+    "INSERT INTO movies_fts(movies_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)')",
+    """
+    CREATE TRIGGER IF NOT EXISTS movies_fts_ai AFTER INSERT ON movies BEGIN
+        INSERT INTO movies_fts(rowid, title, tags) VALUES (CAST(new.movieId AS INTEGER), new.title, new.tags);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS movies_fts_ad AFTER DELETE ON movies BEGIN
+        DELETE FROM movies_fts WHERE rowid = CAST(old.movieId AS INTEGER);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS movies_fts_au AFTER UPDATE OF movieId, title, tags ON movies BEGIN
+        DELETE FROM movies_fts WHERE rowid = CAST(old.movieId AS INTEGER);
+        INSERT INTO movies_fts(rowid, title, tags) VALUES (CAST(new.movieId AS INTEGER), new.title, new.tags);
+    END
+    """,
+]
+
+for _statement in MOVIES_FTS_DDL:
+    event.listen(MovieModel.__table__, "after_create", DDL(_statement))
+event.listen(MovieModel.__table__, "before_drop", DDL("DROP TABLE IF EXISTS movies_fts"))
+
+
+class GenreModel(Base):
+    """Genre dictionary model - one row per distinct genre"""
+    __tablename__ = "genres"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, nullable=False)
+    normalized_name = Column(String, unique=True, index=True, nullable=False)  # lower-cased, stripped
+
+
+class MovieGenreModel(Base):
+    """Movie <-> genre association model"""
+    __tablename__ = "movie_genres"
+
+    movie_id = Column(Integer, ForeignKey("movies.movieId"), primary_key=True)
+    genre_id = Column(Integer, ForeignKey("genres.id"), primary_key=True)
+    position = Column(Integer, nullable=False, default=0)  # Order in the original pipe-separated list
+
+    __table_args__ = (
+        # Genre -> movies lookups walk this index in movieId order
+        Index("ix_movie_genres_genre_movie", "genre_id", "movie_id"),
+    )
+
+
+class TagModel(Base):
+    """Tag dictionary model - one row per case-folded tag"""
+    __tablename__ = "tag_dictionary"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, nullable=False)
+    normalized_name = Column(String, unique=True, index=True, nullable=False)  # casefolded, stripped
+
+
+class MovieTagModel(Base):
+    """Movie <-> tag association model with how often the tag was applied"""
+    __tablename__ = "movie_tag_counts"
+
+    movie_id = Column(Integer, ForeignKey("movies.movieId"), primary_key=True)
+    tag_id = Column(Integer, ForeignKey("tag_dictionary.id"), primary_key=True)
+    tag_count = Column(Integer, nullable=False, default=1)
+
+    __table_args__ = (
+        # Covering index: tag -> movies by frequency without touching the table
+        Index("ix_movie_tag_counts_tag_count_movie", "tag_id", "tag_count", "movie_id"),
+    )
+
+
+class RelatedMovieModel(Base):
+    """Precomputed related movies, best first (built by database/catalog_indexes.py)"""
+    __tablename__ = "related_movies"
+
+    movie_id = Column(Integer, ForeignKey("movies.movieId"), primary_key=True)
+    rank = Column(Integer, primary_key=True)  # 1 = most related
+    related_movie_id = Column(Integer, ForeignKey("movies.movieId"), nullable=False)
+    score = Column(Float, nullable=False)
+
+    # Clustered on (movie_id, rank): one range read per detail page
+    __table_args__ = {"sqlite_with_rowid": False}
+
+
+class DataVersionModel(Base):
+    """Single-row counter of catalog writes, shared by every process using the database"""
+    __tablename__ = "data_version"
+
+    id = Column(Integer, primary_key=True)  # always 1
+    version = Column(Integer, nullable=False, default=0)  # bumped by creates and catalog builds
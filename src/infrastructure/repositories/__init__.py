@@ -3,12 +3,14 @@ Infrastructure Repositories Package
 Contains repository implementations for the movie streaming API
 """
 
+from .columnar_movie_repository import ColumnarMovieRepository
 from .csv_movie_repository import CsvMovieRepository
 from .csv_user_repository import CsvUserRepository
 from .sqlite_movie_repository import SqliteMovieRepository
 from .sqlite_user_repository import SqliteUserRepository
 
 __all__ = [
+    "ColumnarMovieRepository",
     "CsvMovieRepository", 
     "CsvUserRepository",
     "SqliteMovieRepository", 
@@ -0,0 +1,572 @@
+"""
+Columnar Movie Repository Implementation - Infrastructure Layer
+Implements the IMovieRepository interface over NumPy column arrays
+loaded from the movies CSV file
+"""
+import csv
+import os
+import asyncio
+from typing import AsyncIterator, Dict, FrozenSet, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from domain.entities.movie import Movie
+from domain.entities.genre import Genre
+from domain.repositories.movie_repository import IMovieRepository
+from domain.value_objects.pagination import PaginationParams, PaginatedResult, PageCursor
+from domain.value_objects.search_criteria import SearchCriteria
+
+# Columns written back to the CSV file, same layout CsvMovieRepository uses
+CSV_FIELDNAMES = [
+    'movieId', 'title', 'genres', 'imdb_id', 'tmdb_id',
+    'ratings_count', 'zero_to_one_ratings_count', 'one_to_two_ratings_count',
+    'two_to_three_ratings_count', 'three_to_four_ratings_count', 'four_to_five_ratings_count',
+    'average_rating', 'tags', 'earliest_rating', 'latest_rating', 'earliest_tag', 'latest_tag'
+]
+
+RATING_BUCKET_COLUMNS = CSV_FIELDNAMES[6:11]
+
+# Genres are packed into one uint64 per movie
+MAX_GENRES = 64
+
+# Tag bitsets grow by this many rows at a time when movies are created
+BITSET_GROWTH_ROWS = 1024
+
+
+class ColumnarMovieRepository(IMovieRepository):
+    """
+    Columnar Movie Repository - Infrastructure Layer
+    Keeps the catalog as NumPy arrays (one per numeric column), a uint64
+    genre bitmask per movie and a packed bitset per tag. Filters are
+    vectorized boolean masks over the whole catalog; Movie entities are
+    only built for the rows on the returned page. The catalog is already in
+    memory, so list methods ignore `fields`.
+    """
+
+    def __init__(self, csv_file_path: str = "data/movies.csv"):
+        self.csv_file_path = csv_file_path
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._genres_cache: Optional[List[Genre]] = None
+        self._size = 0
+        # Data lives in this process, so only its own creates change it
+        self._data_version = 0
+
+    async def _ensure_loaded(self) -> None:
+        """(Private) Load the column arrays once"""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if not self._loaded:
+                self._load_columns()
+                self._loaded = True
+
+    def _load_columns(self) -> None:
+        """(Private) Read the CSV file into column arrays, bitmasks and lookup indexes"""
+        if not os.path.exists(self.csv_file_path):
+            raise FileNotFoundError(f"CSV file not found: {self.csv_file_path}")
+
+        try:
+            df = pd.read_csv(self.csv_file_path, dtype={'movieId': str, 'imdb_id': str, 'tmdb_id': str})
+        except Exception as e:
+            raise ValueError(f"Error loading movies from CSV: {str(e)}")
+
+        text = {
+            name: df[name].fillna("").astype(str).tolist()
+            for name in ['movieId', 'title', 'imdb_id', 'tmdb_id',
+                         'earliest_rating', 'latest_rating', 'earliest_tag', 'latest_tag']
+        }
+        self._movie_ids = text['movieId']
+        self._titles = text['title']
+        self._imdb_ids = text['imdb_id']
+        self._tmdb_ids = text['tmdb_id']
+        self._earliest_ratings = text['earliest_rating']
+        self._latest_ratings = text['latest_rating']
+        self._earliest_tags = text['earliest_tag']
+        self._latest_tags = text['latest_tag']
+        self._genres = [self._split(v) for v in df['genres'].fillna("").astype(str)]
+        self._tags = [self._split(v) for v in df['tags'].fillna("").astype(str)]
+
+        self._size = len(df)
+        self._ratings_count = df['ratings_count'].to_numpy(dtype=np.int64)
+        self._average_rating = df['average_rating'].to_numpy(dtype=np.float64)
+        self._rating_buckets = df[RATING_BUCKET_COLUMNS].to_numpy(dtype=np.int64)
+        self._positive_percentage = np.array(
+            [self._positive_percentage_of(count, buckets) for count, buckets in zip(self._ratings_count, self._rating_buckets)],
+            dtype=np.float64
+        )
+        # -1 marks titles without a "(YYYY)" suffix; it sorts last and fails every year range
+        self._release_year = (
+            df['title'].astype(str).str.extract(r'\((\d{4})\)\s*$')[0]
+            .fillna(-1).astype(np.int32).to_numpy()
+        )
+
+        # Lowercased titles joined into one byte array for vectorized substring search
+        self._rebuild_title_blob()
+        self._build_genre_masks()
+        self._build_tag_bitsets()
+        self._build_id_indexes()
+        self._sort_orders: Dict[str, np.ndarray] = {}
+
+    @staticmethod
+    def _positive_percentage_of(ratings_count, buckets) -> float:
+        """(Private) Share of 3-5 star ratings, rounded exactly like Movie.get_positive_rating_percentage"""
+        if not ratings_count:
+            return 0.0
+        return round((int(buckets[3] + buckets[4]) / int(ratings_count)) * 100, 2)
+
+    @staticmethod
+    def _split(value: str) -> List[str]:
+        """(Private) Split a pipe-separated column value"""
+        return [item.strip() for item in value.split('|') if item.strip()]
+
+    def _rebuild_title_blob(self) -> None:
+        """(Private) Join lowercased UTF-8 titles with newlines and record where each one starts"""
+        encoded = [t.lower().replace('\n', ' ').encode('utf-8') for t in self._titles]
+        self._title_bytes = np.frombuffer(b'\n'.join(encoded), dtype=np.uint8)
+        lengths = np.fromiter((len(t) + 1 for t in encoded), dtype=np.int64, count=len(encoded))
+        self._title_starts = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.int64)
+        self._byte_positions: Optional[List[np.ndarray]] = None
+
+    def _title_byte_positions(self) -> List[np.ndarray]:
+        """(Private) Sorted offsets of every byte value in the title blob, built on first search"""
+        if self._byte_positions is None:
+            order = np.argsort(self._title_bytes, kind='stable')
+            bounds = np.cumsum(np.bincount(self._title_bytes, minlength=256))[:-1]
+            self._byte_positions = np.split(order, bounds)
+        return self._byte_positions
+
+    def _build_genre_masks(self) -> None:
+        """(Private) Assign each genre a bit and OR them into one uint64 per movie"""
+        self._genre_bits: Dict[str, int] = {}
+        self._genre_names: Dict[str, str] = {}
+        self._genre_mask = np.zeros(self._size, dtype=np.uint64)
+        for row, genres in enumerate(self._genres):
+            self._genre_mask[row] = self._genre_mask_for(genres)
+
+    def _genre_mask_for(self, genres: List[str]) -> np.uint64:
+        """(Private) Bitmask for a list of genres, registering new genres on the way"""
+        mask = 0
+        for genre in genres:
+            key = genre.lower()
+            if key not in self._genre_bits:
+                if len(self._genre_bits) >= MAX_GENRES:
+                    raise ValueError(f"Columnar repository supports at most {MAX_GENRES} genres")
+                self._genre_bits[key] = len(self._genre_bits)
+                self._genre_names[key] = genre
+            mask |= 1 << self._genre_bits[key]
+        return np.uint64(mask)
+
+    def _build_tag_bitsets(self) -> None:
+        """(Private) One packed bitset (1 bit per movie) for every distinct case-folded tag"""
+        postings: Dict[str, List[int]] = {}
+        for row, tags in enumerate(self._tags):
+            for tag in tags:
+                postings.setdefault(tag.casefold(), []).append(row)
+
+        self._bitset_bytes = (self._size + BITSET_GROWTH_ROWS + 7) // 8
+        self._tag_bitsets: Dict[str, np.ndarray] = {}
+        for key, rows in postings.items():
+            bits = np.zeros(self._bitset_bytes * 8, dtype=bool)
+            bits[rows] = True
+            self._tag_bitsets[key] = np.packbits(bits)
+        self._tag_keys = np.array(list(self._tag_bitsets), dtype=object)
+
+    def _build_id_indexes(self) -> None:
+        """(Private) Hash indexes from external IDs to row numbers"""
+        self._row_by_id = {movie_id: row for row, movie_id in enumerate(self._movie_ids)}
+        self._row_by_imdb = {}
+        self._row_by_tmdb = {}
+        for row in range(self._size):
+            self._index_external_ids(row, self._imdb_ids[row], self._tmdb_ids[row])
+
+    def _index_external_ids(self, row: int, imdb_id: str, tmdb_id: str) -> None:
+        """(Private) Index a row's IMDB/TMDB IDs, skipping empty ones"""
+        if imdb_id and imdb_id.strip():
+            self._row_by_imdb.setdefault(imdb_id, row)
+        if tmdb_id and tmdb_id.strip():
+            self._row_by_tmdb.setdefault(tmdb_id, row)
+
+    def _tag_mask(self, key: str) -> np.ndarray:
+        """(Private) Boolean row mask for a case-folded tag"""
+        bitset = self._tag_bitsets.get(key)
+        if bitset is None:
+            return np.zeros(self._size, dtype=bool)
+        return np.unpackbits(bitset, count=self._size).view(bool)
+
+    def _tag_substring_mask(self, needle: str) -> np.ndarray:
+        """(Private) Rows with any tag containing needle - scans the tag vocabulary, not the movies"""
+        mask = np.zeros(self._size, dtype=bool)
+        for key in self._tag_keys:
+            if needle in key:
+                mask |= self._tag_mask(key)
+        return mask
+
+    def _title_mask(self, needle: str) -> np.ndarray:
+        """
+        (Private) Rows whose lowercased title contains needle.
+        Candidate offsets start from the occurrences of the needle's rarest
+        byte and are narrowed one needle byte at a time, so the work is
+        vectorized and proportional to the needle length, not the row count.
+        """
+        mask = np.zeros(self._size, dtype=bool)
+        pattern = np.frombuffer(needle.encode('utf-8'), dtype=np.uint8)
+        if len(pattern) == 0 or ord('\n') in pattern:
+            return mask
+
+        positions = self._title_byte_positions()
+        anchor = min(range(len(pattern)), key=lambda i: len(positions[pattern[i]]))
+        starts = positions[pattern[anchor]] - anchor
+        starts = starts[(starts >= 0) & (starts + len(pattern) <= len(self._title_bytes))]
+        for offset, byte in enumerate(pattern):
+            if offset != anchor and len(starts):
+                starts = starts[self._title_bytes[starts + offset] == byte]
+
+        mask[np.searchsorted(self._title_starts, starts, side='right') - 1] = True
+        return mask
+
+    def _sort_order(self, name: str) -> np.ndarray:
+        """(Private) Row order for a named sort, computed once per data version"""
+        order = self._sort_orders.get(name)
+        if order is None:
+            if name == "popular":
+                order = np.argsort(-self._ratings_count, kind='stable')
+            elif name == "rating":
+                order = np.argsort(-self._average_rating, kind='stable')
+            else:  # "recent"
+                order = np.lexsort((-np.arange(self._size), -self._release_year))
+            self._sort_orders[name] = order
+        return order
+
+    def _movie_at(self, row: int) -> Movie:
+        """(Private) Materialize one row as a Movie entity"""
+        buckets = self._rating_buckets[row]
+        release_year = int(self._release_year[row])
+        return Movie(
+            movieId=self._movie_ids[row],
+            title=self._titles[row],
+            genres=list(self._genres[row]),
+            imdb_id=self._imdb_ids[row],
+            tmdb_id=self._tmdb_ids[row],
+            ratings_count=int(self._ratings_count[row]),
+            zero_to_one_ratings_count=int(buckets[0]),
+            one_to_two_ratings_count=int(buckets[1]),
+            two_to_three_ratings_count=int(buckets[2]),
+            three_to_four_ratings_count=int(buckets[3]),
+            four_to_five_ratings_count=int(buckets[4]),
+            average_rating=float(self._average_rating[row]),
+            tags=list(self._tags[row]),
+            earliest_rating=self._earliest_ratings[row],
+            latest_rating=self._latest_ratings[row],
+            earliest_tag=self._earliest_tags[row],
+            latest_tag=self._latest_tags[row],
+            release_year=release_year if release_year >= 0 else None,
+            positive_rating_percentage=float(self._positive_percentage[row])
+        )
+
+    def _page(self, rows: np.ndarray, pagination: PaginationParams) -> PaginatedResult[Movie]:
+        """(Private) Slice a row-number array and materialize only that page"""
+        total = len(rows)
+        start_idx = pagination.offset
+        if pagination.is_keyset:
+            start_idx = PageCursor.decode(pagination.cursor, "position").values[0]
+            if not isinstance(start_idx, int) or start_idx < 0:
+                raise ValueError("Invalid pagination cursor")
+        end_idx = start_idx + pagination.limit
+
+        return PaginatedResult(
+            data=[self._movie_at(int(row)) for row in rows[start_idx:end_idx]],
+            total=total,
+            page=pagination.page,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
+            next_cursor=PageCursor(sort="position", values=(end_idx,)).encode() if end_idx < total else None
+        )
+
+    def _search_mask(self, criteria: SearchCriteria) -> np.ndarray:
+        """(Private) Combine every criterion into one boolean mask"""
+        mask = np.ones(self._size, dtype=bool)
+
+        if criteria.has_title_search():
+            mask &= self._title_mask(criteria.get_normalized_title())
+
+        if criteria.has_genre_filter():
+            bit = self._genre_bits.get(criteria.genre.lower().strip())
+            if bit is None:
+                return np.zeros(self._size, dtype=bool)
+            mask &= (self._genre_mask & np.uint64(1 << bit)) != 0
+
+        if criteria.has_year_filter():
+            start_year, end_year = criteria.get_year_range()
+            mask &= self._release_year >= 0
+            if start_year is not None:
+                mask &= self._release_year >= start_year
+            if end_year is not None:
+                mask &= self._release_year <= end_year
+
+        if criteria.country is not None:
+            mask &= self._tag_substring_mask(criteria.get_normalized_country())
+
+        if criteria.language is not None:
+            mask &= self._tag_substring_mask(criteria.get_normalized_language())
+
+        if criteria.min_rating is not None:
+            mask &= self._average_rating >= criteria.min_rating
+
+        if criteria.max_rating is not None:
+            mask &= self._average_rating <= criteria.max_rating
+
+        if criteria.min_positive is not None:
+            mask &= self._positive_percentage >= criteria.min_positive
+
+        return mask
+
+    async def create(self, movie: Movie) -> Movie:
+        """Create a new movie, append it to the column arrays and the CSV file"""
+        await self._ensure_loaded()
+        if movie.movieId in self._row_by_id:
+            raise ValueError(f"Movie with ID {movie.movieId} already exists")
+
+        genre_mask = self._genre_mask_for(movie.genres)
+        row = self._size
+        self._size += 1
+
+        self._movie_ids.append(movie.movieId)
+        self._titles.append(movie.title)
+        self._imdb_ids.append(movie.imdb_id)
+        self._tmdb_ids.append(movie.tmdb_id)
+        self._earliest_ratings.append(movie.earliest_rating)
+        self._latest_ratings.append(movie.latest_rating)
+        self._earliest_tags.append(movie.earliest_tag)
+        self._latest_tags.append(movie.latest_tag)
+        self._genres.append(list(movie.genres))
+        self._tags.append(list(movie.tags))
+
+        self._ratings_count = np.append(self._ratings_count, movie.ratings_count)
+        self._average_rating = np.append(self._average_rating, movie.average_rating)
+        self._rating_buckets = np.vstack([self._rating_buckets, [[
+            movie.zero_to_one_ratings_count,
+            movie.one_to_two_ratings_count,
+            movie.two_to_three_ratings_count,
+            movie.three_to_four_ratings_count,
+            movie.four_to_five_ratings_count
+        ]]])
+        self._positive_percentage = np.append(
+            self._positive_percentage, self._positive_percentage_of(movie.ratings_count, self._rating_buckets[-1])
+        )
+        release_year = movie.release_year if movie.release_year is not None else -1
+        self._release_year = np.append(self._release_year, np.int32(release_year))
+        self._genre_mask = np.append(self._genre_mask, genre_mask)
+
+        if self._size > self._bitset_bytes * 8:
+            grow = BITSET_GROWTH_ROWS // 8
+            self._bitset_bytes += grow
+            for key, bitset in self._tag_bitsets.items():
+                self._tag_bitsets[key] = np.concatenate([bitset, np.zeros(grow, dtype=np.uint8)])
+        for key in {tag.casefold() for tag in movie.tags}:
+            if key not in self._tag_bitsets:
+                self._tag_bitsets[key] = np.zeros(self._bitset_bytes, dtype=np.uint8)
+                self._tag_keys = np.append(self._tag_keys, key)
+            self._tag_bitsets[key][row >> 3] |= np.uint8(0x80 >> (row & 7))
+
+        title_bytes = np.frombuffer(movie.title.lower().replace('\n', ' ').encode('utf-8'), dtype=np.uint8)
+        if row:
+            title_bytes = np.concatenate([np.frombuffer(b'\n', dtype=np.uint8), title_bytes])
+        self._title_starts = np.append(self._title_starts, len(self._title_bytes) + (1 if row else 0))
+        self._title_bytes = np.concatenate([self._title_bytes, title_bytes])
+        self._byte_positions = None
+
+        self._row_by_id[movie.movieId] = row
+        self._index_external_ids(row, movie.imdb_id, movie.tmdb_id)
+        self._sort_orders.clear()
+        self._genres_cache = None
+
+        self._append_to_csv(movie)
+        self._data_version += 1
+        return movie
+
+    def _append_to_csv(self, movie: Movie) -> None:
+        """(Private) Append one movie row to the CSV file"""
+        with open(self.csv_file_path, 'a', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
+            writer.writerow({
+                'movieId': movie.movieId,
+                'title': movie.title,
+                'genres': '|'.join(movie.genres),
+                'imdb_id': movie.imdb_id,
+                'tmdb_id': movie.tmdb_id,
+                'ratings_count': movie.ratings_count,
+                'zero_to_one_ratings_count': movie.zero_to_one_ratings_count,
+                'one_to_two_ratings_count': movie.one_to_two_ratings_count,
+                'two_to_three_ratings_count': movie.two_to_three_ratings_count,
+                'three_to_four_ratings_count': movie.three_to_four_ratings_count,
+                'four_to_five_ratings_count': movie.four_to_five_ratings_count,
+                'average_rating': movie.average_rating,
+                'tags': '|'.join(movie.tags),
+                'earliest_rating': movie.earliest_rating,
+                'latest_rating': movie.latest_rating,
+                'earliest_tag': movie.earliest_tag,
+                'latest_tag': movie.latest_tag
+            })
+
+    async def find_all(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
+        """Get all movies with pagination"""
+        await self._ensure_loaded()
+        return self._page(np.arange(self._size), pagination)
+
+    async def find_by_id(self, movie_id: str) -> Optional[Movie]:
+        """Find movie by ID"""
+        await self._ensure_loaded()
+        row = self._row_by_id.get(movie_id)
+        return self._movie_at(row) if row is not None else None
+
+    async def find_by_ids(self, ids: Sequence[str], kind: str = "id") -> Dict[str, Movie]:
+        """Find many movies by one kind of ID through the row indexes"""
+        await self._ensure_loaded()
+        index = {"id": self._row_by_id, "imdb": self._row_by_imdb, "tmdb": self._row_by_tmdb}[kind]
+        return {value: self._movie_at(index[value]) for value in ids if value in index}
+
+    async def search(
+        self,
+        criteria: SearchCriteria,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
+        """Search movies with criteria and pagination"""
+        await self._ensure_loaded()
+        return self._page(np.flatnonzero(self._search_mask(criteria)), pagination)
+
+    async def iter_movies(
+        self,
+        criteria: SearchCriteria,
+        after_id: Optional[int] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[Movie]:
+        """Stream movies matching criteria in movieId order, starting after after_id"""
+        await self._ensure_loaded()
+        rows = np.flatnonzero(self._search_mask(criteria))
+        ids = np.fromiter(
+            (int(self._movie_ids[row]) if self._movie_ids[row].isdigit() else 0 for row in rows),
+            dtype=np.int64, count=len(rows)
+        )
+        order = np.argsort(ids, kind="stable")
+        if after_id is not None:
+            order = order[ids[order] > after_id]
+        for row in rows[order]:
+            yield self._movie_at(int(row))
+
+    async def find_by_genre(
+        self,
+        genre: str,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
+        """Get movies by genre with pagination"""
+        await self._ensure_loaded()
+        bit = self._genre_bits.get(genre.lower().strip())
+        if bit is None:
+            return self._page(np.zeros(0, dtype=np.int64), pagination)
+        return self._page(np.flatnonzero((self._genre_mask & np.uint64(1 << bit)) != 0), pagination)
+
+    async def find_all_genres(self) -> List[Genre]:
+        """Get all available genres"""
+        await self._ensure_loaded()
+        if self._genres_cache is None:
+            self._genres_cache = [Genre(name=name) for name in sorted(self._genre_names.values())]
+        return self._genres_cache
+
+    async def find_popular(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
+        """Get popular movies (by ratings count) with pagination"""
+        await self._ensure_loaded()
+        return self._page(self._sort_order("popular"), pagination)
+
+    async def find_highly_rated(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
+        """Get highly rated movies (4.0+) sorted by rating with pagination"""
+        await self._ensure_loaded()
+        order = self._sort_order("rating")
+        # Sorted descending, so the 4.0+ movies are a prefix of the order
+        return self._page(order[:np.count_nonzero(self._average_rating >= 4.0)], pagination)
+
+    async def find_recent(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
+        """Get recent movies (by release year) with pagination"""
+        await self._ensure_loaded()
+        return self._page(self._sort_order("recent"), pagination)
+
+    async def update_views(self, movie_id: str) -> Optional[Movie]:
+        """Update movie view count (not tracked by this data source)"""
+        return await self.find_by_id(movie_id)
+
+    async def get_total_count(self) -> int:
+        """Get total count of movies"""
+        await self._ensure_loaded()
+        return self._size
+
+    async def find_related_movies(self, movie: Movie, limit: int = 5) -> List[Movie]:
+        """Find the best rated movies sharing at least one genre with the given movie"""
+        await self._ensure_loaded()
+        wanted = 0
+        for genre in movie.genres:
+            bit = self._genre_bits.get(genre.lower())
+            if bit is not None:
+                wanted |= 1 << bit
+
+        mask = (self._genre_mask & np.uint64(wanted)) != 0
+        row = self._row_by_id.get(movie.movieId)
+        if row is not None:
+            mask[row] = False
+
+        candidates = np.flatnonzero(mask)
+        if len(candidates) > limit:
+            # Partial selection: only the top `limit` ratings get sorted
+            top = np.argpartition(-self._average_rating[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        candidates = candidates[np.argsort(-self._average_rating[candidates], kind='stable')]
+        return [self._movie_at(int(r)) for r in candidates]
+
+    async def find_by_tag(
+        self,
+        tag: str,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
+        """Get movies by exact (case-insensitive) tag with pagination"""
+        await self._ensure_loaded()
+        return self._page(np.flatnonzero(self._tag_mask(tag.strip().casefold())), pagination)
+
+    async def find_by_imdb_id(self, imdb_id: str) -> Optional[Movie]:
+        """Find movie by IMDB ID"""
+        await self._ensure_loaded()
+        row = self._row_by_imdb.get(imdb_id)
+        return self._movie_at(row) if row is not None else None
+
+    async def find_by_tmdb_id(self, tmdb_id: str) -> Optional[Movie]:
+        """Find movie by TMDB ID"""
+        await self._ensure_loaded()
+        row = self._row_by_tmdb.get(tmdb_id)
+        return self._movie_at(row) if row is not None else None
+
+    async def get_data_version(self) -> int:
+        """Number of movies created through this repository"""
+        return self._data_version
+
+    def clear_cache(self):
+        """Drop the column arrays so the next call reloads the CSV file"""
+        self._loaded = False
+        self._genres_cache = None
@@ -3,30 +3,49 @@ CSV Movie Repository Implementation - Infrastructure Layer
 Implements the IMovieRepository interface using CSV file as data source
 """
 import csv
+import heapq
 import os
 import asyncio
-from typing import List, Optional
+from typing import AsyncIterator, Callable, Dict, FrozenSet, List, Optional, Sequence
 import pandas as pd
 from datetime import datetime
-import re
 
 from domain.entities.movie import Movie
 from domain.entities.genre import Genre
 from domain.repositories.movie_repository import IMovieRepository
-from domain.value_objects.pagination import PaginationParams, PaginatedResult
+from domain.value_objects.pagination import PaginationParams, PaginatedResult, PageCursor
 from domain.value_objects.search_criteria import SearchCriteria
 
+# Descending sort keys the list endpoints page through; ties keep file order.
+# "recent" matches the SQLite/columnar order: release year, titles without
+# one last, then the highest movieId first
+SORT_KEYS: Dict[str, Callable[[Movie], object]] = {
+    "popular": lambda m: m.ratings_count,
+    "highly_rated": lambda m: m.average_rating,
+    "recent": lambda m: (
+        m.release_year if m.release_year is not None else -1,
+        int(m.movieId) if m.movieId.isdigit() else -1
+    ),
+}
+
 
 class CsvMovieRepository(IMovieRepository):
     """
     CSV Movie Repository - Infrastructure Layer
-    Implements movie data access using CSV file
+    Implements movie data access using CSV file. Movies are held in memory,
+    so list methods ignore `fields`.
     """
 
     def __init__(self, csv_file_path: str = "data/movies.csv"):
         self.csv_file_path = csv_file_path
         self._movies_cache: Optional[List[Movie]] = None
         self._genres_cache: Optional[List[Genre]] = None
+        self._sort_orders: Dict[str, List[Movie]] = {}
+        self._by_id: Dict[str, Movie] = {}
+        self._by_imdb_id: Dict[str, Movie] = {}
+        self._by_tmdb_id: Dict[str, Movie] = {}
+        # Data lives in this process, so only its own creates change it
+        self._data_version = 0
 
     async def _load_movies(self) -> List[Movie]:
         """(Private) Load movies from CSV file with caching. Chỉ dùng trong nội bộ class, không gọi từ ngoài class."""
@@ -64,7 +83,8 @@ class CsvMovieRepository(IMovieRepository):
                     earliest_rating=str(row['earliest_rating']),
                     latest_rating=str(row['latest_rating']),
                     earliest_tag=str(row['earliest_tag']),
-                    latest_tag=str(row['latest_tag'])
+                    latest_tag=str(row['latest_tag']),
+                    release_year=Movie.parse_release_year(str(row['title']))
                 )
                 movies.append(movie)
                 
@@ -72,8 +92,55 @@ class CsvMovieRepository(IMovieRepository):
             raise ValueError(f"Error loading movies from CSV: {str(e)}")
 
         self._movies_cache = movies
+        self._build_sort_orders(movies)
+        self._build_id_indexes(movies)
+        return movies
+
+    def _build_id_indexes(self, movies: List[Movie]) -> None:
+        """(Private) Hash movieId, imdb_id and tmdb_id to movies for O(1) point lookups"""
+        self._by_id = {}
+        self._by_imdb_id = {}
+        self._by_tmdb_id = {}
+        for movie in movies:
+            self._index_movie(movie)
+
+    def _index_movie(self, movie: Movie) -> None:
+        """(Private) Add one movie to the ID indexes; the first movie with an external ID keeps it, empty IDs are skipped"""
+        self._by_id.setdefault(movie.movieId, movie)
+        if movie.imdb_id and movie.imdb_id.strip():
+            self._by_imdb_id.setdefault(movie.imdb_id, movie)
+        if movie.tmdb_id and movie.tmdb_id.strip():
+            self._by_tmdb_id.setdefault(movie.tmdb_id, movie)
+
+    def _build_sort_orders(self, movies: List[Movie]) -> None:
+        """(Private) Sort the catalog once per sort key so list endpoints only slice"""
+        self._sort_orders = {
+            name: sorted(self._sort_candidates(name, movies), key=key, reverse=True)
+            for name, key in SORT_KEYS.items()
+        }
+
+    def _sort_candidates(self, name: str, movies: List[Movie]) -> List[Movie]:
+        """(Private) Movies that belong in a sort order"""
+        if name == "highly_rated":
+            return [m for m in movies if m.is_highly_rated()]
         return movies
 
+    def _insert_into_sort_orders(self, movie: Movie) -> None:
+        """(Private) Binary-insert a new movie into every sort order, after its equals"""
+        for name, key in SORT_KEYS.items():
+            if not self._sort_candidates(name, [movie]):
+                continue
+            ordered = self._sort_orders[name]
+            value = key(movie)
+            lo, hi = 0, len(ordered)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if key(ordered[mid]) >= value:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            ordered.insert(lo, movie)
+
     async def _load_genres(self) -> List[Genre]:
         """(Private) Load unique genres from movies. Chỉ dùng trong nội bộ class, không gọi từ ngoài class."""
         if self._genres_cache is not None:
@@ -98,6 +165,11 @@ class CsvMovieRepository(IMovieRepository):
         """(Private) Apply pagination to movie list. Chỉ dùng trong nội bộ class, không gọi từ ngoài class."""
         total = len(movies)
         start_idx = pagination.offset
+        if pagination.is_keyset:
+            # The list is already in memory, so the cursor is just the next position
+            start_idx = PageCursor.decode(pagination.cursor, "position").values[0]
+            if not isinstance(start_idx, int) or start_idx < 0:
+                raise ValueError("Invalid pagination cursor")
         end_idx = start_idx + pagination.limit
         
         paginated_movies = movies[start_idx:end_idx]
@@ -106,7 +178,9 @@ class CsvMovieRepository(IMovieRepository):
             data=paginated_movies,
             total=total,
             page=pagination.page,
-            limit=pagination.limit
+            limit=pagination.limit,
+            cursor=pagination.cursor,
+            next_cursor=PageCursor(sort="position", values=(end_idx,)).encode() if end_idx < total else None
         )
     
     def _create_movie(self, movie: Movie) -> Movie:
@@ -128,7 +202,8 @@ class CsvMovieRepository(IMovieRepository):
             one_to_two_ratings_count=movie.one_to_two_ratings_count,
             two_to_three_ratings_count=movie.two_to_three_ratings_count,
             three_to_four_ratings_count=movie.three_to_four_ratings_count,
-            four_to_five_ratings_count=movie.four_to_five_ratings_count
+            four_to_five_ratings_count=movie.four_to_five_ratings_count,
+            release_year=movie.release_year
         )
 
     async def _save_movies(self, movies: List[Movie]) -> None:
@@ -167,20 +242,16 @@ class CsvMovieRepository(IMovieRepository):
         """Create a new movie and save to CSV"""
         movies = await self._load_movies()
         # Check for duplicate movieId
-        if any(m.movieId == movie.movieId for m in movies):
+        if movie.movieId in self._by_id:
             raise ValueError(f"Movie with ID {movie.movieId} already exists")
         movies.append(movie)
         await self._save_movies(movies)
         self._movies_cache = movies
+        self._index_movie(movie)
+        self._insert_into_sort_orders(movie)
+        self._data_version += 1
         return movie
 
-    def _extract_year_from_title(self, title: str) -> Optional[int]:
-        """(Private) Extract year from movie title if it ends with (YYYY)."""
-        match = re.search(r'\((\d{4})\)\s*$', title)
-        if match:
-            return int(match.group(1))
-        return None
-
     def _filter_movies(self, movies: List[Movie], criteria: SearchCriteria) -> List[Movie]:
         """(Private) Filter movies based on search criteria. Chỉ dùng trong nội bộ class, không gọi từ ngoài class."""
         filtered = movies
@@ -197,10 +268,13 @@ class CsvMovieRepository(IMovieRepository):
                 if m.has_genre(criteria.genre)
             ]
 
-        if criteria.year is not None:
+        if criteria.has_year_filter():
+            start_year, end_year = criteria.get_year_range()
             filtered = [
                 m for m in filtered
-                if self._extract_year_from_title(m.title) == criteria.year
+                if m.release_year is not None
+                and (start_year is None or m.release_year >= start_year)
+                and (end_year is None or m.release_year <= end_year)
             ]
 
         if criteria.country is not None:
@@ -227,35 +301,62 @@ class CsvMovieRepository(IMovieRepository):
         if criteria.max_rating is not None:
             filtered = [m for m in filtered if m.average_rating <= criteria.max_rating]
 
+        if criteria.min_positive is not None:
+            filtered = [m for m in filtered if m.get_positive_rating_percentage() >= criteria.min_positive]
+
         return filtered
 
-    async def find_all(self, pagination: PaginationParams) -> PaginatedResult[Movie]:
+    async def find_all(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
         """Get all movies with pagination"""
         movies = await self._load_movies()
         return self._apply_pagination(movies, pagination)
 
     async def find_by_id(self, movie_id: str) -> Optional[Movie]:
         """Find movie by ID"""
-        movies = await self._load_movies()
-        for movie in movies:
-            if movie.movieId == movie_id:
-                return movie
-        return None
+        await self._load_movies()
+        return self._by_id.get(movie_id)
+
+    async def find_by_ids(self, ids: Sequence[str], kind: str = "id") -> Dict[str, Movie]:
+        """Find many movies by one kind of ID through the in-memory indexes"""
+        await self._load_movies()
+        index = {"id": self._by_id, "imdb": self._by_imdb_id, "tmdb": self._by_tmdb_id}[kind]
+        return {value: index[value] for value in ids if value in index}
 
     async def search(
         self, 
         criteria: SearchCriteria, 
-        pagination: PaginationParams
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
     ) -> PaginatedResult[Movie]:
         """Search movies with criteria and pagination"""
         movies = await self._load_movies()
         filtered_movies = self._filter_movies(movies, criteria)
         return self._apply_pagination(filtered_movies, pagination)
 
+    async def iter_movies(
+        self,
+        criteria: SearchCriteria,
+        after_id: Optional[int] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[Movie]:
+        """Stream movies matching criteria in movieId order, starting after after_id"""
+        def numeric_id(movie: Movie) -> int:
+            return int(movie.movieId) if movie.movieId.isdigit() else 0
+
+        movies = self._filter_movies(await self._load_movies(), criteria)
+        for movie in sorted(movies, key=numeric_id):
+            if after_id is None or numeric_id(movie) > after_id:
+                yield movie
+
     async def find_by_genre(
         self, 
         genre: str, 
-        pagination: PaginationParams
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
     ) -> PaginatedResult[Movie]:
         """Get movies by genre with pagination"""
         movies = await self._load_movies()
@@ -266,30 +367,34 @@ class CsvMovieRepository(IMovieRepository):
         """Get all available genres"""
         return await self._load_genres()
 
-    async def find_popular(self, pagination: PaginationParams) -> PaginatedResult[Movie]:
+    async def find_popular(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
         """Get popular movies (by ratings count) with pagination"""
-        movies = await self._load_movies()
-        sorted_movies = sorted(movies, key=lambda m: m.ratings_count, reverse=True)
-        return self._apply_pagination(sorted_movies, pagination)
+        await self._load_movies()
+        return self._apply_pagination(self._sort_orders["popular"], pagination)
 
-    async def find_highly_rated(self, pagination: PaginationParams) -> PaginatedResult[Movie]:
+    async def find_highly_rated(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
         """Get highly rated movies with pagination"""
-        movies = await self._load_movies()
-        # Filter movies with rating >= 4.0 and sort by rating
-        highly_rated = [m for m in movies if m.is_highly_rated()]
-        sorted_movies = sorted(highly_rated, key=lambda m: m.average_rating, reverse=True)
-        return self._apply_pagination(sorted_movies, pagination)
-
-    async def find_recent(self, pagination: PaginationParams) -> PaginatedResult[Movie]:
+        await self._load_movies()
+        # Movies rated 4.0+, best first
+        return self._apply_pagination(self._sort_orders["highly_rated"], pagination)
+
+    async def find_recent(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
         """Get recent movies with pagination"""
-        movies = await self._load_movies()
-        # Sort by latest rating date (most recent first)
-        sorted_movies = sorted(
-            movies, 
-            key=lambda m: m.latest_rating, 
-            reverse=True
-        )
-        return self._apply_pagination(sorted_movies, pagination)
+        await self._load_movies()
+        # Sorted by release year (most recent first)
+        return self._apply_pagination(self._sort_orders["recent"], pagination)
 
     async def update_views(self, movie_id: str) -> Optional[Movie]:
         """Update movie view count (simulation - not applicable for this data structure)"""
@@ -306,20 +411,22 @@ class CsvMovieRepository(IMovieRepository):
     async def find_related_movies(self, movie: Movie, limit: int = 5) -> List[Movie]:
         """Find movies related to the given movie (same genres)"""
         movies = await self._load_movies()
-        related = []
-        
-        for m in movies:
-            if m.movieId != movie.movieId:  # Exclude the movie itself
-                # Check if movies share at least one genre
-                shared_genres = set(movie.genres) & set(m.genres)
-                if shared_genres:
-                    related.append(m)
+        genres = set(movie.genres)
+        related = (
+            m for m in movies
+            # Exclude the movie itself, keep movies sharing at least one genre
+            if m.movieId != movie.movieId and not genres.isdisjoint(m.genres)
+        )
         
-        # Sort by average rating and return limited results
-        related.sort(key=lambda m: m.average_rating, reverse=True)
-        return related[:limit]
-
-    async def find_by_tag(self, tag: str, pagination: PaginationParams) -> PaginatedResult[Movie]:
+        # Best rated first - a bounded heap instead of sorting every candidate
+        return heapq.nlargest(limit, related, key=lambda m: m.average_rating)
+
+    async def find_by_tag(
+        self,
+        tag: str,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
         """Get movies by tag with pagination"""
         movies = await self._load_movies()
         filtered_movies = [m for m in movies if m.has_tag(tag)]
@@ -327,21 +434,23 @@ class CsvMovieRepository(IMovieRepository):
 
     async def find_by_imdb_id(self, imdb_id: str) -> Optional[Movie]:
         """Find movie by IMDB ID"""
-        movies = await self._load_movies()
-        for movie in movies:
-            if movie.imdb_id == imdb_id:
-                return movie
-        return None
+        await self._load_movies()
+        return self._by_imdb_id.get(imdb_id)
 
     async def find_by_tmdb_id(self, tmdb_id: str) -> Optional[Movie]:
         """Find movie by TMDB ID"""
-        movies = await self._load_movies()
-        for movie in movies:
-            if movie.tmdb_id == tmdb_id:
-                return movie
-        return None
+        await self._load_movies()
+        return self._by_tmdb_id.get(tmdb_id)
+
+    async def get_data_version(self) -> int:
+        """Number of movies created through this repository"""
+        return self._data_version
 
     def clear_cache(self):
         """Clear the movies and genres cache (dùng khi cần reload dữ liệu từ file)"""
         self._movies_cache = None
-        self._genres_cache = None 
\ No newline at end of file
+        self._genres_cache = None
+        self._sort_orders = {}
+        self._by_id = {}
+        self._by_imdb_id = {}
+        self._by_tmdb_id = {} 
\ No newline at end of file
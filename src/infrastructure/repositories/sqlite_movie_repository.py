@@ -3,21 +3,90 @@ SQLite Movie Repository Implementation - Infrastructure Layer
 Implements the IMovieRepository interface using SQLite database
 """
 import asyncio
-from typing import List, Optional
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, FrozenSet, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc, asc
+from sqlalchemy import select, func, desc, asc, table, column, text, tuple_, null, Integer
 from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 import re
 
 from domain.entities.movie import Movie
 from domain.entities.genre import Genre
 from domain.repositories.movie_repository import IMovieRepository
-from domain.value_objects.pagination import PaginationParams, PaginatedResult
+from domain.value_objects.pagination import PaginationParams, PaginatedResult, PageCursor
 from domain.value_objects.search_criteria import SearchCriteria
-from infrastructure.database.models import MovieModel, UserModel
+from infrastructure.database.models import (
+    MovieModel, UserModel, GenreModel, MovieGenreModel, TagModel, MovieTagModel, RelatedMovieModel,
+    DataVersionModel
+)
 from infrastructure.database.database import get_db
+from infrastructure.cache.bloom_filter import BloomFilter
+from infrastructure.cache.cache_manager import CacheManager
 from application.mappers.movie_mapper import MovieMapper
 
+# FTS5 index maintained by triggers on the movies table (see database/models.py)
+movies_fts = table("movies_fts", column("rowid", Integer), column("rank"))
+
+# Columns a Movie is read from. Queries select these as plain rows rather
+# than MovieModel instances, which skips ORM hydration and the identity map.
+MOVIE_COLUMNS = (
+    MovieModel.movieId,
+    MovieModel.title,
+    MovieModel.genres,
+    MovieModel.imdb_id,
+    MovieModel.tmdb_id,
+    MovieModel.ratings_count,
+    MovieModel.zero_to_one_ratings_count,
+    MovieModel.one_to_two_ratings_count,
+    MovieModel.two_to_three_ratings_count,
+    MovieModel.three_to_four_ratings_count,
+    MovieModel.four_to_five_ratings_count,
+    MovieModel.average_rating,
+    MovieModel.tags,
+    MovieModel.earliest_rating,
+    MovieModel.latest_rating,
+    MovieModel.earliest_tag,
+    MovieModel.latest_tag,
+    MovieModel.release_year,
+    MovieModel.positive_rating_percentage,
+)
+
+# Single-movie reads also pass the rest of the stored percentages through;
+# list rows leave them out since summaries never show them
+DETAIL_MOVIE_COLUMNS = MOVIE_COLUMNS + (
+    MovieModel.negative_rating_percentage,
+    MovieModel.zero_to_one_ratings_percentage,
+    MovieModel.one_to_two_ratings_percentage,
+    MovieModel.two_to_three_ratings_percentage,
+    MovieModel.three_to_four_ratings_percentage,
+    MovieModel.four_to_five_ratings_percentage,
+)
+RATING_DISTRIBUTION_KEYS = ("0-1", "1-2", "2-3", "3-4", "4-5")
+
+# Column each ID kind is looked up by, and the Movie attribute it is read into
+ID_KINDS = {
+    "id": (MovieModel.movieId, "movieId"),
+    "imdb": (MovieModel.imdb_id, "imdb_id"),
+    "tmdb": (MovieModel.tmdb_id, "tmdb_id"),
+}
+
+
+# String form of stored and requested IDs. imdb_id / tmdb_id may be stored
+# as INTEGER, REAL or TEXT and SQLite compares them numerically, so the
+# filters, the negative cache and the entities all use this one form.
+normalize_id = Movie.normalize_external_id
+
+
+def stored_id_forms(value) -> List[str]:
+    """
+    Values to match an external ID column against: a numeric ID may also be
+    stored as TEXT with a ".0" suffix (INTEGER/REAL columns convert the text)
+    """
+    key = normalize_id(value)
+    return [key, f"{key}.0"] if key.isdigit() else [key]
+
 
 class SqliteMovieRepository(IMovieRepository):
     """
@@ -25,8 +94,27 @@ class SqliteMovieRepository(IMovieRepository):
     Implements movie data access using SQLite database
     """
 
+    # Known-ID filters are rebuilt this often to see other workers' inserts
+    KNOWN_IDS_REFRESH_INTERVAL = 300
+    # Confirmed misses that got past the filters (bounded LRU)
+    NEGATIVE_CACHE_SIZE = 10000
+    NEGATIVE_CACHE_TTL = 300
+    # Cached totals (bounded LRU, TTL from CACHE_TTL["total_count"])
+    COUNT_CACHE_SIZE = 1000
+
     def __init__(self):
         self._genres_cache: Optional[List[Genre]] = None
+        # Totals keyed by normalized filter, e.g. ("genre", "drama"); kept
+        # current by create() so repeat page requests skip COUNT(*) entirely
+        self._count_cache = CacheManager(max_size=self.COUNT_CACHE_SIZE)
+        # Last data_version seen; a change made elsewhere drops the caches
+        self._data_version: Optional[int] = None
+        # Bloom filters of existing movieId / imdb_id / tmdb_id values, so
+        # lookups of unknown IDs return None without a query
+        self._known_ids: Optional[Dict[str, BloomFilter]] = None
+        self._known_ids_built_at = 0.0
+        self._known_ids_lock = asyncio.Lock()
+        self._negative_cache: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
 
     def _movie_model_to_entity(self, model: MovieModel) -> Movie:
         """Convert MovieModel to Movie entity"""
@@ -52,64 +140,306 @@ class SqliteMovieRepository(IMovieRepository):
         return MovieMapper.from_database_data(movie_data)
 
     def _entity_to_movie_model(self, movie: Movie) -> MovieModel:
-        """Convert Movie entity to MovieModel"""
+        """Convert Movie entity to MovieModel, stored rating percentages included"""
+        distribution = movie.get_rating_distribution()
         return MovieModel(
             movieId=int(movie.movieId) if movie.movieId.isdigit() else 0,
             title=movie.title,
-            genres='|'.join(movie.genres)
+            genres='|'.join(movie.genres),
+            imdb_id=movie.imdb_id,
+            tmdb_id=movie.tmdb_id,
+            ratings_count=movie.ratings_count,
+            zero_to_one_ratings_count=movie.zero_to_one_ratings_count,
+            one_to_two_ratings_count=movie.one_to_two_ratings_count,
+            two_to_three_ratings_count=movie.two_to_three_ratings_count,
+            three_to_four_ratings_count=movie.three_to_four_ratings_count,
+            four_to_five_ratings_count=movie.four_to_five_ratings_count,
+            average_rating=movie.average_rating,
+            tags='|'.join(movie.tags),
+            earliest_rating=movie.earliest_rating,
+            latest_rating=movie.latest_rating,
+            earliest_tag=movie.earliest_tag,
+            latest_tag=movie.latest_tag,
+            release_year=movie.release_year,
+            positive_rating_percentage=movie.get_positive_rating_percentage(),
+            negative_rating_percentage=movie.get_negative_rating_percentage(),
+            zero_to_one_ratings_percentage=distribution["0-1"],
+            one_to_two_ratings_percentage=distribution["1-2"],
+            two_to_three_ratings_percentage=distribution["2-3"],
+            three_to_four_ratings_percentage=distribution["3-4"],
+            four_to_five_ratings_percentage=distribution["4-5"]
+        )
+
+    def _build_fts_query(self, search_text: str) -> Optional[str]:
+        """Turn free text into an FTS5 prefix query: 'toy sto' -> '"toy"* "sto"*'"""
+        terms = re.findall(r'\w+', search_text)
+        if not terms:
+            return None
+        return ' '.join(f'"{term}"*' for term in terms)
+
+    def _genre_movie_ids(self, *genres: str):
+        """Subquery of movie IDs linked to any of the given genres (exact, case-insensitive)"""
+        normalized = [g.lower().strip() for g in genres if g and g.strip()]
+        return (
+            select(MovieGenreModel.movie_id)
+            .join(GenreModel, GenreModel.id == MovieGenreModel.genre_id)
+            .where(GenreModel.normalized_name.in_(normalized))
         )
 
-    def _extract_year_from_title(self, title: str) -> Optional[int]:
-        """Extract year from movie title if it ends with (YYYY)."""
-        match = re.search(r'\((\d{4})\)\s*$', title)
-        if match:
-            return int(match.group(1))
-        return None
-
-    def _create_movie_data_from_row(self, row) -> dict:
-        """Create movie data dictionary from database row"""
-        if hasattr(row, '__getitem__'):
-            # Handle tuple/row data
-            return {
-                'movieId': str(row[0]),
-                'title': row[1] or "",
-                'genres': row[2] or "",
-                'imdb_id': row[3] or "",
-                'tmdb_id': row[4] or "",
-                'ratings_count': row[5] or 0,
-                'zero_to_one_ratings_count': row[6] or 0,
-                'one_to_two_ratings_count': row[7] or 0,
-                'two_to_three_ratings_count': row[8] or 0,
-                'three_to_four_ratings_count': row[9] or 0,
-                'four_to_five_ratings_count': row[10] or 0,
-                'average_rating': row[11] or 0.0,
-                'tags': row[12] or "",
-                'earliest_rating': row[13] or "",
-                'latest_rating': row[14] or "",
-                'earliest_tag': row[15] or "",
-                'latest_tag': row[16] or ""
-            }
+    async def _link_genres(self, session: AsyncSession, movie_id: int, genres: List[str]) -> None:
+        """Insert movie_genres rows for a movie, creating missing genres on the way"""
+        names = {}
+        for genre in genres:
+            if genre and genre.strip():
+                names.setdefault(genre.lower().strip(), genre.strip())
+        if not names:
+            return
+
+        result = await session.execute(
+            select(GenreModel).where(GenreModel.normalized_name.in_(list(names)))
+        )
+        genre_models = {g.normalized_name: g for g in result.scalars()}
+        for key, name in names.items():
+            if key not in genre_models:
+                genre_models[key] = GenreModel(name=name, normalized_name=key)
+                session.add(genre_models[key])
+        await session.flush()
+
+        for position, key in enumerate(names):
+            session.add(MovieGenreModel(
+                movie_id=movie_id,
+                genre_id=genre_models[key].id,
+                position=position
+            ))
+
+    async def _link_tags(self, session: AsyncSession, movie_id: int, tags: List[str]) -> None:
+        """Insert movie_tag_counts rows for a movie, creating missing tags on the way"""
+        names = {}
+        counts = {}
+        for tag in tags:
+            if tag and tag.strip():
+                key = tag.strip().casefold()
+                names.setdefault(key, tag.strip())
+                counts[key] = counts.get(key, 0) + 1
+        if not names:
+            return
+
+        result = await session.execute(
+            select(TagModel).where(TagModel.normalized_name.in_(list(names)))
+        )
+        tag_models = {t.normalized_name: t for t in result.scalars()}
+        for key, name in names.items():
+            if key not in tag_models:
+                tag_models[key] = TagModel(name=name, normalized_name=key)
+                session.add(tag_models[key])
+        await session.flush()
+
+        for key, count in counts.items():
+            session.add(MovieTagModel(
+                movie_id=movie_id,
+                tag_id=tag_models[key].id,
+                tag_count=count
+            ))
+
+    @staticmethod
+    def _count_key(key: Tuple) -> str:
+        """Cache key of a filter total, e.g. total_count:genre:('drama',)"""
+        return f"total_count:{key[0]}:{key[1:]!r}"
+
+    async def _cached_count(self, session: AsyncSession, key: Tuple, count_query) -> int:
+        """Return the total for a filter, running count_query only on a cache miss"""
+        async def count():
+            return (await session.execute(count_query)).scalar() or 0
+
+        return await self._count_cache.get_or_set(self._count_key(key), count)
+
+    @classmethod
+    def _known_ids_from_rows(cls, rows: Sequence[Tuple]) -> Dict[str, BloomFilter]:
+        """Known-ID filters of (movieId, imdb_id, tmdb_id) rows"""
+        # Headroom for movies created before the next rebuild
+        capacity = max(1000, len(rows) * 2)
+        return {
+            kind: BloomFilter.from_items(
+                (key for key in (normalize_id(row[i]) for row in rows) if key),
+                capacity
+            )
+            for i, kind in enumerate(ID_KINDS)
+        }
+
+    async def _get_known_ids(self) -> Dict[str, BloomFilter]:
+        """Known-ID filters, (re)built from one scan of the three ID columns"""
+        now = time.monotonic()
+        if self._known_ids is not None and now - self._known_ids_built_at < self.KNOWN_IDS_REFRESH_INTERVAL:
+            return self._known_ids
+
+        async with self._known_ids_lock:
+            if self._known_ids is not None and now - self._known_ids_built_at < self.KNOWN_IDS_REFRESH_INTERVAL:
+                return self._known_ids
+            async for session in get_db():
+                result = await session.execute(
+                    select(MovieModel.movieId, MovieModel.imdb_id, MovieModel.tmdb_id)
+                )
+                rows = result.all()
+            self._known_ids = self._known_ids_from_rows(rows)
+            self._known_ids_built_at = time.monotonic()
+            self._negative_cache.clear()
+            return self._known_ids
+
+    async def _may_exist(self, kind: str, value) -> bool:
+        """False when value is certainly not a stored ID of this kind"""
+        value = normalize_id(value)
+        known_ids = await self._get_known_ids()
+        if value not in known_ids[kind]:
+            return False
+
+        expires_at = self._negative_cache.get((kind, value))
+        if expires_at is None:
+            return True
+        if expires_at <= time.monotonic():
+            del self._negative_cache[(kind, value)]
+            return True
+        self._negative_cache.move_to_end((kind, value))
+        return False
+
+    def _remember_missing(self, kind: str, value) -> None:
+        """Cache a miss the filter could not rule out"""
+        value = normalize_id(value)
+        self._negative_cache[(kind, value)] = time.monotonic() + self.NEGATIVE_CACHE_TTL
+        self._negative_cache.move_to_end((kind, value))
+        while len(self._negative_cache) > self.NEGATIVE_CACHE_SIZE:
+            self._negative_cache.popitem(last=False)
+
+    def _add_known_ids(self, movie_model: MovieModel) -> None:
+        """Make a newly created movie findable through the filters"""
+        ids = [("id", movie_model.movieId), ("imdb", movie_model.imdb_id), ("tmdb", movie_model.tmdb_id)]
+        for kind, value in ids:
+            value = normalize_id(value)
+            if not value:
+                continue
+            self._negative_cache.pop((kind, value), None)
+            if self._known_ids is not None:
+                self._known_ids[kind].add(value)
+        # Past its capacity the filter lets through too many misses
+        if self._known_ids is not None and self._known_ids["id"].is_full:
+            self._known_ids = None
+
+    async def _update_counts_for_new_movie(self, movie_model: MovieModel, genres: List[str], tags: List[str]) -> None:
+        """Bump the cached totals a newly inserted movie belongs to"""
+        keys = [("all",)]
+        if movie_model.average_rating is not None and movie_model.average_rating >= 4.0:
+            keys.append(("highly_rated",))
+        keys += [("genre", g) for g in {g.lower().strip() for g in genres if g and g.strip()}]
+        keys += [("tag", t) for t in {t.strip().casefold() for t in tags if t and t.strip()}]
+        for key in keys:
+            total = await self._count_cache.get(self._count_key(key))
+            if total is not None:
+                await self._count_cache.set(self._count_key(key), total + 1)
+
+        # Search totals depend on too many inputs to patch - recount on demand
+        await self._count_cache.clear("total_count:search")
+
+    async def _fetch_page(
+        self,
+        session: AsyncSession,
+        query,
+        pagination: PaginationParams,
+        total: int,
+        sort: str,
+        sort_columns: list,
+        descending: bool = False
+    ) -> PaginatedResult[Movie]:
+        """
+        Order query by sort_columns (the last one must make rows unique) and
+        fetch one page. With a cursor the page starts with a seek on the
+        sort key instead of skipping offset rows, so deep pages cost the
+        same as the first one. Every page carries next_cursor.
+        """
+        query = query.add_columns(*sort_columns).order_by(
+            *[desc(c) if descending else asc(c) for c in sort_columns]
+        )
+
+        if pagination.is_keyset:
+            values = PageCursor.decode(pagination.cursor, sort).values
+            if len(values) != len(sort_columns):
+                raise ValueError("Invalid pagination cursor")
+            key, after = tuple_(*sort_columns), tuple_(*values)
+            query = query.where(key < after if descending else key > after)
         else:
-            # Handle SQLAlchemy model object
-            return {
-                'movieId': str(row.movieId),
-                'title': row.title or "",
-                'genres': row.genres or "",
-                'imdb_id': row.imdb_id or "",
-                'tmdb_id': row.tmdb_id or "",
-                'ratings_count': row.ratings_count or 0,
-                'zero_to_one_ratings_count': row.zero_to_one_ratings_count or 0,
-                'one_to_two_ratings_count': row.one_to_two_ratings_count or 0,
-                'two_to_three_ratings_count': row.two_to_three_ratings_count or 0,
-                'three_to_four_ratings_count': row.three_to_four_ratings_count or 0,
-                'four_to_five_ratings_count': row.four_to_five_ratings_count or 0,
-                'average_rating': row.average_rating or 0.0,
-                'tags': row.tags or "",
-                'earliest_rating': row.earliest_rating or "",
-                'latest_rating': row.latest_rating or "",
-                'earliest_tag': row.earliest_tag or "",
-                'latest_tag': row.latest_tag or ""
-            }
+            query = query.offset(pagination.offset)
+
+        rows = (await session.execute(query.limit(pagination.limit + 1))).all()
+        next_cursor = None
+        if len(rows) > pagination.limit:
+            rows = rows[:pagination.limit]
+            next_cursor = PageCursor(sort=sort, values=tuple(rows[-1][len(MOVIE_COLUMNS):])).encode()
+
+        return PaginatedResult(
+            data=[self._movie_from_row(row) for row in rows],
+            total=total,
+            page=pagination.page,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
+            next_cursor=next_cursor
+        )
+
+    @staticmethod
+    def _movie_from_row(row, detail: bool = False) -> Movie:
+        """
+        Map a MOVIE_COLUMNS row (DETAIL_MOVIE_COLUMNS when detail) straight to
+        a Movie entity. Rows were validated when they were written, so this
+        skips the intermediate dict and the entity's re-validation, but storage
+        types are coerced to the entity's: IDs to strings (see normalize_id),
+        REAL histogram counts to int. genres/tags are split exactly once here
+        and stored percentages are passed through.
+        """
+        (movie_id, title, genres, imdb_id, tmdb_id, ratings_count,
+         zero_to_one, one_to_two, two_to_three, three_to_four, four_to_five,
+         average_rating, tags, earliest_rating, latest_rating, earliest_tag,
+         latest_tag, release_year, positive_percentage) = row[:len(MOVIE_COLUMNS)]
+        stored = {}
+        if detail:
+            negative_percentage, *distribution = row[len(MOVIE_COLUMNS):len(DETAIL_MOVIE_COLUMNS)]
+            if negative_percentage is not None:  # NULL until the catalog build fills it
+                stored = {
+                    "negative_rating_percentage": negative_percentage,
+                    "rating_distribution": dict(zip(RATING_DISTRIBUTION_KEYS, distribution)),
+                }
+        return Movie.from_trusted(
+            movieId=str(movie_id),
+            title=title or "",
+            genres=[g.strip() for g in genres.split('|') if g and g.strip()] if genres else [],
+            imdb_id=normalize_id(imdb_id),
+            tmdb_id=normalize_id(tmdb_id),
+            ratings_count=int(ratings_count or 0),
+            zero_to_one_ratings_count=int(zero_to_one or 0),
+            one_to_two_ratings_count=int(one_to_two or 0),
+            two_to_three_ratings_count=int(two_to_three or 0),
+            three_to_four_ratings_count=int(three_to_four or 0),
+            four_to_five_ratings_count=int(four_to_five or 0),
+            average_rating=float(average_rating or 0.0),
+            tags=[t.strip() for t in tags.split('|') if t and t.strip()] if tags else [],
+            earliest_rating=earliest_rating or "",
+            latest_rating=latest_rating or "",
+            earliest_tag=earliest_tag or "",
+            latest_tag=latest_tag or "",
+            release_year=release_year,
+            positive_rating_percentage=positive_percentage,
+            **stored
+        )
+
+    @staticmethod
+    def _movie_columns(fields: Optional[FrozenSet[str]]) -> tuple:
+        """
+        MOVIE_COLUMNS with the Movie attributes outside fields (movieId is
+        always kept) selected as NULL, so SQLite never decodes them and the
+        rows keep the shape _movie_from_row unpacks.
+        """
+        if fields is None:
+            return MOVIE_COLUMNS
+        return tuple(
+            c if c.key == 'movieId' or c.key in fields else null().label(c.key)
+            for c in MOVIE_COLUMNS
+        )
 
     async def create(self, movie: Movie) -> Movie:
         """Create a new movie and save to database"""
@@ -126,122 +456,236 @@ class SqliteMovieRepository(IMovieRepository):
             
             movie_model = self._entity_to_movie_model(movie)
             session.add(movie_model)
+            await self._link_genres(session, movie_id, movie.genres)
+            await self._link_tags(session, movie_id, movie.tags)
+            await session.execute(
+                sqlite_insert(DataVersionModel)
+                .values(id=1, version=1)
+                .on_conflict_do_update(index_elements=[DataVersionModel.id], set_={"version": DataVersionModel.version + 1})
+            )
+            version = (await session.execute(select(DataVersionModel.version).where(DataVersionModel.id == 1))).scalar()
             await session.commit()
             await session.refresh(movie_model)
+            # Our own write is applied to the caches below; only a gap means
+            # another process wrote too, and the next get_data_version() flushes
+            if self._data_version is not None and version == self._data_version + 1:
+                self._data_version = version
+            self._genres_cache = None
+            await self._update_counts_for_new_movie(movie_model, movie.genres, movie.tags)
+            self._add_known_ids(movie_model)
             return movie
 
-    async def find_all(self, pagination: PaginationParams) -> PaginatedResult[Movie]:
+    async def find_all(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
         """Find all movies with pagination"""
+        columns = self._movie_columns(fields)
         async for session in get_db():
             # Get total count
-            total_count = await session.execute(select(func.count(MovieModel.movieId)))
-            total = total_count.scalar()
-            
-            # Get paginated results - select all available columns
-            query = select(MovieModel).offset(pagination.offset).limit(pagination.limit)
-            result = await session.execute(query)
-            movies = []
-            for row in result.scalars():
-                movie_data = self._create_movie_data_from_row(row)
-                movies.append(MovieMapper.from_database_data(movie_data))
+            total = await self._cached_count(session, ("all",), select(func.count(MovieModel.movieId)))
             
-            return PaginatedResult(
-                data=movies,
-                total=total,
-                page=pagination.page,
-                limit=pagination.limit
+            # Get paginated results - select only the requested columns
+            return await self._fetch_page(
+                session, select(*columns), pagination, total,
+                sort="id", sort_columns=[MovieModel.movieId]
             )
 
     async def find_by_id(self, movie_id: str) -> Optional[Movie]:
         """Find movie by ID"""
+        # Convert movie_id to int for database query
+        try:
+            movie_id_int = int(movie_id)
+        except ValueError:
+            return None
+        if not await self._may_exist("id", str(movie_id_int)):
+            return None
+
         async for session in get_db():
-            # Convert movie_id to int for database query
-            try:
-                movie_id_int = int(movie_id)
-            except ValueError:
-                return None
-                
             result = await session.execute(
-                select(MovieModel)
+                select(*DETAIL_MOVIE_COLUMNS)
                 .where(MovieModel.movieId == movie_id_int)
             )
-            row = result.scalar_one_or_none()
+            row = result.one_or_none()
             if row:
-                movie_data = self._create_movie_data_from_row(row)
-                return MovieMapper.from_database_data(movie_data)
+                return self._movie_from_row(row, detail=True)
+            self._remember_missing("id", str(movie_id_int))
             return None
 
+    async def find_by_ids(self, ids: Sequence[str], kind: str = "id") -> Dict[str, Movie]:
+        """Find many movies by one kind of ID with a single IN query"""
+        id_column, attribute = ID_KINDS[kind]
+
+        # Requested ID -> stored form; the known-ID filters drop certain misses
+        wanted: Dict[str, str] = {}
+        for value in dict.fromkeys(ids):
+            if kind == "id":
+                try:
+                    stored = str(int(value))
+                except ValueError:
+                    continue
+            else:
+                stored = value
+            if await self._may_exist(kind, stored):
+                wanted[value] = stored
+        if not wanted:
+            return {}
+
+        if kind == "id":
+            keys = {int(v) for v in wanted.values()}
+        else:
+            keys = {form for v in wanted.values() for form in stored_id_forms(v)}
+        movies: Dict[str, Movie] = {}
+        async for session in get_db():
+            result = await session.execute(select(*DETAIL_MOVIE_COLUMNS).where(id_column.in_(keys)))
+            for row in result.all():
+                movie = self._movie_from_row(row, detail=True)
+                movies.setdefault(normalize_id(getattr(movie, attribute)), movie)
+
+        found = {value: movies.get(normalize_id(stored)) for value, stored in wanted.items()}
+        for value, movie in found.items():
+            if movie is None:
+                self._remember_missing(kind, wanted[value])
+        return {value: movie for value, movie in found.items() if movie is not None}
+
+    def _apply_search_filters(self, query, criteria: SearchCriteria):
+        """
+        Add the criteria filters to query. Returns (query, fts_query); query
+        is None when the title has nothing searchable, i.e. nothing matches.
+        """
+        fts_query = None
+        if criteria.has_title_search():
+            fts_query = self._build_fts_query(criteria.get_normalized_title())
+            if fts_query is None:
+                # Nothing searchable left (e.g. only punctuation) - match nothing
+                return None, None
+            query = (
+                query
+                .join(movies_fts, movies_fts.c.rowid == MovieModel.movieId)
+                .where(text("movies_fts MATCH :fts_query").bindparams(fts_query=fts_query))
+            )
+        
+        if criteria.has_genre_filter():
+            query = query.where(
+                MovieModel.movieId.in_(self._genre_movie_ids(criteria.genre))
+            )
+        
+        if criteria.has_year_filter():
+            # Exact year, range and decade all collapse to one index range scan
+            start_year, end_year = criteria.get_year_range()
+            if start_year is not None:
+                query = query.where(MovieModel.release_year >= start_year)
+            if end_year is not None:
+                query = query.where(MovieModel.release_year <= end_year)
+        
+        if criteria.min_rating is not None:
+            query = query.where(MovieModel.average_rating >= criteria.min_rating)
+        if criteria.max_rating is not None:
+            query = query.where(MovieModel.average_rating <= criteria.max_rating)
+        if criteria.min_positive is not None:
+            query = query.where(MovieModel.positive_rating_percentage >= criteria.min_positive)
+        
+        return query, fts_query
+
     async def search(
         self, 
         criteria: SearchCriteria, 
-        pagination: PaginationParams
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
     ) -> PaginatedResult[Movie]:
-        """Search movies based on criteria"""
+        """Search movies based on criteria, ranking title matches with bm25"""
+        columns = self._movie_columns(fields)
         async for session in get_db():
-            query = select(MovieModel)
-            
-            # Apply filters
-            if criteria.has_title_search():
-                query = query.where(
-                    MovieModel.title.ilike(f"%{criteria.get_normalized_title()}%")
-                )
-            
-            if criteria.has_genre_filter():
-                query = query.where(
-                    MovieModel.genres.ilike(f"%{criteria.genre}%")
-                )
-            
-            if criteria.year is not None:
-                query = query.where(
-                    MovieModel.title.ilike(f"%({criteria.year})%")
+            query, fts_query = self._apply_search_filters(select(*columns), criteria)
+            if query is None:
+                return PaginatedResult(
+                    data=[], total=0, page=pagination.page, limit=pagination.limit, cursor=pagination.cursor
                 )
             
             # Get total count
-            count_query = select(func.count()).select_from(query.subquery())
-            total_count = await session.execute(count_query)
-            total = total_count.scalar()
-            
-            # Apply pagination
-            query = query.offset(pagination.offset).limit(pagination.limit)
-            result = await session.execute(query)
-            movies = []
-            for row in result.scalars():
-                movie_data = self._create_movie_data_from_row(row)
-                movies.append(MovieMapper.from_database_data(movie_data))
+            count_key = (
+                "search",
+                fts_query,
+                criteria.genre.lower().strip() if criteria.has_genre_filter() else None,
+                criteria.get_year_range() if criteria.has_year_filter() else None,
+                (criteria.min_rating, criteria.max_rating) if criteria.has_rating_filter() else None,
+                criteria.min_positive
+            )
+            total = await self._cached_count(
+                session, count_key, select(func.count()).select_from(query.subquery())
+            )
             
-            return PaginatedResult(
-                data=movies,
-                total=total,
-                page=pagination.page,
-                limit=pagination.limit
+            # Best matches first when searching by title
+            if fts_query is not None:
+                return await self._fetch_page(
+                    session, query, pagination, total,
+                    sort="relevance", sort_columns=[movies_fts.c.rank, MovieModel.movieId]
+                )
+            return await self._fetch_page(
+                session, query, pagination, total,
+                sort="id", sort_columns=[MovieModel.movieId]
             )
 
+    async def iter_movies(
+        self,
+        criteria: SearchCriteria,
+        after_id: Optional[int] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[Movie]:
+        """
+        Stream the movies matching criteria in movieId order, after after_id.
+        Each batch is a keyset seek on the primary key in its own short
+        session: memory stays at one batch, no COUNT(*) is run, and no read
+        transaction is held open while a slow client consumes the stream
+        (on SQLite that would keep writers out for the whole export).
+        """
+        query, _ = self._apply_search_filters(select(*MOVIE_COLUMNS), criteria)
+        if query is None:
+            return
+        query = query.order_by(MovieModel.movieId).limit(batch_size)
+
+        last_id = after_id
+        while True:
+            batch = query if last_id is None else query.where(MovieModel.movieId > last_id)
+            async for session in get_db():
+                rows = (await session.execute(batch)).all()
+            for row in rows:
+                yield self._movie_from_row(row)
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+
     async def find_by_genre(
         self, 
         genre: str, 
-        pagination: PaginationParams
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
     ) -> PaginatedResult[Movie]:
-        """Find movies by genre"""
+        """Find movies by genre using the movie_genres index"""
+        columns = self._movie_columns(fields)
         async for session in get_db():
-            query = select(MovieModel).where(
-                MovieModel.genres.ilike(f"%{genre}%")
+            genre_filter = GenreModel.normalized_name == genre.lower().strip()
+            query = (
+                select(*columns)
+                .join(MovieGenreModel, MovieGenreModel.movie_id == MovieModel.movieId)
+                .join(GenreModel, GenreModel.id == MovieGenreModel.genre_id)
+                .where(genre_filter)
             )
             
-            # Get total count
-            count_query = select(func.count()).select_from(query.subquery())
-            total_count = await session.execute(count_query)
-            total = total_count.scalar()
-            
-            # Apply pagination
-            query = query.offset(pagination.offset).limit(pagination.limit)
-            result = await session.execute(query)
-            movies = [MovieMapper.from_database_data(self._create_movie_data_from_row(m)) for m in result.scalars().all()]
+            # Get total count - answered from the association index alone
+            count_query = (
+                select(func.count())
+                .select_from(MovieGenreModel)
+                .join(GenreModel, GenreModel.id == MovieGenreModel.genre_id)
+                .where(genre_filter)
+            )
+            total = await self._cached_count(session, ("genre", genre.lower().strip()), count_query)
             
-            return PaginatedResult(
-                data=movies,
-                total=total,
-                page=pagination.page,
-                limit=pagination.limit
+            # Walk the (genre_id, movie_id) index in order
+            return await self._fetch_page(
+                session, query, pagination, total,
+                sort="id", sort_columns=[MovieGenreModel.movie_id]
             )
 
     async def find_all_genres(self) -> List[Genre]:
@@ -250,31 +694,28 @@ class SqliteMovieRepository(IMovieRepository):
             return self._genres_cache
 
         async for session in get_db():
-            result = await session.execute(select(MovieModel.genres))
-            genre_strings = result.scalars().all()
-            
-            genre_set = set()
-            for genre_string in genre_strings:
-                genres = [g.strip() for g in genre_string.split('|') if g.strip()]
-                genre_set.update(genres)
-            
-            genres = [Genre(name=name) for name in sorted(genre_set)]
+            result = await session.execute(select(GenreModel.name).order_by(GenreModel.name))
+            genres = [Genre(name=name) for name in result.scalars().all()]
             self._genres_cache = genres
             return genres
 
-    async def find_popular(self, pagination: PaginationParams) -> PaginatedResult[Movie]:
+    async def find_popular(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
         """Find popular movies (by ratings count)"""
+        columns = self._movie_columns(fields)
         async for session in get_db():
-            query = select(MovieModel).order_by(desc(MovieModel.ratings_count))
+            query = select(*columns).order_by(desc(MovieModel.ratings_count))
             
             # Get total count
-            total_count = await session.execute(select(func.count(MovieModel.movieId)))
-            total = total_count.scalar()
+            total = await self._cached_count(session, ("all",), select(func.count(MovieModel.movieId)))
             
             # Apply pagination
             query = query.offset(pagination.offset).limit(pagination.limit)
             result = await session.execute(query)
-            movies = [MovieMapper.from_database_data(self._create_movie_data_from_row(m)) for m in result.scalars().all()]
+            movies = [self._movie_from_row(m) for m in result.all()]
             
             return PaginatedResult(
                 data=movies,
@@ -283,44 +724,48 @@ class SqliteMovieRepository(IMovieRepository):
                 limit=pagination.limit
             )
 
-    async def find_highly_rated(self, pagination: PaginationParams) -> PaginatedResult[Movie]:
+    async def find_highly_rated(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
         """Find highly rated movies (by average rating)"""
+        columns = self._movie_columns(fields)
         async for session in get_db():
-            query = select(MovieModel).where(
+            query = select(*columns).where(
                 MovieModel.average_rating >= 4.0
-            ).order_by(desc(MovieModel.average_rating))
-            
-            # Get total count
-            total_count = await session.execute(select(func.count(MovieModel.movieId)))
-            total = total_count.scalar()
+            )
             
-            # Apply pagination
-            query = query.offset(pagination.offset).limit(pagination.limit)
-            result = await session.execute(query)
-            movies = [MovieMapper.from_database_data(self._create_movie_data_from_row(m)) for m in result.scalars().all()]
+            # Get total count - only the movies that pass the rating filter
+            total = await self._cached_count(
+                session, ("highly_rated",),
+                select(func.count()).select_from(MovieModel).where(MovieModel.average_rating >= 4.0)
+            )
             
-            return PaginatedResult(
-                data=movies,
-                total=total,
-                page=pagination.page,
-                limit=pagination.limit
+            # Walk the average_rating index backwards, ties broken by movieId
+            return await self._fetch_page(
+                session, query, pagination, total,
+                sort="rating", sort_columns=[MovieModel.average_rating, MovieModel.movieId],
+                descending=True
             )
 
-    async def find_recent(self, pagination: PaginationParams) -> PaginatedResult[Movie]:
-        """Find recent movies (by year in title)"""
+    async def find_recent(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
+        """Find recent movies (by release year)"""
+        columns = self._movie_columns(fields)
         async for session in get_db():
-            # This is a simplified implementation - in a real scenario,
-            # you might want to extract year from title and sort by it
-            query = select(MovieModel).order_by(desc(MovieModel.movieId))
+            query = select(*columns).order_by(desc(MovieModel.release_year), desc(MovieModel.movieId))
             
             # Get total count
-            total_count = await session.execute(select(func.count(MovieModel.movieId)))
-            total = total_count.scalar()
+            total = await self._cached_count(session, ("all",), select(func.count(MovieModel.movieId)))
             
             # Apply pagination
             query = query.offset(pagination.offset).limit(pagination.limit)
             result = await session.execute(query)
-            movies = [MovieMapper.from_database_data(self._create_movie_data_from_row(m)) for m in result.scalars().all()]
+            movies = [self._movie_from_row(m) for m in result.all()]
             
             return PaginatedResult(
                 data=movies,
@@ -338,11 +783,10 @@ class SqliteMovieRepository(IMovieRepository):
     async def get_total_count(self) -> int:
         """Get total number of movies"""
         async for session in get_db():
-            result = await session.execute(select(func.count(MovieModel.movieId)))
-            return result.scalar()
+            return await self._cached_count(session, ("all",), select(func.count(MovieModel.movieId)))
 
     async def find_related_movies(self, movie: Movie, limit: int = 5) -> List[Movie]:
-        """Find related movies based on genres"""
+        """Find related movies, precomputed by genre/tag similarity"""
         async for session in get_db():
             # Convert movie.movieId to int for database query
             try:
@@ -350,76 +794,140 @@ class SqliteMovieRepository(IMovieRepository):
             except ValueError:
                 movie_id_int = 0
             
-            # Find movies with similar genres
-            genre_conditions = []
-            for genre in movie.genres[:3]:  # Use first 3 genres
-                if genre and genre.strip():  # Only add non-empty genres
-                    genre_conditions.append(MovieModel.genres.ilike(f"%{genre.strip()}%"))
-            
-            # Build query based on whether we have genre conditions
-            query = select(MovieModel).where(MovieModel.movieId != movie_id_int)
-            
-            if genre_conditions:
-                # Use the | operator for OR conditions
-                combined_condition = genre_conditions[0]
-                for condition in genre_conditions[1:]:
-                    combined_condition = combined_condition | condition
-                query = query.where(combined_condition)
-            else:
-                # If no valid genres, just return some random movies
-                query = query.order_by(func.random())
-            
-            query = query.limit(limit)
-            
-            result = await session.execute(query)
-            return [MovieMapper.from_database_data(self._create_movie_data_from_row(m)) for m in result.scalars().all()]
+            # One range read of the related_movies primary key
+            result = await session.execute(
+                select(*MOVIE_COLUMNS)
+                .join(RelatedMovieModel, RelatedMovieModel.related_movie_id == MovieModel.movieId)
+                .where(RelatedMovieModel.movie_id == movie_id_int)
+                .order_by(RelatedMovieModel.rank)
+                .limit(limit)
+            )
+            related = result.all()
+            
+            if not related:
+                # Created since the last catalog build: best rated movies
+                # sharing any of the first 3 genres
+                genres = [g for g in movie.genres[:3] if g and g.strip()]
+                query = select(*MOVIE_COLUMNS).where(MovieModel.movieId != movie_id_int)
+                if genres:
+                    query = query.where(MovieModel.movieId.in_(self._genre_movie_ids(*genres)))
+                query = query.order_by(desc(MovieModel.average_rating)).limit(limit)
+                result = await session.execute(query)
+                related = result.all()
+            
+            return [self._movie_from_row(m) for m in related]
 
-    async def find_by_tag(self, tag: str, pagination: PaginationParams) -> PaginatedResult[Movie]:
-        """Find movies by tag"""
+    async def find_related_movies_for(self, movies: List[Movie], limit: int = 5) -> Dict[str, List[Movie]]:
+        """Related movies of several movies from one read of the precomputed table"""
+        movie_ids = {}
+        for movie in movies:
+            try:
+                movie_ids[int(movie.movieId)] = movie.movieId
+            except ValueError:
+                continue
+
+        related: Dict[str, List[Movie]] = {movie.movieId: [] for movie in movies}
+        if movie_ids:
+            async for session in get_db():
+                # Ranks run from 1, so the first `limit` are rank <= limit
+                result = await session.execute(
+                    select(*MOVIE_COLUMNS, RelatedMovieModel.movie_id)
+                    .join(RelatedMovieModel, RelatedMovieModel.related_movie_id == MovieModel.movieId)
+                    .where(RelatedMovieModel.movie_id.in_(movie_ids), RelatedMovieModel.rank <= limit)
+                    .order_by(RelatedMovieModel.movie_id, RelatedMovieModel.rank)
+                )
+                for row in result.all():
+                    related[movie_ids[row[len(MOVIE_COLUMNS)]]].append(self._movie_from_row(row))
+
+        # Created since the last catalog build: fall back one by one
+        for movie in movies:
+            if not related[movie.movieId]:
+                related[movie.movieId] = await self.find_related_movies(movie, limit)
+        return related
+
+    async def find_by_tag(
+        self,
+        tag: str,
+        pagination: PaginationParams,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> PaginatedResult[Movie]:
+        """Find movies by exact (case-insensitive) tag, most frequently tagged first"""
+        columns = self._movie_columns(fields)
         async for session in get_db():
-            query = select(MovieModel).where(
-                MovieModel.tags.ilike(f"%{tag}%")
+            tag_filter = TagModel.normalized_name == tag.strip().casefold()
+            query = (
+                select(*columns)
+                .join(MovieTagModel, MovieTagModel.movie_id == MovieModel.movieId)
+                .join(TagModel, TagModel.id == MovieTagModel.tag_id)
+                .where(tag_filter)
             )
             
-            # Get total count
-            count_query = select(func.count()).select_from(query.subquery())
-            total_count = await session.execute(count_query)
-            total = total_count.scalar()
-            
-            # Apply pagination
-            query = query.offset(pagination.offset).limit(pagination.limit)
-            result = await session.execute(query)
-            movies = [MovieMapper.from_database_data(self._create_movie_data_from_row(m)) for m in result.scalars().all()]
+            # Get total count - answered from the covering index alone
+            count_query = (
+                select(func.count())
+                .select_from(MovieTagModel)
+                .join(TagModel, TagModel.id == MovieTagModel.tag_id)
+                .where(tag_filter)
+            )
+            total = await self._cached_count(session, ("tag", tag.strip().casefold()), count_query)
             
-            return PaginatedResult(
-                data=movies,
-                total=total,
-                page=pagination.page,
-                limit=pagination.limit
+            # Walk the (tag_id, tag_count, movie_id) index backwards
+            return await self._fetch_page(
+                session, query, pagination, total,
+                sort="tag_count", sort_columns=[MovieTagModel.tag_count, MovieTagModel.movie_id],
+                descending=True
             )
 
     async def find_by_imdb_id(self, imdb_id: str) -> Optional[Movie]:
         """Find movie by IMDB ID"""
+        if not await self._may_exist("imdb", imdb_id):
+            return None
+
         async for session in get_db():
             result = await session.execute(
-                select(MovieModel).where(MovieModel.imdb_id == imdb_id)
+                select(*DETAIL_MOVIE_COLUMNS).where(MovieModel.imdb_id.in_(stored_id_forms(imdb_id)))
             )
-            movie_model = result.scalar_one_or_none()
-            if movie_model:
-                return MovieMapper.from_database_data(self._create_movie_data_from_row(movie_model))
+            row = result.one_or_none()
+            if row:
+                return self._movie_from_row(row, detail=True)
+            self._remember_missing("imdb", imdb_id)
             return None
 
     async def find_by_tmdb_id(self, tmdb_id: str) -> Optional[Movie]:
         """Find movie by TMDB ID"""
+        if not await self._may_exist("tmdb", tmdb_id):
+            return None
+
         async for session in get_db():
             result = await session.execute(
-                select(MovieModel).where(MovieModel.tmdb_id == tmdb_id)
+                select(*DETAIL_MOVIE_COLUMNS).where(MovieModel.tmdb_id.in_(stored_id_forms(tmdb_id)))
             )
-            movie_model = result.scalar_one_or_none()
-            if movie_model:
-                return MovieMapper.from_database_data(self._create_movie_data_from_row(movie_model))
+            row = result.one_or_none()
+            if row:
+                return self._movie_from_row(row, detail=True)
+            self._remember_missing("tmdb", tmdb_id)
             return None
 
+    async def get_data_version(self) -> int:
+        """
+        Shared data_version counter: bumped by create() and by every catalog
+        build. A change not made by this repository drops its caches.
+        """
+        async for session in get_db():
+            version = (await session.execute(select(DataVersionModel.version).where(DataVersionModel.id == 1))).scalar()
+        version = version or 0
+        if self._data_version is not None and version != self._data_version:
+            self._drop_caches()
+        self._data_version = version
+        return version
+
+    def _drop_caches(self) -> None:
+        """Forget everything derived from the stored data"""
+        self._genres_cache = None
+        self._count_cache = CacheManager(max_size=self.COUNT_CACHE_SIZE)
+        self._known_ids = None
+        self._negative_cache.clear()
+
     def clear_cache(self):
         """Clear internal cache"""
-        self._genres_cache = None 
\ No newline at end of file
+        self._drop_caches()
\ No newline at end of file
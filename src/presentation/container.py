@@ -0,0 +1,143 @@
+"""
+Application Container - Presentation Layer
+Composition root: builds the process-wide repositories, services and use
+cases once and owns their lifecycle
+"""
+import asyncio
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Optional, Union
+
+from pydantic import BaseModel
+
+from domain.repositories.movie_repository import IMovieRepository
+from application.dtos import movie_schemas
+from application.use_cases.movie_use_cases import MovieUseCase
+from application.use_cases.auth_use_cases import AuthUseCase
+from application.services.auth_service import AuthService
+from application.services.single_flight import SingleFlight
+from application.services.json_fragment_cache import JsonFragmentCache
+from infrastructure.database.database import Database, database
+from infrastructure.cache.cache_manager import CacheManager, cache_manager
+from infrastructure.cache.two_tier_cache import TwoTierCache, create_two_tier_cache
+from infrastructure.config.performance_config import PerformanceConfig
+from infrastructure.repositories.sqlite_movie_repository import SqliteMovieRepository
+from infrastructure.repositories.csv_movie_repository import CsvMovieRepository
+from infrastructure.repositories.columnar_movie_repository import ColumnarMovieRepository
+from infrastructure.repositories.sqlite_user_repository import SqliteUserRepository
+
+# Movie data source: "sqlite" (default), "csv" or "columnar"
+MOVIE_REPOSITORY_BACKEND = os.getenv("MOVIE_REPOSITORY_BACKEND", "sqlite")
+MOVIES_CSV_PATH = os.getenv("MOVIES_CSV_PATH", "data/movies.csv")
+
+
+def create_movie_repository(backend: str = MOVIE_REPOSITORY_BACKEND) -> IMovieRepository:
+    """Build the movie repository for a backend name"""
+    if backend == "sqlite":
+        return SqliteMovieRepository()
+    if backend == "csv":
+        return CsvMovieRepository(MOVIES_CSV_PATH)
+    if backend == "columnar":
+        return ColumnarMovieRepository(MOVIES_CSV_PATH)
+    raise ValueError(f"Unknown movie repository backend: {backend}")
+
+
+def cached_schema_version() -> str:
+    """Fingerprint of the DTO classes the use case caches (they are pickled into the shared L2)"""
+    schemas = {
+        name: model.model_json_schema()
+        for name, model in sorted(vars(movie_schemas).items())
+        if isinstance(model, type) and issubclass(model, BaseModel) and model.__module__ == movie_schemas.__name__
+    }
+    return hashlib.sha1(json.dumps(schemas, sort_keys=True).encode("utf-8")).hexdigest()[:8]
+
+
+def create_cache(shared: bool = PerformanceConfig.REDIS["enabled"]) -> Union[CacheManager, TwoTierCache]:
+    """Build the use case cache: process-local, or L1 + Redis when shared"""
+    if shared:
+        cache = create_two_tier_cache(schema_version=cached_schema_version())
+        if cache is not None:
+            return cache
+    return cache_manager
+
+
+class AppContainer:
+    """
+    Application Container
+    One instance per process, stored on app.state. Routers receive these
+    shared objects, so repository caches live as long as the process.
+    """
+
+    def __init__(
+        self,
+        db: Database = database,
+        cache: Union[CacheManager, TwoTierCache, None] = None,
+        movie_backend: str = MOVIE_REPOSITORY_BACKEND
+    ):
+        self.database = db
+        self.cache = cache or create_cache()
+        self.movie_repository = create_movie_repository(movie_backend)
+        self.user_repository = SqliteUserRepository()
+        self.auth_service = AuthService()
+        self.single_flight = SingleFlight()
+        self.json_fragments = JsonFragmentCache(ttl=PerformanceConfig.get_cache_ttl("movie_detail"))
+        self.movie_use_case = MovieUseCase(
+            self.movie_repository,
+            cache=self.cache,
+            single_flight=self.single_flight,
+            statistics_soft_ttl=PerformanceConfig.STALE_WHILE_REVALIDATE["statistics"],
+            json_fragments=self.json_fragments,
+            data_version_check_interval=PerformanceConfig.CATALOG_VERSION["check_interval"]
+        )
+        self.auth_use_case = AuthUseCase(self.user_repository, self.auth_service)
+        self.ready = False
+        self.warmup_stats: Dict[str, Any] = {}
+        self._warmup_task: Optional[asyncio.Task] = None
+
+    async def startup(self) -> None:
+        """Load shared state (in-memory backends read their data file here)"""
+        total = await self.movie_repository.get_total_count()
+        genres = await self.movie_repository.find_all_genres()
+        await self.movie_use_case.load_catalog_version()
+        print(f"🎬 Loaded {total} movies in {len(genres)} genres")
+
+        if not PerformanceConfig.WARMUP["enabled"]:
+            self.ready = True
+        elif PerformanceConfig.WARMUP["blocking"]:
+            await self.warm_up()
+        else:
+            self._warmup_task = asyncio.create_task(self.warm_up())
+
+    async def warm_up(self) -> None:
+        """Precompute hot responses, then report ready (also when parts of the warm-up fail)"""
+        start_time = time.time()
+        try:
+            result = await self.movie_use_case.warm_up(
+                top_movies=PerformanceConfig.WARMUP["top_movies"],
+                page_limit=PerformanceConfig.WARMUP["page_limit"],
+                concurrency=PerformanceConfig.WARMUP["concurrency"]
+            )
+            duration = time.time() - start_time
+            self.warmup_stats = {**result, "duration": round(duration, 3)}
+            print(f"🔥 Cache warm-up: {result['responses']} responses ({result['failed']} failed) in {duration:.2f}s")
+        except Exception as e:
+            self.warmup_stats = {"responses": 0, "failed": 0, "error": str(e)}
+            print(f"⚠️ Cache warm-up failed: {e}")
+        finally:
+            self.ready = True
+
+    async def shutdown(self) -> None:
+        """Drop caches and release database connections"""
+        if self._warmup_task is not None and not self._warmup_task.done():
+            self._warmup_task.cancel()
+        if isinstance(self.cache, TwoTierCache):
+            # clear() would invalidate the entries the other instances still use
+            await self.cache.l1.clear()
+            await self.cache.close()
+        else:
+            await self.cache.clear()
+        self.json_fragments.clear()
+        self.movie_repository.clear_cache()
+        await self.database.close()
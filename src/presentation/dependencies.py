@@ -0,0 +1,24 @@
+"""
+Dependencies - Presentation Layer
+FastAPI dependency providers that hand out the shared container objects
+"""
+from fastapi import Request
+
+from application.use_cases.movie_use_cases import MovieUseCase
+from application.use_cases.auth_use_cases import AuthUseCase
+from presentation.container import AppContainer
+
+
+def get_container(request: Request) -> AppContainer:
+    """Dependency to get the application container created at startup"""
+    return request.app.state.container
+
+
+def get_movie_use_case(request: Request) -> MovieUseCase:
+    """Dependency to get the shared movie use case"""
+    return get_container(request).movie_use_case
+
+
+def get_auth_use_case(request: Request) -> AuthUseCase:
+    """Dependency to get the shared authentication use case"""
+    return get_container(request).auth_use_case
@@ -4,6 +4,7 @@ Entry point for the Movie Streaming API with DDD + Clean Architecture
 """
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -18,6 +19,32 @@ src_path = current_dir / "src"
 sys.path.insert(0, str(src_path))
 
 from presentation.routers import movie_router, genre_router, auth_router
+from presentation.container import AppContainer
+from presentation.responses import FastJSONResponse
+from presentation.middleware.performance import setup_performance_monitoring
+from presentation.middleware.http_cache import setup_http_caching
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: build the shared container, tear it down on exit"""
+    print("🚀 Movie Streaming API starting up...")
+    print("📚 API Documentation: http://localhost:8000/docs")
+    print("🔄 Alternative docs: http://localhost:8000/redoc")
+    print("💓 Health check: http://localhost:8000/health")
+    print("=" * 60)
+    # Seed data
+    from src.infrastructure.database.seed_data import seed_users
+    await seed_users()
+
+    container = AppContainer()
+    await container.startup()
+    app.state.container = container
+    try:
+        yield
+    finally:
+        print("🛑 Movie Streaming API shutting down...")
+        await container.shutdown()
 
 # Create FastAPI application instance
 app = FastAPI(
@@ -71,9 +98,17 @@ app = FastAPI(
     },
     docs_url="/docs",  # Swagger UI
     redoc_url="/redoc",  # ReDoc
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
 )
 
+# ETag / 304 / Cache-Control for catalog reads (inside the timing middleware)
+setup_http_caching(app)
+
+# Request timing and /api/performance/stats
+setup_performance_monitoring(app)
+
 # Add Gzip compression middleware
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
@@ -115,6 +150,20 @@ async def health_check():
         ]
     }
 
+# Readiness endpoint (load balancers route traffic here only once warmed up)
+@app.get("/ready", tags=["health"])
+async def readiness_check():
+    """Readiness check: 503 until the startup cache warm-up has finished"""
+    container = getattr(app.state, "container", None)
+    if container is None or not container.ready:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "warming_up", "message": "Cache warm-up in progress"}
+        )
+    # Still serving, only without (part of) the precomputed responses
+    degraded = container.warmup_stats.get("failed") or "error" in container.warmup_stats
+    return {"status": "degraded" if degraded else "ready", "warmup": container.warmup_stats}
+
 # API Info endpoint
 @app.get("/info", tags=["info"])
 async def api_info():
@@ -188,25 +237,6 @@ async def global_exception_handler(request, exc):
         content={"detail": "Internal server error", "status_code": 500}
     )
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Application startup event"""
-    print("🚀 Movie Streaming API starting up...")
-    print("📚 API Documentation: http://localhost:8000/docs")
-    print("🔄 Alternative docs: http://localhost:8000/redoc")
-    print("💓 Health check: http://localhost:8000/health")
-    print("=" * 60)
-    # Seed data
-    from src.infrastructure.database.seed_data import seed_users
-    await seed_users()
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown event"""
-    print("🛑 Movie Streaming API shutting down...")
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -0,0 +1,99 @@
+"""
+HTTP Cache Middleware - Presentation Layer
+Strong ETags, If-None-Match and Cache-Control for catalog GET endpoints
+"""
+import hashlib
+import re
+from typing import List, Optional, Tuple
+from fastapi import Request, Response
+import logging
+
+from infrastructure.config.performance_config import PerformanceConfig
+
+logger = logging.getLogger(__name__)
+
+# Cacheable routes and the cache type whose TTL they use (first match wins;
+# None keeps a route out of HTTP caching)
+CACHEABLE_ROUTES: List[Tuple[re.Pattern, Optional[str]]] = [
+    (re.compile(r"^/api/genres/?$"), "genres_list"),
+    (re.compile(r"^/api/movies/statistics/overview/?$"), "statistics"),
+    (re.compile(r"^/api/movies/search/?$"), "search_results"),
+    (re.compile(r"^/api/movies/(imdb|tmdb)/[^/]+/?$"), "movie_detail"),
+    (re.compile(r"^/api/movies/(genre|tag)/[^/]+/?$"), "movies_data"),
+    (re.compile(r"^/api/movies/highly-rated/?$"), "movies_data"),
+    # Multi-MB streamed bodies: shared caches and proxies must not buffer or store them
+    (re.compile(r"^/api/movies/export/?$"), None),
+    (re.compile(r"^/api/movies/?$"), "movies_data"),
+    (re.compile(r"^/api/movies/[^/]+/?$"), "movie_detail"),
+]
+
+
+def get_cache_type(path: str) -> Optional[str]:
+    """Cache type of a cacheable path, None for everything else"""
+    for pattern, cache_type in CACHEABLE_ROUTES:
+        if pattern.match(path):
+            return cache_type
+    return None
+
+
+def compute_etag(request: Request, catalog_version: str) -> str:
+    """
+    Strong ETag for a GET request: the same catalog version and request
+    parameters always produce the same body. Gzip and identity responses
+    are different representations, so the accepted encoding is part of it.
+    """
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    gzip = "gzip" in request.headers.get("accept-encoding", "")
+    raw = f"{catalog_version}|{request.url.path}|{query}|{gzip}"
+    return f'"{hashlib.sha1(raw.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 requires)"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+async def http_cache_middleware(request: Request, call_next):
+    """Answer revalidations with 304 before any route runs, tag fresh responses"""
+    if request.method != "GET":
+        return await call_next(request)
+
+    cache_type = get_cache_type(request.url.path)
+    container = getattr(request.app.state, "container", None)
+    if cache_type is None or container is None:
+        return await call_next(request)
+    catalog_version = await container.movie_use_case.check_catalog_version()
+    if catalog_version is None:
+        return await call_next(request)
+
+    etag = compute_etag(request, catalog_version)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": PerformanceConfig.get_cache_control(cache_type),
+        "Vary": "Accept-Encoding"
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    response = await call_next(request)
+    # A create during the request would make the computed tag lie about this body
+    if response.status_code == 200 and container.movie_use_case.catalog_version == catalog_version:
+        for name, value in headers.items():
+            response.headers.setdefault(name, value)
+    return response
+
+
+def setup_http_caching(app):
+    """Setup ETag / Cache-Control handling for FastAPI app"""
+    if not PerformanceConfig.HTTP_CACHE["enabled"]:
+        return
+
+    @app.middleware("http")
+    async def http_cache_middleware_wrapper(request: Request, call_next):
+        return await http_cache_middleware(request, call_next)
@@ -108,16 +108,35 @@ def setup_performance_monitoring(app):
     
     # Add performance stats endpoint
     @app.get("/api/performance/stats", tags=["performance"])
-    async def get_performance_stats():
+    async def get_performance_stats(request: Request):
         """Get performance statistics"""
         return {
             "performance_stats": performance_monitor.get_stats(),
-            "cache_stats": await get_cache_stats()
+            "cache_stats": await get_cache_stats(request.app),
+            "single_flight_stats": get_single_flight_stats(request.app),
+            "json_fragment_stats": get_json_fragment_stats(request.app)
         }
 
-async def get_cache_stats():
-    """Get cache statistics"""
+def get_single_flight_stats(app) -> Dict[str, Any]:
+    """Get request coalescing statistics of the app's use cases"""
+    container = getattr(app.state, "container", None)
+    if container is None:
+        return {"error": "Application not started"}
+    return container.single_flight.get_stats()
+
+def get_json_fragment_stats(app) -> Dict[str, Any]:
+    """Get pre-serialized JSON fragment cache statistics"""
+    container = getattr(app.state, "container", None)
+    if container is None:
+        return {"error": "Application not started"}
+    return container.json_fragments.get_stats()
+
+async def get_cache_stats(app=None):
+    """Get cache statistics (of the app's cache when it has a container)"""
     try:
+        container = getattr(app.state, "container", None) if app is not None else None
+        if container is not None:
+            return container.cache.get_stats()
         from infrastructure.cache.cache_manager import get_cache_manager
         cache_manager = await get_cache_manager()
         return cache_manager.get_stats()
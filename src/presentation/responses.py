@@ -0,0 +1,94 @@
+"""
+Responses - Presentation Layer
+JSON response class that encodes DTOs straight to bytes, and the NDJSON /
+CSV encoders of streamed exports
+"""
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Dict, Sequence
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib encoder
+    orjson = None
+
+
+def _encode_default(value: Any) -> Any:
+    """Encode values orjson / json do not know natively"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dump_json(content: Any) -> bytes:
+    """Serialize response content to JSON bytes"""
+    if isinstance(content, bytes):
+        return content  # already serialized (e.g. JSON fragments)
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode("utf-8")
+    if orjson is not None:
+        return orjson.dumps(content, default=_encode_default)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=_encode_default
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse without the model -> dict -> stdlib json round trip.
+    Accepts a pydantic model (encoded by pydantic-core), pre-serialized
+    bytes, or plain data (encoded by orjson when installed).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+# Records per chunk handed to StreamingResponse (one ASGI send each)
+STREAM_CHUNK_RECORDS = 500
+
+
+async def ndjson_stream(
+    records: AsyncIterator[Dict[str, Any]],
+    chunk_records: int = STREAM_CHUNK_RECORDS
+) -> AsyncIterator[bytes]:
+    """Encode records as newline-delimited JSON, one object per line"""
+    lines = []
+    async for record in records:
+        lines.append(dump_json(record))
+        if len(lines) >= chunk_records:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+async def csv_stream(
+    records: AsyncIterator[Dict[str, Any]],
+    fields: Sequence[str],
+    chunk_records: int = STREAM_CHUNK_RECORDS
+) -> AsyncIterator[bytes]:
+    """Encode records as CSV with a header row; list values are pipe-joined like data/movies.csv"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    count = 0
+    async for record in records:
+        writer.writerow(["|".join(value) if isinstance(value, list) else value
+                         for value in (record[field] for field in fields)])
+        count += 1
+        if count % chunk_records == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
@@ -7,7 +7,6 @@ from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from application.use_cases.auth_use_cases import AuthUseCase
-from application.services.auth_service import AuthService
 from application.dtos.auth_schemas import (
     UserCreateDto,
     UserLoginDto,
@@ -20,7 +19,7 @@ from application.dtos.auth_schemas import (
     GrantSuperuserDto,
     TakePrivilegesDto
 )
-from infrastructure.repositories.sqlite_user_repository import SqliteUserRepository
+from presentation.dependencies import get_auth_use_case
 
 # Create router instance
 router = APIRouter(prefix="/api/auth", tags=["authentication"])
@@ -28,22 +27,6 @@ router = APIRouter(prefix="/api/auth", tags=["authentication"])
 # Security scheme - match the one defined in main.py
 security = HTTPBearer(scheme_name="bearerAuth")
 
-# Dependency injection for repository, service and use case
-def get_user_repository() -> SqliteUserRepository:
-    """Dependency to get user repository instance"""
-    return SqliteUserRepository()
-
-def get_auth_service() -> AuthService:
-    """Dependency to get authentication service instance"""
-    return AuthService()
-
-def get_auth_use_case(
-    repository: SqliteUserRepository = Depends(get_user_repository),
-    auth_service: AuthService = Depends(get_auth_service)
-) -> AuthUseCase:
-    """Dependency to get authentication use case instance"""
-    return AuthUseCase(repository, auth_service)
-
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     auth_use_case: AuthUseCase = Depends(get_auth_use_case)
@@ -5,9 +5,10 @@ FastAPI routes for movie operations with performance optimizations
 import time
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Depends, Path, Query as QueryParam
-from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
 from domain.entities.movie import Movie
-from application.use_cases.movie_use_cases import MovieUseCase
+from application.use_cases.movie_use_cases import MovieUseCase, BatchSizeError
+from application.mappers.movie_mapper import MovieMapper, EXPORT_FIELDS
 from application.dtos.movie_schemas import (
     PaginatedResponseDto,
     MovieDetailResponseDto,
@@ -16,24 +17,16 @@ from application.dtos.movie_schemas import (
     ErrorResponseDto,
     SuccessResponseDto,
     MovieDto,
-    MovieCreateDto
+    MovieCreateDto,
+    MovieBatchRequestDto,
+    MovieBatchResponseDto
 )
-from infrastructure.repositories.sqlite_movie_repository import SqliteMovieRepository
+from presentation.dependencies import get_movie_use_case
+from presentation.responses import FastJSONResponse, ndjson_stream, csv_stream
 
 # Create router instance
 router = APIRouter(prefix="/api/movies", tags=["movies"])
 
-# Dependency injection for repository and use case
-def get_movie_repository() -> SqliteMovieRepository:
-    """Dependency to get SQLite movie repository instance"""
-    return SqliteMovieRepository()
-
-def get_movie_use_case(
-    repository: SqliteMovieRepository = Depends(get_movie_repository)
-) -> MovieUseCase:
-    """Dependency to get movie use case instance"""
-    return MovieUseCase(repository)
-
 
 @router.get(
     "/",
@@ -44,23 +37,76 @@ def get_movie_use_case(
 async def get_movies(
     page: int = QueryParam(1, ge=1, description="Page number"),
     limit: int = QueryParam(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = QueryParam(None, max_length=200, description="Opaque cursor from pagination.next_cursor; overrides page"),
+    fields: Optional[str] = QueryParam(None, max_length=500, description="Comma-separated movie fields to return, e.g. title,average_rating (movieId is always included)"),
     use_case: MovieUseCase = Depends(get_movie_use_case)
 ):
     """Get all movies with pagination and caching"""
     try:
         start_time = time.time()
-        result = await use_case.get_movies(page=page, limit=limit)
+        selected = MovieMapper.parse_summary_fields(fields)
+        result = await use_case.get_movies(page=page, limit=limit, cursor=cursor, fields=selected)
         end_time = time.time()
         
         # Add performance header
-        response = JSONResponse(content=result.dict())
+        response = FastJSONResponse(content=use_case.to_json(result, selected))
         response.headers["X-Processing-Time"] = f"{end_time - start_time:.3f}s"
         
         return response
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.get(
+    "/export",
+    summary="Export movies",
+    description="Stream the whole catalog, or the movies matching the filters, as NDJSON or CSV in movieId order. "
+                "Resume an interrupted export with after=<last movieId received>."
+)
+async def export_movies(
+    format: str = QueryParam("ndjson", pattern="^(ndjson|csv)$", description="ndjson (one JSON object per line) or csv"),
+    title: Optional[str] = QueryParam(None, description="Search by title"),
+    genre: Optional[str] = QueryParam(None, description="Filter by genre"),
+    year: Optional[int] = QueryParam(None, description="Filter by exact release year"),
+    year_from: Optional[int] = QueryParam(None, description="Filter by release year, inclusive lower bound"),
+    year_to: Optional[int] = QueryParam(None, description="Filter by release year, inclusive upper bound"),
+    decade: Optional[int] = QueryParam(None, description="Filter by decade, e.g. 1990 for 1990-1999"),
+    min_rating: Optional[float] = QueryParam(None, ge=0, le=10, description="Minimum rating"),
+    max_rating: Optional[float] = QueryParam(None, ge=0, le=10, description="Maximum rating"),
+    min_positive: Optional[float] = QueryParam(None, ge=0, le=100, description="Minimum share of 3-5 star ratings, in percent"),
+    after: Optional[int] = QueryParam(None, ge=0, description="Only movies with a larger movieId (resume point)"),
+    use_case: MovieUseCase = Depends(get_movie_use_case)
+):
+    """Stream movies as NDJSON or CSV"""
+    try:
+        search_request = SearchRequestDto(
+            title=title,
+            genre=genre,
+            year=year,
+            year_from=year_from,
+            year_to=year_to,
+            decade=decade,
+            min_rating=min_rating,
+            max_rating=max_rating,
+            min_positive=min_positive
+        )
+        records = use_case.export_movies(search_request, after_id=after)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Kept out of shared caches: the body is the whole (filtered) catalog
+    headers = {"Cache-Control": "no-store"}
+    if format == "csv":
+        return StreamingResponse(
+            csv_stream(records, EXPORT_FIELDS),
+            media_type="text/csv; charset=utf-8",
+            headers={**headers, "Content-Disposition": 'attachment; filename="movies.csv"'}
+        )
+    return StreamingResponse(ndjson_stream(records), media_type="application/x-ndjson", headers=headers)
+
+
 @router.get(
     "/{movie_id}",
     response_model=MovieDetailResponseDto,
@@ -84,7 +130,7 @@ async def get_movie_by_id(
             )
         
         # Add performance header
-        response = JSONResponse(content=result.dict())
+        response = FastJSONResponse(content=use_case.to_json(result))
         response.headers["X-Processing-Time"] = f"{end_time - start_time:.3f}s"
         
         return response
@@ -106,6 +152,31 @@ async def create_movie(
     """Create a new movie"""
     return await use_case.create_movie(movie)
 
+@router.post(
+    "/batch",
+    response_model=MovieBatchResponseDto,
+    summary="Get many movies at once",
+    description="Look up to 100 movies by movieId, IMDB ID and/or TMDB ID in one request; misses are listed under `missing`"
+)
+async def get_movies_batch(
+    batch_request: MovieBatchRequestDto,
+    use_case: MovieUseCase = Depends(get_movie_use_case)
+):
+    """Get many movies with one query per ID kind"""
+    try:
+        start_time = time.time()
+        result = await use_case.get_movies_batch(batch_request)
+        end_time = time.time()
+
+        response = FastJSONResponse(content=use_case.to_json(result))
+        response.headers["X-Processing-Time"] = f"{end_time - start_time:.3f}s"
+
+        return response
+    except BatchSizeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
 @router.get(
     "/search/",
     response_model=PaginatedResponseDto,
@@ -115,34 +186,46 @@ async def create_movie(
 async def search_movies(
     title: Optional[str] = QueryParam(None, description="Search by title"),
     genre: Optional[str] = QueryParam(None, description="Filter by genre"),
-    year: Optional[int] = QueryParam(None, description="Filter by year"),
+    year: Optional[int] = QueryParam(None, description="Filter by exact release year"),
+    year_from: Optional[int] = QueryParam(None, description="Filter by release year, inclusive lower bound"),
+    year_to: Optional[int] = QueryParam(None, description="Filter by release year, inclusive upper bound"),
+    decade: Optional[int] = QueryParam(None, description="Filter by decade, e.g. 1990 for 1990-1999"),
     min_rating: Optional[float] = QueryParam(None, ge=0, le=10, description="Minimum rating"),
     max_rating: Optional[float] = QueryParam(None, ge=0, le=10, description="Maximum rating"),
+    min_positive: Optional[float] = QueryParam(None, ge=0, le=100, description="Minimum share of 3-5 star ratings, in percent"),
     page: int = QueryParam(1, ge=1, description="Page number"),
     limit: int = QueryParam(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = QueryParam(None, max_length=200, description="Opaque cursor from pagination.next_cursor; overrides page"),
+    fields: Optional[str] = QueryParam(None, max_length=500, description="Comma-separated movie fields to return, e.g. title,average_rating (movieId is always included)"),
     use_case: MovieUseCase = Depends(get_movie_use_case)
 ):
     """Search movies with criteria using optimized search"""
     try:
         start_time = time.time()
+        selected = MovieMapper.parse_summary_fields(fields)
         
         search_request = SearchRequestDto(
             title=title,
             genre=genre,
             year=year,
+            year_from=year_from,
+            year_to=year_to,
+            decade=decade,
             min_rating=min_rating,
             max_rating=max_rating,
+            min_positive=min_positive,
             page=page,
-            limit=limit
+            limit=limit,
+            cursor=cursor
         )
-        result = await use_case.search_movies(search_request)
+        result = await use_case.search_movies(search_request, fields=selected)
         
         end_time = time.time()
         
         # Add performance header
-        response = JSONResponse(content=result.dict())
+        response = FastJSONResponse(content=use_case.to_json(result, selected))
         response.headers["X-Processing-Time"] = f"{end_time - start_time:.3f}s"
-        response.headers["X-Search-Criteria"] = f"filters:{len([f for f in [title, genre, year, min_rating, max_rating] if f is not None])}"
+        response.headers["X-Search-Criteria"] = f"filters:{len([f for f in [title, genre, year, year_from, year_to, decade, min_rating, max_rating, min_positive] if f is not None])}"
         
         return response
     except ValueError as e:
@@ -161,19 +244,24 @@ async def get_movies_by_genre(
     genre_name: str = Path(..., description="Genre name"),
     page: int = QueryParam(1, ge=1, description="Page number"),
     limit: int = QueryParam(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = QueryParam(None, max_length=200, description="Opaque cursor from pagination.next_cursor; overrides page"),
+    fields: Optional[str] = QueryParam(None, max_length=500, description="Comma-separated movie fields to return, e.g. title,average_rating (movieId is always included)"),
     use_case: MovieUseCase = Depends(get_movie_use_case)
 ):
     """Get movies by genre with caching"""
     try:
         start_time = time.time()
-        result = await use_case.get_movies_by_genre(genre_name, page=page, limit=limit)
+        selected = MovieMapper.parse_summary_fields(fields)
+        result = await use_case.get_movies_by_genre(genre_name, page=page, limit=limit, cursor=cursor, fields=selected)
         end_time = time.time()
         
         # Add performance header
-        response = JSONResponse(content=result.dict())
+        response = FastJSONResponse(content=use_case.to_json(result, selected))
         response.headers["X-Processing-Time"] = f"{end_time - start_time:.3f}s"
         
         return response
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
@@ -187,19 +275,24 @@ async def get_movies_by_genre(
 async def get_highly_rated_movies(
     page: int = QueryParam(1, ge=1, description="Page number"),
     limit: int = QueryParam(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = QueryParam(None, max_length=200, description="Opaque cursor from pagination.next_cursor; overrides page"),
+    fields: Optional[str] = QueryParam(None, max_length=500, description="Comma-separated movie fields to return, e.g. title,average_rating (movieId is always included)"),
     use_case: MovieUseCase = Depends(get_movie_use_case)
 ):
     """Get highly rated movies with caching"""
     try:
         start_time = time.time()
-        result = await use_case.get_highly_rated_movies(page=page, limit=limit)
+        selected = MovieMapper.parse_summary_fields(fields)
+        result = await use_case.get_highly_rated_movies(page=page, limit=limit, cursor=cursor, fields=selected)
         end_time = time.time()
         
         # Add performance header
-        response = JSONResponse(content=result.dict())
+        response = FastJSONResponse(content=use_case.to_json(result, selected))
         response.headers["X-Processing-Time"] = f"{end_time - start_time:.3f}s"
         
         return response
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
@@ -222,7 +315,7 @@ async def get_highly_rated_movies(
 #         end_time = time.time()
         
 #         # Add performance header
-#         response = JSONResponse(content=result.dict())
+#         response = FastJSONResponse(content=use_case.to_json(result))
 #         response.headers["X-Processing-Time"] = f"{end_time - start_time:.3f}s"
         
 #         return response
@@ -248,7 +341,7 @@ async def get_highly_rated_movies(
 #         end_time = time.time()
         
 #         # Add performance header
-#         response = JSONResponse(content=result.dict())
+#         response = FastJSONResponse(content=use_case.to_json(result))
 #         response.headers["X-Processing-Time"] = f"{end_time - start_time:.3f}s"
         
 #         return response
@@ -292,12 +385,14 @@ async def get_movie_statistics(
     """Get movie statistics with caching"""
     try:
         start_time = time.time()
-        result = await use_case.get_movie_statistics()
+        result, age = await use_case.get_movie_statistics_with_age()
         end_time = time.time()
         
-        # Add performance header
-        response = JSONResponse(content=result)
+        # Add performance and staleness headers
+        response = FastJSONResponse(content=result)
         response.headers["X-Processing-Time"] = f"{end_time - start_time:.3f}s"
+        response.headers["Age"] = str(int(age))
+        response.headers["X-Cache-Stale"] = "true" if age >= use_case.statistics_soft_ttl else "false"
         
         return response
     except Exception as e:
@@ -308,25 +403,30 @@ async def get_movie_statistics(
     "/tag/{tag_name}",
     response_model=PaginatedResponseDto,
     summary="Get movies by tag",
-    description="Retrieve movies filtered by specific tag with caching"
+    description="Retrieve movies with an exact (case-insensitive) tag, most frequently tagged first"
 )
 async def get_movies_by_tag(
     tag_name: str = Path(..., description="Tag name"),
     page: int = QueryParam(1, ge=1, description="Page number"),
     limit: int = QueryParam(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = QueryParam(None, max_length=200, description="Opaque cursor from pagination.next_cursor; overrides page"),
+    fields: Optional[str] = QueryParam(None, max_length=500, description="Comma-separated movie fields to return, e.g. title,average_rating (movieId is always included)"),
     use_case: MovieUseCase = Depends(get_movie_use_case)
 ):
     """Get movies by tag with caching"""
     try:
         start_time = time.time()
-        result = await use_case.get_movies_by_tag(tag_name, page=page, limit=limit)
+        selected = MovieMapper.parse_summary_fields(fields)
+        result = await use_case.get_movies_by_tag(tag_name, page=page, limit=limit, cursor=cursor, fields=selected)
         end_time = time.time()
         
         # Add performance header
-        response = JSONResponse(content=result.dict())
+        response = FastJSONResponse(content=use_case.to_json(result, selected))
         response.headers["X-Processing-Time"] = f"{end_time - start_time:.3f}s"
         
         return response
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
@@ -354,7 +454,7 @@ async def get_movie_by_imdb_id(
             )
         
         # Add performance header
-        response = JSONResponse(content=result.dict())
+        response = FastJSONResponse(content=use_case.to_json(result))
         response.headers["X-Processing-Time"] = f"{end_time - start_time:.3f}s"
         
         return response
@@ -387,7 +487,7 @@ async def get_movie_by_tmdb_id(
             )
         
         # Add performance header
-        response = JSONResponse(content=result.dict())
+        response = FastJSONResponse(content=use_case.to_json(result))
         response.headers["X-Processing-Time"] = f"{end_time - start_time:.3f}s"
         
         return response
@@ -0,0 +1,7 @@
+"""
+Test configuration: import the application packages from src/
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
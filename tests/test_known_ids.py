@@ -0,0 +1,62 @@
+"""
+Known-ID Filter Tests
+Bloom filters of the SQLite repository over IDs stored as INTEGER, REAL or TEXT
+"""
+import asyncio
+import time
+
+from infrastructure.repositories.sqlite_movie_repository import SqliteMovieRepository
+
+
+ROWS = [
+    (1, 114709, 862.0),
+    (2, 113497, "8844.0"),
+    (3, "tt0113228", 15602),
+    (4, None, ""),
+]
+
+
+def make_repository() -> SqliteMovieRepository:
+    """Repository whose filters come from ROWS instead of a database scan"""
+    repository = SqliteMovieRepository()
+    repository._known_ids = SqliteMovieRepository._known_ids_from_rows(ROWS)
+    repository._known_ids_built_at = time.monotonic()
+    return repository
+
+
+def test_filters_build_from_integer_and_float_ids():
+    known_ids = SqliteMovieRepository._known_ids_from_rows(ROWS)
+
+    assert "1" in known_ids["id"]
+    assert "114709" in known_ids["imdb"]
+    assert "tt0113228" in known_ids["imdb"]
+    assert "862" in known_ids["tmdb"]
+    assert "8844" in known_ids["tmdb"]
+    assert "15602" in known_ids["tmdb"]
+
+
+def test_lookups_match_any_numeric_form():
+    async def scenario():
+        repository = make_repository()
+        for kind, value in [
+            ("imdb", "114709"), ("imdb", 114709), ("imdb", "114709.0"),
+            ("tmdb", "862"), ("tmdb", 862.0), ("tmdb", "8844.0"), ("tmdb", 15602),
+            ("id", 3), ("id", "3")
+        ]:
+            assert await repository._may_exist(kind, value), (kind, value)
+
+    asyncio.run(scenario())
+
+
+def test_missing_ids_are_remembered_in_any_numeric_form():
+    async def scenario():
+        repository = make_repository()
+        repository._remember_missing("tmdb", 862.0)
+        assert not await repository._may_exist("tmdb", "862")
+
+        # A created movie is findable again
+        repository._add_known_ids(type("Model", (), {"movieId": 5, "imdb_id": 9999, "tmdb_id": 862})())
+        assert await repository._may_exist("tmdb", "862")
+        assert await repository._may_exist("imdb", "9999")
+
+    asyncio.run(scenario())
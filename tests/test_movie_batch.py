@@ -0,0 +1,92 @@
+"""
+Movie Batch Tests
+POST /api/movies/batch use case against the shipped SQLite data
+(data/movie_streaming.db, trimmed, with the catalog indexes built)
+"""
+import asyncio
+import importlib.util
+import os
+import shutil
+import sqlite3
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from application.dtos.movie_schemas import MovieBatchRequestDto
+from application.use_cases.movie_use_cases import MovieUseCase, BatchSizeError
+from infrastructure.database.database import database
+from infrastructure.repositories.sqlite_movie_repository import SqliteMovieRepository
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def catalog_dir(tmp_path_factory):
+    """Directory holding movielens.db: the first 200 shipped movies, indexed"""
+    directory = tmp_path_factory.mktemp("catalog")
+    db_path = directory / "movielens.db"
+    shutil.copy(os.path.join(ROOT, "data", "movie_streaming.db"), db_path)
+
+    spec = importlib.util.spec_from_file_location(
+        "catalog_indexes", os.path.join(ROOT, "database", "catalog_indexes.py")
+    )
+    catalog_indexes = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(catalog_indexes)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("DELETE FROM movies WHERE movieId > 200")
+        conn.commit()
+        catalog_indexes.build_catalog_indexes(conn)
+    finally:
+        conn.close()
+    return directory
+
+
+@pytest.fixture
+def engine(catalog_dir, monkeypatch):
+    """Point get_db() at the test catalog"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{catalog_dir / 'movielens.db'}")
+    monkeypatch.setattr(
+        database, "session_factory",
+        async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    )
+    return engine
+
+
+@pytest.fixture
+def use_case(engine):
+    return MovieUseCase(SqliteMovieRepository())
+
+
+def run(engine, coroutine):
+    """Run one scenario, releasing the pooled connections of its event loop"""
+    async def scenario():
+        try:
+            return await coroutine
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(scenario())
+
+
+def test_batch_finds_movies_by_every_id_kind(engine, use_case):
+    result = run(engine, use_case.get_movies_batch(MovieBatchRequestDto(
+        movie_ids=["1", "999999"], imdb_ids=["114709"], tmdb_ids=["862", "862.0"]
+    )))
+
+    assert [detail.movie.movieId for detail in result.movies] == ["1", "1", "1", "1"]
+    toy_story = result.movies[0].movie
+    assert toy_story.imdb_id == "114709"
+    assert toy_story.tmdb_id == "862"
+    assert toy_story.ratings_count == 215
+    assert result.movies[0].related_movies
+    assert result.missing.movie_ids == ["999999"]
+
+    # Serializes like the endpoint does
+    assert b'"imdb_id":"114709"' in use_case.to_json(result)
+
+
+def test_batch_size_is_checked(engine, use_case):
+    with pytest.raises(BatchSizeError):
+        run(engine, use_case.get_movies_batch(MovieBatchRequestDto()))
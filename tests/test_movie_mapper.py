@@ -0,0 +1,36 @@
+"""
+Movie Mapper Tests
+Export records keep MovieDto's types whatever the backend stored
+"""
+from application.mappers.movie_mapper import MovieMapper
+from domain.entities.movie import Movie
+
+
+def make_movie(**stored) -> Movie:
+    fields = dict(
+        movieId="1", title="Toy Story (1995)", genres=["Animation"], imdb_id="114709", tmdb_id="862",
+        ratings_count=215, zero_to_one_ratings_count=1, one_to_two_ratings_count=1,
+        two_to_three_ratings_count=14, three_to_four_ratings_count=52, four_to_five_ratings_count=147,
+        average_rating=3.92, tags=["pixar"], earliest_rating="", latest_rating="",
+        earliest_tag="", latest_tag="", release_year=1995
+    )
+    fields.update(stored)
+    return Movie.from_trusted(**fields)
+
+
+def test_export_record_types_do_not_depend_on_storage():
+    expected = MovieMapper.to_export_record(make_movie())
+    # SQLite (INTEGER imdb_id, "862.0" tmdb_id, REAL counts) and pandas-read CSV forms
+    for stored in (
+        dict(imdb_id=114709, tmdb_id="862.0", ratings_count=215.0, four_to_five_ratings_count=147.0),
+        dict(imdb_id="114709.0", tmdb_id=862.0),
+    ):
+        assert MovieMapper.to_export_record(make_movie(**stored)) == expected
+
+    assert isinstance(expected["ratings_count"], int)
+    assert expected["imdb_id"] == "114709" and expected["tmdb_id"] == "862"
+
+
+def test_missing_external_ids_export_as_empty_strings():
+    record = MovieMapper.to_export_record(make_movie(imdb_id=None, tmdb_id="nan"))
+    assert record["imdb_id"] == "" and record["tmdb_id"] == ""
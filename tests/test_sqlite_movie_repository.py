@@ -0,0 +1,47 @@
+"""
+SQLite Movie Repository Tests
+Rows with the storage types of the shipped database (INTEGER imdb_id,
+"862.0" tmdb_id, REAL histogram counts)
+"""
+from application.mappers.movie_mapper import MovieMapper
+from infrastructure.repositories.sqlite_movie_repository import (
+    MOVIE_COLUMNS,
+    SqliteMovieRepository,
+    normalize_id,
+    stored_id_forms
+)
+
+
+TOY_STORY_ROW = (
+    1, "Toy Story (1995)", "Adventure|Animation", 114709, "862.0", 215.0,
+    1.0, 1.0, 14.0, 52.0, 147.0,
+    3.92, "pixar| fun||", "829322340", "1537098412", "1139045764", "1537098412",
+    1995, 91.16
+)
+
+
+def test_normalize_id():
+    assert normalize_id(114709) == "114709"
+    assert normalize_id(862.0) == "862"
+    assert normalize_id("862.0") == "862"
+    assert normalize_id("tt0114709") == "tt0114709"
+    assert normalize_id(None) == ""
+    assert stored_id_forms("862") == ["862", "862.0"]
+    assert stored_id_forms("tt0114709") == ["tt0114709"]
+
+
+def test_row_maps_to_entity_types():
+    assert len(TOY_STORY_ROW) == len(MOVIE_COLUMNS)
+    movie = SqliteMovieRepository._movie_from_row(TOY_STORY_ROW)
+
+    assert movie.movieId == "1"
+    assert movie.imdb_id == "114709"
+    assert movie.tmdb_id == "862"
+    assert movie.ratings_count == 215 and isinstance(movie.ratings_count, int)
+    assert isinstance(movie.four_to_five_ratings_count, int)
+    assert movie.tags == ["pixar", "fun"]
+
+    # The response DTO validates what from_trusted() skipped
+    dto = MovieMapper.to_dto(movie)
+    assert dto.imdb_id == "114709"
+    assert dto.tmdb_id == "862"
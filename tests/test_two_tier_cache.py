@@ -0,0 +1,104 @@
+"""
+Two-Tier Cache Tests
+L1 + L2 behaviour against an in-memory Redis (fakeredis)
+"""
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from infrastructure.cache.cache_manager import CacheManager
+from infrastructure.cache.two_tier_cache import TwoTierCache
+
+
+def make_cache(server, **kwargs) -> TwoTierCache:
+    """An API instance: its own L1, the shared fake Redis as L2"""
+    kwargs.setdefault("version_check_interval", 0)
+    return TwoTierCache(
+        fakeredis.aioredis.FakeRedis(server=server),
+        l1=CacheManager(max_size=100),
+        key_prefix="test:cache",
+        **kwargs
+    )
+
+
+def test_l2_hit_fills_l1():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        first, second = make_cache(server), make_cache(server)
+
+        await first.set("movie_detail:1", {"title": "Toy Story"})
+        assert await second.get("movie_detail:1") == {"title": "Toy Story"}
+        assert second.get_stats()["l2"]["hits"] == 1
+
+        # Later reads come from the second instance's L1, not Redis
+        await fakeredis.aioredis.FakeRedis(server=server).flushall()
+        assert await second.get("movie_detail:1") == {"title": "Toy Story"}
+        assert second.get_stats()["l2"]["hits"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_clear_invalidates_other_instances_l1():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        first, second = make_cache(server), make_cache(server)
+
+        await first.set("movies_data:all:1", [1, 2, 3])
+        assert await second.get("movies_data:all:1") == [1, 2, 3]
+
+        await first.clear()
+        assert await second.get("movies_data:all:1") is None
+        assert second.l1.get_stats()["size"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_clear_namespace_keeps_other_namespaces():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        first, second = make_cache(server), make_cache(server)
+
+        await first.set("genres_list:all", ["Drama"])
+        await first.set("statistics:overview", {"total": 1})
+        await first.clear("genres_list")
+
+        assert await second.get("genres_list:all") is None
+        assert await second.get("statistics:overview") == {"total": 1}
+
+    asyncio.run(scenario())
+
+
+def test_falls_back_to_l1_when_redis_is_down():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        cache = make_cache(server, retry_interval=60)
+        server.connected = False
+
+        await cache.set("movie_detail:1", {"title": "Toy Story"})
+        assert await cache.get("movie_detail:1") == {"title": "Toy Story"}
+        assert await cache.get("movie_detail:2") is None
+
+        stats = cache.get_stats()["l2"]
+        assert stats["available"] is False
+        assert stats["errors"] >= 1
+
+        # Invalidation still reaches this instance's own L1
+        await cache.clear()
+        assert await cache.get("movie_detail:1") is None
+
+    asyncio.run(scenario())
+
+
+def test_schema_version_separates_l2_entries():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        old = make_cache(server, schema_version="aaaa")
+        new = make_cache(server, schema_version="bbbb")
+
+        await old.set("movie_detail:1", {"title": "Toy Story"})
+        assert await new.get("movie_detail:1") is None
+        assert await make_cache(server, schema_version="aaaa").get("movie_detail:1") == {"title": "Toy Story"}
+
+    asyncio.run(scenario())